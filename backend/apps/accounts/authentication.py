@@ -0,0 +1,77 @@
+# backend/apps/accounts/authentication.py
+"""
+JWT authentication that resolves the token's user from the default Django
+cache (in-process unless CACHES says otherwise) instead of loading the User
+row on every request.
+
+A signed, unexpired access token already proves who the caller is; the row
+is only needed for is_active. The cache holds (id, is_active, credentials
+fingerprint) for AUTH_USER_CACHE_TTL seconds, never the password hash or the
+profile, and request.user is a User with only id and is_active loaded (other
+fields load on access; views that show the profile read the row).
+
+Entries are evicted whenever the user is saved or deleted (activation,
+deactivation, password reset, ...) in this process. A token whose
+fingerprint claim differs from the cached one reloads the row, so the first
+token issued after a reset elsewhere refreshes a stale entry; tokens issued
+before the reset are then refused. Otherwise other worker processes notice
+changes within the TTL.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.crypto import constant_time_compare, salted_hmac
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from core import metrics
+
+CACHE_PREFIX = "auth-user"
+CREDENTIALS_CLAIM = "pwd"
+
+
+def user_cache_key(user_id) -> str:
+    return f"{CACHE_PREFIX}:{user_id}"
+
+
+def credentials_fingerprint(user) -> str:
+    return salted_hmac("sonreb.accounts.tokens", user.password, algorithm="sha256").hexdigest()[:16]
+
+
+def cached_user(user_id, is_active):
+    user_model = get_user_model()
+    return user_model.from_db(
+        user_model.objects.db,
+        [user_model._meta.pk.attname, "is_active"],
+        [user_id, is_active],
+    )
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        key = user_cache_key(validated_token.get(api_settings.USER_ID_CLAIM))
+        claim = validated_token.get(CREDENTIALS_CLAIM)
+        entry = cache.get(key)
+        if entry is not None and claim is not None and not constant_time_compare(claim, entry[2]):
+            entry = None  # stale entry, or a token from before a password change
+        metrics.CACHE_REQUESTS.inc(cache=CACHE_PREFIX, result="miss" if entry is None else "hit")
+        if entry is None:
+            # Raises for unknown and inactive users, so those are never cached.
+            user = super().get_user(validated_token)
+            entry = (user.pk, user.is_active, credentials_fingerprint(user))
+            cache.set(key, entry, getattr(settings, "AUTH_USER_CACHE_TTL", 60))
+        if claim is not None and not constant_time_compare(claim, entry[2]):
+            raise AuthenticationFailed("Password has changed since this token was issued.", code="password_changed")
+        return cached_user(entry[0], entry[1])
+
+
+def _user_changed(sender, instance, **kwargs):
+    cache.delete(user_cache_key(getattr(instance, api_settings.USER_ID_FIELD)))
+
+
+def connect():
+    user_model = get_user_model()
+    post_save.connect(_user_changed, sender=user_model, dispatch_uid="auth-user-cache-save")
+    post_delete.connect(_user_changed, sender=user_model, dispatch_uid="auth-user-cache-delete")
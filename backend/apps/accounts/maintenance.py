@@ -0,0 +1,104 @@
+# backend/apps/accounts/maintenance.py
+"""
+Purges of account rows nobody will read again:
+
+* email verification codes that were used or have expired;
+* revoked refresh tokens past their expiry (an expired token is refused on
+  its own).
+
+Rows are deleted in batches of at most ``batch_size`` per DELETE, so a
+large backlog never holds long locks. Run them with
+``manage.py purge_verification_codes`` / ``purge_revoked_tokens``, or let
+the scheduler started by core.wsgi / core.asgi run both every
+ACCOUNT_PURGE_INTERVAL seconds in each server process.
+"""
+import logging
+import os
+import random
+import threading
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import EmailVerification, RevokedRefreshToken
+
+logger = logging.getLogger("sonreb.maintenance")
+
+PURGE_BATCH_SIZE = 1000
+
+
+def delete_in_batches(queryset, batch_size=PURGE_BATCH_SIZE) -> int:
+    deleted = 0
+    while True:
+        batch = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            return deleted
+        deleted += queryset.model.objects.filter(pk__in=batch).delete()[0]
+
+
+def purge_email_verifications(batch_size=PURGE_BATCH_SIZE) -> int:
+    stale = EmailVerification.objects.filter(Q(used=True) | Q(expires_at__lt=timezone.now()))
+    return delete_in_batches(stale, batch_size)
+
+
+def purge_revoked_tokens(batch_size=PURGE_BATCH_SIZE) -> int:
+    expired = RevokedRefreshToken.objects.filter(expires_at__lt=timezone.now())
+    return delete_in_batches(expired, batch_size)
+
+
+def run_purges(batch_size=PURGE_BATCH_SIZE) -> dict:
+    return {
+        "verification_codes": purge_email_verifications(batch_size),
+        "revoked_tokens": purge_revoked_tokens(batch_size),
+    }
+
+
+class PurgeScheduler(threading.Thread):
+    def __init__(self, interval: float, batch_size: int):
+        super().__init__(name="sonreb-account-purge", daemon=True)
+        self.interval = interval
+        self.batch_size = batch_size
+        self.pid = os.getpid()
+        self._stopped = threading.Event()
+
+    def run(self):
+        # Workers started together spread their runs over the interval.
+        delay = random.uniform(0, self.interval)
+        while not self._stopped.wait(delay):
+            try:
+                self.run_once()
+            finally:
+                # Don't hold this thread's connection between runs.
+                connection.close()
+            delay = self.interval
+
+    def run_once(self):
+        try:
+            counts = run_purges(self.batch_size)
+        except Exception:
+            logger.exception("Account purge failed.")
+        else:
+            logger.info("Purged %(verification_codes)d verification codes, %(revoked_tokens)d revoked tokens.", counts)
+
+    def stop(self):
+        self._stopped.set()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def start_scheduler():
+    """Start this process's purge thread, unless ACCOUNT_PURGE_INTERVAL is 0."""
+    global _scheduler
+    interval = getattr(settings, "ACCOUNT_PURGE_INTERVAL", 3600)
+    if interval <= 0:
+        return None
+    with _scheduler_lock:
+        # Threads don't survive a fork (gunicorn --preload): start one per process.
+        if _scheduler is None or _scheduler.pid != os.getpid():
+            _scheduler = PurgeScheduler(interval, getattr(settings, "ACCOUNT_PURGE_BATCH_SIZE", PURGE_BATCH_SIZE))
+            _scheduler.start()
+    return _scheduler
@@ -0,0 +1,25 @@
+# backend/apps/accounts/management/commands/purge_revoked_tokens.py
+"""
+Delete revoked refresh tokens that have expired; an expired token is refused
+on its own, so its revocation record is no longer needed. Server processes
+also do this every ACCOUNT_PURGE_INTERVAL (apps.accounts.maintenance).
+
+    python manage.py purge_revoked_tokens
+    python manage.py purge_revoked_tokens --batch-size 5000
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.maintenance import PURGE_BATCH_SIZE, purge_revoked_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired revoked refresh tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE, help="rows per DELETE")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        deleted = purge_revoked_tokens(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired revoked tokens."))
@@ -0,0 +1,24 @@
+# backend/apps/accounts/management/commands/purge_verification_codes.py
+"""
+Delete email verification codes that were used or have expired. Server
+processes also do this every ACCOUNT_PURGE_INTERVAL (apps.accounts.maintenance).
+
+    python manage.py purge_verification_codes
+    python manage.py purge_verification_codes --batch-size 5000
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.accounts.maintenance import PURGE_BATCH_SIZE, purge_email_verifications
+
+
+class Command(BaseCommand):
+    help = "Delete used and expired email verification codes in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE, help="rows per DELETE")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        deleted = purge_email_verifications(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} used or expired verification codes."))
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_revokedrefreshtoken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailverification',
+            index=models.Index(fields=['user', 'code', 'used'], name='emailverif_lookup_idx'),
+        ),
+    ]
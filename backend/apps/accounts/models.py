@@ -9,5 +9,25 @@ class EmailVerification(models.Model):
     used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # ConfirmVerificationView: filter(user=..., code=..., used=False).
+            models.Index(fields=["user", "code", "used"], name="emailverif_lookup_idx"),
+        ]
+
     def __str__(self):
         return f"Verification for {self.user.email} ({'used' if self.used else 'active'})"
+
+
+class RevokedRefreshToken(models.Model):
+    """
+    A refresh token that was rotated or logged out (apps.accounts.tokens).
+    Only its jti is kept, until the token would have expired anyway; see
+    apps.accounts.maintenance.
+    """
+
+    jti = models.UUIDField(primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Revoked refresh token {self.jti.hex}"
@@ -0,0 +1,23 @@
+# backend/apps/accounts/throttles.py
+"""Throttles for the unauthenticated account endpoints; rates in settings.THROTTLE_RATES."""
+from core.throttling import BucketThrottle
+
+
+class LoginThrottle(BucketThrottle):
+    scope = "login"
+    identity_field = "email"
+
+
+class SendVerificationThrottle(BucketThrottle):
+    scope = "verify-send"
+    identity_field = "email"
+
+
+class ConfirmVerificationThrottle(BucketThrottle):
+    scope = "verify-confirm"
+    identity_field = "uid"
+
+
+class ForgotPasswordThrottle(BucketThrottle):
+    scope = "forgot"
+    identity_field = "email"
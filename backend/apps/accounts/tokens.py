@@ -0,0 +1,81 @@
+# backend/apps/accounts/tokens.py
+"""
+Access/refresh token pairs with refresh-token rotation.
+
+Login and email verification issue a short-lived access token and a refresh
+token. POST /api/auth/refresh/ trades a refresh token for a new pair; the old
+one is revoked by inserting its jti into RevokedRefreshToken, so renewing a
+session costs a signature check and one INSERT instead of a password hash.
+The INSERT is also the reuse check: a jti that is already there means the
+token was used before (or logged out) and the refresh is refused.
+
+Every pair also carries a fingerprint of the user's password hash. Changing
+the password (e.g. a reset) changes the fingerprint, so refresh tokens issued
+before it are refused and every other session has to sign in again. The user
+is read from the database, not the auth cache, so a reset applies at once in
+every process. Deactivated users are refused by the user lookup.
+"""
+import uuid
+from datetime import datetime, timezone
+
+from django.db import IntegrityError, transaction
+from django.utils.crypto import constant_time_compare
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import CREDENTIALS_CLAIM, credentials_fingerprint
+from .models import RevokedRefreshToken
+
+
+class RefreshRejected(Exception):
+    pass
+
+
+def issue_tokens(user) -> dict:
+    refresh = RefreshToken.for_user(user)
+    refresh[CREDENTIALS_CLAIM] = credentials_fingerprint(user)
+    return {"token": str(refresh.access_token), "refresh": str(refresh)}
+
+
+def _parse(raw) -> RefreshToken:
+    try:
+        return RefreshToken(raw)
+    except TokenError as exc:
+        raise RefreshRejected(str(exc)) from exc
+
+
+def revoke(refresh: RefreshToken) -> bool:
+    """Revoke a refresh token. False if it was already revoked."""
+    try:
+        jti = uuid.UUID(str(refresh[api_settings.JTI_CLAIM]))
+    except (KeyError, ValueError) as exc:
+        raise RefreshRejected("Token has no valid id.") from exc
+    expires_at = datetime.fromtimestamp(refresh["exp"], tz=timezone.utc)
+    try:
+        with transaction.atomic():
+            RevokedRefreshToken.objects.create(jti=jti, expires_at=expires_at)
+    except IntegrityError:
+        return False
+    return True
+
+
+def rotate(raw) -> tuple:
+    """(user, new token pair) for a valid, unused refresh token."""
+    refresh = _parse(raw)
+    try:
+        # Uncached: the fingerprint must be checked against the current hash.
+        user = JWTAuthentication().get_user(refresh)
+    except AuthenticationFailed as exc:
+        raise RefreshRejected(str(exc.detail)) from exc
+    if not constant_time_compare(refresh.get(CREDENTIALS_CLAIM, ""), credentials_fingerprint(user)):
+        raise RefreshRejected("Password has changed since this token was issued.")
+    if not revoke(refresh):
+        raise RefreshRejected("Token has already been used.")
+    return user, issue_tokens(user)
+
+
+def logout(raw):
+    revoke(_parse(raw))
@@ -3,6 +3,8 @@ from django.urls import path
 from .views import (
     RegisterView,
     LoginView,
+    RefreshView,
+    LogoutView,
     MeView,
     ForgotPasswordView,
     ResetPasswordView,
@@ -13,6 +15,8 @@ from .views import (
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="auth-register"),
     path("login/", LoginView.as_view(), name="auth-login"),
+    path("refresh/", RefreshView.as_view(), name="auth-refresh"),
+    path("logout/", LogoutView.as_view(), name="auth-logout"),
     path("me/", MeView.as_view(), name="auth-me"),
     path("forgot/", ForgotPasswordView.as_view(), name="auth-forgot"),
     path("reset/", ResetPasswordView.as_view(), name="auth-reset"),
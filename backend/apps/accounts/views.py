@@ -12,7 +12,6 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from .serializers import (
     UserSerializer,
@@ -20,11 +19,12 @@ from .serializers import (
     LoginSerializer,
 )
 from .models import EmailVerification
+from .throttles import ConfirmVerificationThrottle, ForgotPasswordThrottle, LoginThrottle, SendVerificationThrottle
+from . import tokens
 
 
 def generate_tokens_for_user(user: User) -> str:
-    refresh = RefreshToken.for_user(user)
-    return str(refresh.access_token) 
+    return tokens.issue_tokens(user)["token"]
 
 
 class RegisterView(APIView):
@@ -68,6 +68,7 @@ class RegisterView(APIView):
 
 class LoginView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [LoginThrottle]
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -101,29 +102,81 @@ class LoginView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        token = generate_tokens_for_user(user)
         user_data = UserSerializer(user).data
 
         return Response(
             {
                 "user": user_data,
-                "token": token,
+                **tokens.issue_tokens(user),
             },
             status=status.HTTP_200_OK,
         )
 
 
+class RefreshView(APIView):
+    """Trade a refresh token for a new access/refresh pair (no password check)."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        refresh = request.data.get("refresh")
+        if not refresh:
+            return Response(
+                {"detail": "refresh is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            user, pair = tokens.rotate(refresh)
+        except tokens.RefreshRejected as exc:
+            return Response(
+                {"detail": str(exc), "code": "token_not_valid"},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        return Response(pair)
+
+
+class LogoutView(APIView):
+    """Revoke a refresh token so it can't be used to renew the session."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        refresh = request.data.get("refresh")
+        if not refresh:
+            return Response(
+                {"detail": "refresh is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            tokens.logout(refresh)
+        except tokens.RefreshRejected as exc:
+            return Response(
+                {"detail": str(exc), "code": "token_not_valid"},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
+        # request.user only has id and is_active loaded (see authentication.py).
+        try:
+            user = User.objects.get(pk=request.user.pk)
+        except User.DoesNotExist:
+            return Response({"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND)
         data = UserSerializer(user).data
         return Response(data)
 
 
 class ForgotPasswordView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [ForgotPasswordThrottle]
 
     def post(self, request):
         email = request.data.get("email")
@@ -217,6 +270,7 @@ def create_email_verification(user: User) -> EmailVerification:
 
 class SendVerificationView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [SendVerificationThrottle]
 
     def post(self, request):
         email = request.data.get("email")
@@ -242,6 +296,7 @@ class SendVerificationView(APIView):
 
 class ConfirmVerificationView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [ConfirmVerificationThrottle]
 
     def post(self, request):
         uid = request.data.get("uid")
@@ -284,11 +339,10 @@ class ConfirmVerificationView(APIView):
         user.is_active = True
         user.save()
 
-        token = generate_tokens_for_user(user)
         return Response(
             {
                 "detail": "Email verified.",
-                "token": token,
+                **tokens.issue_tokens(user),
                 "user": UserSerializer(user).data,
             }
         )
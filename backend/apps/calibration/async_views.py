@@ -0,0 +1,50 @@
+# backend/apps/calibration/async_views.py
+"""
+Async version of the calibration diagnostics endpoint, used when
+ASYNC_VIEWS=True. Once the ownership check (apps.projects.access) passes, the
+model and the points are independent lookups by project id, so they are
+started together.
+"""
+import asyncio
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import CalibrationModel, CalibrationPoint
+from .views import diagnostics_payload
+from apps.projects.access import project_access
+from core.async_views import AsyncAPIView
+
+
+class AsyncCalibrationDiagnosticsView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        project_id = request.query_params.get("project")
+        if not project_id:
+            return Response(
+                {"detail": "project query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not await project_access(request).aowns(project_id):
+            return Response(
+                {"detail": "Project not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        project_id = int(project_id)
+
+        async def points():
+            return [p async for p in CalibrationPoint.objects.filter(project_id=project_id).order_by("-created_at")]
+
+        model, point_list = await asyncio.gather(
+            CalibrationModel.objects.filter(project_id=project_id).afirst(),
+            points(),
+        )
+        if model is None:
+            return Response(
+                {"detail": "No active calibration model for this project."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(diagnostics_payload(model, point_list))
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('calibration', '0002_calibrationmodel_rmse_and_ranges'),
+        ('projects', '0002_project_structure_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calibrationpoint',
+            index=models.Index(fields=['project', 'created_at'], name='calpoint_project_created_idx'),
+        ),
+    ]
@@ -1,9 +1,10 @@
 # backend/apps/calibration/models.py
 from django.db import models
 from apps.projects.models import Project, Member
+from apps.projects.versioning import VersionedDeleteMixin
 
 
-class CalibrationPoint(models.Model):
+class CalibrationPoint(VersionedDeleteMixin, models.Model):
     project = models.ForeignKey(
         Project, on_delete=models.CASCADE, related_name="calibration_points"
     )
@@ -21,6 +22,11 @@ class CalibrationPoint(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "created_at"], name="calpoint_project_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.project.name} - {self.core_fc:.1f} MPa"
 
@@ -1,4 +1,5 @@
 # backend/apps/calibration/urls.py
+from django.conf import settings
 from django.urls import path
 from .views import (
     CalibrationPointsView,
@@ -7,6 +8,10 @@ from .views import (
     ActiveModelView,
     CalibrationDiagnosticsView,
 )
+from .async_views import AsyncCalibrationDiagnosticsView
+
+# ASYNC_VIEWS selects the async implementations of the read-heavy endpoints.
+DiagnosticsView = AsyncCalibrationDiagnosticsView if settings.ASYNC_VIEWS else CalibrationDiagnosticsView
 
 urlpatterns = [
     path("points/", CalibrationPointsView.as_view(), name="calibration-points"),
@@ -14,5 +19,5 @@ urlpatterns = [
     path("generate/", GenerateModelView.as_view(), name="calibration-generate"),
     path("model/", ActiveModelView.as_view(), name="calibration-model"),
     path("active/", ActiveModelView.as_view(), name="calibration-active"),
-    path("diagnostics/", CalibrationDiagnosticsView.as_view(), name="calibration-diagnostics"),
+    path("diagnostics/", DiagnosticsView.as_view(), name="calibration-diagnostics"),
 ]
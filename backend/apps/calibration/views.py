@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 
 from .models import CalibrationPoint, CalibrationModel
 from .serializers import CalibrationPointSerializer, CalibrationModelSerializer
+from apps.projects.access import project_access
 from apps.projects.models import Project
 
 
@@ -23,15 +24,13 @@ class CalibrationPointsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            project = Project.objects.get(id=project_id, owner=request.user)
-        except Project.DoesNotExist:
+        if not project_access(request).owns(project_id):
             return Response(
                 {"detail": "Project not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        points = CalibrationPoint.objects.filter(project=project).order_by("-created_at")
+        points = CalibrationPoint.objects.filter(project_id=project_id).order_by("-created_at")
         serializer = CalibrationPointSerializer(points, many=True)
         return Response(serializer.data)
 
@@ -191,17 +190,14 @@ class ActiveModelView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            project = Project.objects.get(id=project_id, owner=request.user)
-        except Project.DoesNotExist:
+        if not project_access(request).owns(project_id):
             return Response(
                 {"detail": "Project not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        try:
-            model = project.calibration_model
-        except CalibrationModel.DoesNotExist:
+        model = CalibrationModel.objects.filter(project_id=project_id).first()
+        if model is None:
             return Response(
                 {"detail": "No active calibration model for this project."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -218,17 +214,14 @@ class ActiveModelView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            project = Project.objects.get(id=project_id, owner=request.user)
-        except Project.DoesNotExist:
+        if not project_access(request).owns(project_id):
             return Response(
                 {"detail": "Project not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        try:
-            model = project.calibration_model
-        except CalibrationModel.DoesNotExist:
+        model = CalibrationModel.objects.filter(project_id=project_id).first()
+        if model is None:
             return Response(
                 {"detail": "No calibration model found to activate."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -238,6 +231,34 @@ class ActiveModelView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+def diagnostics_payload(model: CalibrationModel, points) -> dict:
+    data_points = []
+    for p in points:
+        # predicted using power-law model: fc = a * UPV^b * RH^c (* carb^d)
+        predicted = None
+        if p.upv > 0 and p.rh_index > 0:
+            predicted = model.a0 * (p.upv ** model.a1) * (p.rh_index ** model.a2)
+            if model.use_carbonation and p.carbonation_depth and model.a3:
+                predicted *= p.carbonation_depth ** model.a3
+
+        data_points.append(
+            {
+                "id": p.id,
+                "measured_fc": p.core_fc,
+                "predicted_fc": predicted,
+                "upv": p.upv,
+                "rh_index": p.rh_index,
+                "carbonation_depth": p.carbonation_depth,
+                "created_at": p.created_at,
+            }
+        )
+
+    return {
+        "model": CalibrationModelSerializer(model).data,
+        "points": data_points,
+    }
+
+
 class CalibrationDiagnosticsView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -249,49 +270,21 @@ class CalibrationDiagnosticsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            project = Project.objects.get(id=project_id, owner=request.user)
-        except Project.DoesNotExist:
+        if not project_access(request).owns(project_id):
             return Response(
                 {"detail": "Project not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        try:
-            model = project.calibration_model
-        except CalibrationModel.DoesNotExist:
+        model = CalibrationModel.objects.filter(project_id=project_id).first()
+        if model is None:
             return Response(
                 {"detail": "No active calibration model for this project."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        points = CalibrationPoint.objects.filter(project=project).order_by("-created_at")
-        data_points = []
-        for p in points:
-            # predicted using power-law model: fc = a * UPV^b * RH^c (* carb^d)
-            predicted = None
-            if p.upv > 0 and p.rh_index > 0:
-                predicted = model.a0 * (p.upv ** model.a1) * (p.rh_index ** model.a2)
-                if model.use_carbonation and p.carbonation_depth and model.a3:
-                    predicted *= p.carbonation_depth ** model.a3
-
-            data_points.append(
-                {
-                    "id": p.id,
-                    "measured_fc": p.core_fc,
-                    "predicted_fc": predicted,
-                    "upv": p.upv,
-                    "rh_index": p.rh_index,
-                    "carbonation_depth": p.carbonation_depth,
-                    "created_at": p.created_at,
-                }
-            )
-
-        payload = {
-            "model": CalibrationModelSerializer(model).data,
-            "points": data_points,
-        }
-        return Response(payload)
+        points = CalibrationPoint.objects.filter(project_id=project_id).order_by("-created_at")
+        return Response(diagnostics_payload(model, points))
 
 
 class CalibrationPointDetailView(APIView):
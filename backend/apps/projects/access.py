@@ -0,0 +1,82 @@
+# backend/apps/projects/access.py
+"""
+Project ownership checks without a query per view.
+
+``project_access(request)`` returns a resolver, created once per request,
+holding the ids of the caller's projects. The ids are kept in the default
+Django cache for PROJECT_ACCESS_CACHE_TTL seconds and dropped whenever one of
+the owner's projects is created, saved or deleted. Projects can't change
+owner through the API; an owner changed in the admin is picked up by other
+processes with a per-process cache within the TTL.
+
+Views that only need to know *whether* the caller owns a project use it and
+then filter by ``project_id``; views that need the row itself keep loading it
+with ``owner=request.user``.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+from core import metrics
+from .models import Project
+
+CACHE_PREFIX = "project-access"
+
+
+def access_cache_key(user_id) -> str:
+    return f"{CACHE_PREFIX}:{user_id}"
+
+
+def owned_project_ids(user_id) -> frozenset:
+    key = access_cache_key(user_id)
+    ids = cache.get(key)
+    metrics.CACHE_REQUESTS.inc(cache=CACHE_PREFIX, result="miss" if ids is None else "hit")
+    if ids is None:
+        ids = frozenset(Project.objects.filter(owner_id=user_id).values_list("id", flat=True))
+        cache.set(key, ids, getattr(settings, "PROJECT_ACCESS_CACHE_TTL", 30))
+    return ids
+
+
+class ProjectAccess:
+    def __init__(self, user):
+        self.user_id = user.pk
+        self._ids = None
+
+    @property
+    def project_ids(self) -> frozenset:
+        if self._ids is None:
+            self._ids = frozenset() if self.user_id is None else owned_project_ids(self.user_id)
+        return self._ids
+
+    def owns(self, project_id) -> bool:
+        try:
+            return int(project_id) in self.project_ids
+        except (TypeError, ValueError):
+            return False
+
+    async def aproject_ids(self) -> frozenset:
+        if self._ids is None:
+            # The default cache has no async API; a miss runs one query.
+            await sync_to_async(lambda: self.project_ids)()
+        return self._ids
+
+    async def aowns(self, project_id) -> bool:
+        await self.aproject_ids()
+        return self.owns(project_id)
+
+
+def project_access(request) -> ProjectAccess:
+    access = getattr(request, "_project_access", None)
+    if access is None:
+        access = request._project_access = ProjectAccess(request.user)
+    return access
+
+
+def _project_changed(sender, instance, **kwargs):
+    cache.delete(access_cache_key(instance.owner_id))
+
+
+def connect():
+    post_save.connect(_project_changed, sender=Project, dispatch_uid="project-access-save")
+    post_delete.connect(_project_changed, sender=Project, dispatch_uid="project-access-delete")
@@ -0,0 +1,93 @@
+# backend/apps/projects/async_views.py
+"""
+Async versions of the dashboard endpoints, used when ASYNC_VIEWS=True.
+
+Each view reads the project row first: it is the ownership check, and its
+version answers conditional requests (see .conditional). The readings
+queries only run for the owner. Responses match the sync views.
+"""
+import asyncio
+
+from django.db.models import Avg
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .conditional import VALIDATOR_FIELDS, not_modified, with_validators
+from .models import Project
+from .views import (
+    histogram_payload,
+    histogram_queryset,
+    parse_bin_size,
+    rating_aggregates,
+    ratings_payload,
+    summary_aggregates,
+    summary_payload,
+)
+from apps.readings.models import Reading
+from core.async_views import AsyncAPIView
+
+
+def owned_project(pk, user):
+    return Project.objects.only(*VALIDATOR_FIELDS).filter(pk=pk, owner=user).afirst()
+
+
+async def load(request, pk, query):
+    """``(project, result, response)``; a response (404 or 304) ends the request."""
+    project = await owned_project(pk, request.user)
+    if project is None:
+        return None, None, Response(status=status.HTTP_404_NOT_FOUND)
+    not_modified_response = not_modified(request, project)
+    if not_modified_response:
+        return project, None, not_modified_response
+    return project, await query(), None
+
+
+class AsyncProjectSummaryView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request, pk):
+        project, agg, response = await load(
+            request, pk, lambda: Reading.objects.filter(project_id=pk).aaggregate(**summary_aggregates())
+        )
+        if response:
+            return response
+        return with_validators(Response(summary_payload(project.id, agg)), request, project)
+
+
+class AsyncProjectRatingsView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request, pk):
+        project, agg, response = await load(
+            request, pk, lambda: Reading.objects.filter(project_id=pk).aaggregate(**rating_aggregates())
+        )
+        if response:
+            return response
+        return with_validators(Response(ratings_payload(project.id, agg)), request, project)
+
+
+class AsyncProjectHistogramView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request, pk):
+        bin_size, error = parse_bin_size(request.query_params)
+        if error:
+            if await owned_project(pk, request.user) is None:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            return error
+
+        readings_qs = histogram_queryset(pk)
+
+        async def values():
+            return [v async for v in readings_qs.values_list("estimated_fc", flat=True)]
+
+        def query():
+            return asyncio.gather(values(), readings_qs.aaggregate(avg=Avg("estimated_fc")))
+
+        project, result, response = await load(request, pk, query)
+        if response:
+            return response
+        fc_values, avg = result
+        payload = histogram_payload(project.id, bin_size, fc_values, avg["avg"] if fc_values else None)
+        return with_validators(Response(payload), request, project)
@@ -0,0 +1,41 @@
+# backend/apps/projects/conditional.py
+"""
+Conditional GET for the project dashboards.
+
+The views load the project row first (they need it for the ownership check
+anyway). Its ``data_version`` and ``data_updated_at`` give the ETag and
+Last-Modified, so a poll with a matching If-None-Match / If-Modified-Since
+is answered with 304 before any aggregation query runs.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+VALIDATOR_FIELDS = ("id", "data_version", "data_updated_at")
+
+
+def project_etag(request, project) -> str:
+    # The same project gives different bodies per endpoint, query string and
+    # negotiated format (core.renderers).
+    representation = f"{request.get_full_path()} {getattr(request, 'accepted_media_type', '')}"
+    variant = hashlib.blake2b(representation.encode("utf-8"), digest_size=6).hexdigest()
+    return f'W/"p{project.id}-v{project.data_version}-{variant}"'
+
+
+def not_modified(request, project):
+    """The 304 response when the client's copy is current, else None."""
+    response = get_conditional_response(
+        request,
+        etag=project_etag(request, project),
+        last_modified=int(project.data_updated_at.timestamp()),
+    )
+    return None if response is None else with_validators(response, request, project)
+
+
+def with_validators(response, request, project):
+    response["ETag"] = project_etag(request, project)
+    response["Last-Modified"] = http_date(project.data_updated_at.timestamp())
+    # Clients may keep the body but must revalidate every time.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,244 @@
+# backend/apps/projects/management/commands/generate_synthetic_data.py
+"""
+Deterministic synthetic dataset for local load and performance testing.
+
+    python manage.py generate_synthetic_data --owners 4 --projects 3 --readings 5000
+    python manage.py generate_synthetic_data --replace --seed 7
+
+The same --seed always produces the same rows. Owners are active users named
+``<prefix><n>@example.com`` sharing one password, so benchmarks/loadtest.py can
+log in as them.
+"""
+import os
+import struct
+import zlib
+
+import numpy as np
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.calibration.models import CalibrationModel, CalibrationPoint
+from apps.projects.models import Member, Project
+from apps.readings import bulk
+from apps.readings.models import ReadingFolder, Report, ReportPhoto
+
+MEMBER_TYPES = (("C", "Column"), ("B", "Beam"), ("S", "Slab"), ("W", "Wall"), ("F", "Footing"))
+LOCATIONS = ("Quezon City", "Makati", "Cebu City", "Davao City", "Iloilo City", "Baguio")
+DESIGN_FC = (21.0, 24.0, 28.0, 35.0)
+# Typical SonReb exponents (fc in MPa, UPV in m/s, RH rebound number).
+UPV_EXPONENT = 2.6
+RH_EXPONENT = 1.4
+
+
+def write_png(path, width, height, seed):
+    """Small gradient PNG so report photos resolve to real MEDIA files."""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(40, 200, size=3)
+    x = np.linspace(0, 55, width, dtype=float)
+    pixels = np.clip(base[None, None, :] + x[None, :, None], 0, 255).astype(np.uint8)
+    pixels = np.repeat(pixels, height, axis=0)
+    raw = b"".join(b"\x00" + row.tobytes() for row in pixels)
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    with open(path, "wb") as fh:
+        fh.write(b"\x89PNG\r\n\x1a\n")
+        fh.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        fh.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        fh.write(chunk(b"IEND", b""))
+
+
+def fit_power_law(upv, rh, core_fc) -> dict:
+    """Same log-space least squares as GenerateModelView (no carbonation term)."""
+    X = np.column_stack([np.ones_like(upv), np.log(upv), np.log(rh)])
+    y = np.log(core_fc)
+    beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+    y_pred = X @ beta
+    ss_res = float(np.sum((y - y_pred) ** 2))
+    ss_tot = float(np.sum((y - y.mean()) ** 2))
+    return {
+        "a0": float(np.exp(beta[0])),
+        "a1": float(beta[1]),
+        "a2": float(beta[2]),
+        "a3": None,
+        "r2": 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0,
+        "rmse": float(np.sqrt(np.mean((y - y_pred) ** 2))),
+        "points_used": len(y),
+        "use_carbonation": False,
+        "upv_min": float(upv.min()),
+        "upv_max": float(upv.max()),
+        "rh_min": float(rh.min()),
+        "rh_max": float(rh.max()),
+    }
+
+
+class Command(BaseCommand):
+    help = "Generate deterministic synthetic owners, projects, readings, cores, reports and photos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owners", type=int, default=2)
+        parser.add_argument("--projects", type=int, default=3, help="projects per owner")
+        parser.add_argument("--members", type=int, default=24, help="members per project")
+        parser.add_argument("--readings", type=int, default=1000, help="readings per project")
+        parser.add_argument("--cores", type=int, default=12, help="calibration points per project")
+        parser.add_argument("--reports", type=int, default=3, help="reports per project")
+        parser.add_argument("--photos", type=int, default=4, help="photos per report")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--prefix", default="loadtest", help="owner email prefix")
+        parser.add_argument("--password", default="loadtest-pass")
+        parser.add_argument("--media-host", default="http://localhost:8000", help="host used in photo URLs")
+        parser.add_argument("--replace", action="store_true", help="delete existing owners with this prefix first")
+
+    def handle(self, *args, **options):
+        if options["cores"] < 5:
+            raise CommandError("--cores must be at least 5 to fit a calibration model.")
+        emails = [f"{options['prefix']}{i}@example.com" for i in range(1, options["owners"] + 1)]
+        existing = User.objects.filter(email__in=emails)
+        if existing.exists():
+            if not options["replace"]:
+                raise CommandError("Synthetic owners already exist; pass --replace to regenerate them.")
+            existing.delete()
+
+        rng = np.random.default_rng(options["seed"])
+        photo_urls = self.write_photos(options)
+        totals = dict.fromkeys(("projects", "members", "readings", "cores", "reports", "photos"), 0)
+
+        for email in emails:
+            owner = User.objects.create_user(
+                username=email, email=email, password=options["password"], first_name="Load Test"
+            )
+            for index in range(options["projects"]):
+                with transaction.atomic():
+                    counts = self.generate_project(owner, index, rng, photo_urls, options)
+                for key, value in counts.items():
+                    totals[key] += value
+            self.stdout.write(f"{email}: {options['projects']} projects")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Generated {owners} owners, {projects} projects, {members} members, {readings} readings, "
+                "{cores} cores, {reports} reports, {photos} photos (seed {seed}).".format(
+                    owners=len(emails), seed=options["seed"], **totals
+                )
+            )
+        )
+
+    def write_photos(self, options) -> list:
+        directory = os.path.join(settings.MEDIA_ROOT, "synthetic")
+        os.makedirs(directory, exist_ok=True)
+        urls = []
+        for i in range(4):
+            write_png(os.path.join(directory, f"photo-{i}.png"), 160, 120, options["seed"] + i)
+            urls.append(f"{options['media_host'].rstrip('/')}{settings.MEDIA_URL}synthetic/photo-{i}.png")
+        return urls
+
+    def generate_project(self, owner, index, rng, photo_urls, options) -> dict:
+        age = int(rng.integers(1, 60))
+        design_fc = float(rng.choice(DESIGN_FC))
+        project = Project.objects.create(
+            owner=owner,
+            name=f"Synthetic {owner.id}-{index + 1}",
+            location=str(rng.choice(LOCATIONS)),
+            client="Synthetic Client",
+            structure_age=age,
+            latitude=float(rng.uniform(6.0, 18.0)),
+            longitude=float(rng.uniform(120.0, 126.0)),
+            design_fc=design_fc,
+        )
+
+        levels = [f"L{i}" for i in range(1, max(2, options["members"] // 8) + 1)]
+        members = []
+        for i in range(options["members"]):
+            prefix, member_type = MEMBER_TYPES[i % len(MEMBER_TYPES)]
+            members.append(
+                Member(
+                    project=project,
+                    member_id=f"{prefix}{i + 1}",
+                    type=member_type,
+                    level=levels[i % len(levels)],
+                    gridline=f"{chr(ord('A') + i % 8)}-{1 + i % 6}",
+                )
+            )
+        members = Member.objects.bulk_create(members)
+        ReadingFolder.objects.bulk_create(ReadingFolder(project=project, name=level) for level in levels)
+
+        # Concrete of this project: UPV and rebound number are positively
+        # correlated; carbonation grows with sqrt(age).
+        upv_mean = rng.uniform(3700, 4400)
+        target_fc = design_fc * rng.uniform(0.8, 1.2)
+        a0 = target_fc / (4000.0**UPV_EXPONENT * 35.0**RH_EXPONENT)
+        carb_rate = rng.uniform(1.0, 4.0)
+
+        def sample(n):
+            upv = np.clip(rng.normal(upv_mean, 250, n), 2500, 5200)
+            rh = np.clip(35 + (upv - 4000) * 0.012 + rng.normal(0, 3.5, n), 15, 60)
+            carb = np.clip(rng.lognormal(np.log(carb_rate * np.sqrt(age) + 0.5), 0.35, n), 0.5, 60)
+            return upv, rh, carb
+
+        upv, rh, carb = sample(options["cores"])
+        core_fc = a0 * upv**UPV_EXPONENT * rh**RH_EXPONENT * rng.lognormal(0, 0.08, options["cores"])
+        CalibrationPoint.objects.bulk_create(
+            CalibrationPoint(
+                project=project,
+                member=members[int(rng.integers(len(members)))] if members else None,
+                upv=round(float(u), 1),
+                rh_index=round(float(r), 1),
+                carbonation_depth=round(float(c), 1),
+                core_fc=round(float(fc), 2),
+            )
+            for u, r, c, fc in zip(upv, rh, carb, core_fc)
+        )
+        CalibrationModel.objects.create(project=project, **fit_power_law(upv, rh, core_fc))
+
+        upv, rh, carb = sample(options["readings"])
+        member_idx = rng.integers(len(members), size=options["readings"]) if members else []
+        rows = []
+        for i in range(options["readings"]):
+            member = members[int(member_idx[i])] if members else None
+            free_text = member is None or i % 10 == 0
+            rows.append(
+                {
+                    "member": None if free_text else member.id,
+                    "member_text": f"X{i % 50}" if free_text else "",
+                    "location_tag": f"{member.level} {member.gridline}" if member else "",
+                    "upv": round(float(upv[i]), 1),
+                    "rh_index": round(float(rh[i]), 1),
+                    "carbonation_depth": round(float(carb[i]), 1) if i % 3 else None,
+                }
+            )
+        readings = bulk.insert_readings(bulk.build_readings(project, rows))
+
+        photos = 0
+        for r in range(options["reports"]):
+            report = Report.objects.create(
+                project=project,
+                title=f"Assessment {r + 1}",
+                folder=levels[r % len(levels)],
+                company="Synthetic Engineering",
+                client_name=project.client,
+                engineer_name="J. Engineer",
+                engineer_title="Structural Engineer",
+            )
+            batch = [
+                ReportPhoto(
+                    report=report,
+                    image_url=photo_urls[p % len(photo_urls)],
+                    caption=f"Photo {p + 1}",
+                    location_tag=levels[p % len(levels)],
+                )
+                for p in range(options["photos"])
+            ]
+            ReportPhoto.objects.bulk_create(batch)
+            photos += len(batch)
+
+        return {
+            "projects": 1,
+            "members": len(members),
+            "readings": readings,
+            "cores": options["cores"],
+            "reports": options["reports"],
+            "photos": photos,
+        }
@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-19 18:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_structure_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='data_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='data_version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -1,6 +1,7 @@
 # backend/apps/projects/models.py
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Project(models.Model):
@@ -19,6 +20,24 @@ class Project(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Bumped on every write to the project's readings, members, calibration
+    # and reports (apps.projects.versioning); drives ETags and report caching.
+    data_version = models.PositiveBigIntegerField(default=0)
+    data_updated_at = models.DateTimeField(default=timezone.now)
+
+    # Only bump_data_version writes these, with an UPDATE relative to the
+    # stored value; a full save of an instance loaded earlier must not write
+    # its stale copy back.
+    VERSION_FIELDS = frozenset({"data_version", "data_updated_at"})
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get("force_insert") and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.VERSION_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
@@ -1,4 +1,5 @@
 # backend/apps/projects/urls.py
+from django.conf import settings
 from django.urls import path
 from .views import (
     ProjectListCreateView,
@@ -9,7 +10,14 @@ from .views import (
     ProjectRatingsView,
     ProjectHistogramView,
     ProjectReportView,
+    ProjectBundleView,
 )
+from .async_views import AsyncProjectHistogramView, AsyncProjectRatingsView, AsyncProjectSummaryView
+
+# ASYNC_VIEWS selects the async implementations of the read-heavy endpoints.
+SummaryView = AsyncProjectSummaryView if settings.ASYNC_VIEWS else ProjectSummaryView
+RatingsView = AsyncProjectRatingsView if settings.ASYNC_VIEWS else ProjectRatingsView
+HistogramView = AsyncProjectHistogramView if settings.ASYNC_VIEWS else ProjectHistogramView
 
 urlpatterns = [
     path("", ProjectListCreateView.as_view(), name="project-list-create"),
@@ -20,13 +28,14 @@ urlpatterns = [
         ProjectMemberDetailView.as_view(),
         name="project-member-detail",
     ),
-    path("<int:pk>/summary/", ProjectSummaryView.as_view(), name="project-summary"),
-    path("<int:pk>/stats/ratings/", ProjectRatingsView.as_view(), name="project-ratings"),
+    path("<int:pk>/summary/", SummaryView.as_view(), name="project-summary"),
+    path("<int:pk>/stats/ratings/", RatingsView.as_view(), name="project-ratings"),
     path(
         "<int:pk>/stats/fc-histogram/",
-        ProjectHistogramView.as_view(),
+        HistogramView.as_view(),
         name="project-fc-histogram",
     ),
+    path("<int:pk>/bundle/", ProjectBundleView.as_view(), name="project-bundle"),
     path(
         "<int:pk>/reports/summary/",
         ProjectReportView.as_view(),
@@ -0,0 +1,75 @@
+# backend/apps/projects/versioning.py
+"""
+Per-project data version.
+
+``Project.data_version`` is incremented (and ``data_updated_at`` set) by a
+single UPDATE whenever something that feeds the dashboards or reports is
+written: the project itself, its members, readings, calibration points and
+model, reports and report photos.
+
+Saves are covered by post_save receivers connected in ProjectsConfig.ready().
+Deletes of members, reports and calibration models use post_delete too, but
+the high-volume rows (readings, calibration points, photos) bump from
+``VersionedDeleteMixin.delete()`` instead: a delete receiver on them would
+stop Django from fast-deleting them when their project or report is deleted.
+Code that writes rows without signals (bulk_create, COPY, queryset.update or
+queryset.delete) must call ``bump_data_version`` itself.
+"""
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .models import Member, Project
+
+# Export bookkeeping on Report that no dashboard or report payload reads.
+UNTRACKED_FIELDS = frozenset({"status", "pdf_url", "csv_url", "export_metrics", "updated_at"})
+
+
+def bump_data_version(*project_ids):
+    project_ids = {pk for pk in project_ids if pk is not None}
+    if project_ids:
+        Project.objects.filter(pk__in=project_ids).update(
+            data_version=F("data_version") + 1,
+            data_updated_at=timezone.now(),
+        )
+
+
+def _project_id(instance):
+    if isinstance(instance, Project):
+        return instance.pk
+    if hasattr(instance, "project_id"):
+        return instance.project_id
+    return instance.report.project_id  # ReportPhoto
+
+
+class VersionedDeleteMixin:
+    def delete(self, *args, **kwargs):
+        project_id = _project_id(self)
+        result = super().delete(*args, **kwargs)
+        bump_data_version(project_id)
+        return result
+
+
+def _saved(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw or (created and sender is Project):
+        return
+    if update_fields and update_fields <= UNTRACKED_FIELDS:
+        return
+    bump_data_version(_project_id(instance))
+
+
+def _deleted(sender, instance, origin=None, **kwargs):
+    # Nothing to bump when the whole project is being deleted.
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is not Project:
+        bump_data_version(_project_id(instance))
+
+
+def connect():
+    from apps.calibration.models import CalibrationModel, CalibrationPoint
+    from apps.readings.models import Reading, Report, ReportPhoto
+
+    for model in (Project, Member, Reading, CalibrationPoint, CalibrationModel, Report, ReportPhoto):
+        post_save.connect(_saved, sender=model, dispatch_uid=f"data-version-save-{model._meta.label_lower}")
+    for model in (Member, CalibrationModel, Report):
+        post_delete.connect(_deleted, sender=model, dispatch_uid=f"data-version-delete-{model._meta.label_lower}")
@@ -1,28 +1,156 @@
 # backend/apps/projects/views.py
-import io
 from math import ceil, floor
-from django.db.models import Avg, Count, Min, Max
+from django.db.models import Avg, Count, Min, Max, Q
 from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt  # noqa: E402
-from reportlab.lib.pagesizes import A4  # noqa: E402
-from reportlab.lib.utils import ImageReader  # noqa: E402
-from reportlab.pdfgen import canvas  # noqa: E402
 
+from .conditional import not_modified, with_validators
 from .models import Project, Member
 from .serializers import (
     ProjectSerializer,
     MemberSerializer,
     ProjectSummarySerializer,
 )
-from apps.readings.models import Reading
-from apps.calibration.models import CalibrationModel, CalibrationPoint
+from apps.calibration.models import CalibrationModel
+from apps.calibration.serializers import CalibrationModelSerializer
+from apps.readings.models import Reading, Report
+from apps.readings.reporting import ReportEngine
+from apps.readings.serializers import ReportListSerializer, serialize_reading_list
+from apps.readings.views import reading_list_queryset
+from core.instrumentation import start_profiler
+from core.metrics import EXPORT_JOBS
+
+
+def rating_aggregates() -> dict:
+    return {
+        rating.lower(): Count("id", filter=Q(rating=rating))
+        for rating in ("GOOD", "FAIR", "POOR")
+    }
+
+
+def summary_aggregates() -> dict:
+    # One pass over the readings; rating counts compile to
+    # COUNT(...) FILTER (WHERE rating = ...) on PostgreSQL and SQLite.
+    return {
+        "readings_count": Count("id"),
+        "min_fc": Min("estimated_fc"),
+        "max_fc": Max("estimated_fc"),
+        "avg_fc": Avg("estimated_fc"),
+        **rating_aggregates(),
+    }
+
+
+def summary_payload(project_id: int, agg: dict) -> dict:
+    payload = {
+        "project_id": project_id,
+        "readings_count": agg["readings_count"] or 0,
+        "min_fc": agg["min_fc"],
+        "max_fc": agg["max_fc"],
+        "avg_fc": agg["avg_fc"],
+        "good_count": agg["good"],
+        "fair_count": agg["fair"],
+        "poor_count": agg["poor"],
+    }
+    return ProjectSummarySerializer(payload).data
+
+
+def ratings_payload(project_id: int, agg: dict) -> dict:
+    good, fair, poor = agg["good"], agg["fair"], agg["poor"]
+    return {
+        "project_id": project_id,
+        "good": good,
+        "fair": fair,
+        "poor": poor,
+        "total": good + fair + poor,
+    }
+
+
+def parse_bin_size(query_params):
+    """Returns (bin_size, None) or (None, error Response)."""
+    try:
+        bin_size = float(query_params.get("bin_size", 2.0))
+    except (TypeError, ValueError):
+        return None, Response(
+            {"detail": "bin_size must be numeric."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if bin_size <= 0:
+        return None, Response(
+            {"detail": "bin_size must be greater than zero."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return bin_size, None
+
+
+def histogram_queryset(project_id: int):
+    return Reading.objects.filter(project_id=project_id).exclude(estimated_fc__isnull=True)
+
+
+def histogram_payload(project_id: int, bin_size: float, values: list, avg_fc) -> dict:
+    if not values:
+        return {
+            "project_id": project_id,
+            "bin_size": bin_size,
+            "bins": [],
+            "min_fc": None,
+            "max_fc": None,
+            "avg_fc": None,
+        }
+
+    min_fc = min(values)
+    max_fc = max(values)
+
+    start = floor(min_fc / bin_size) * bin_size
+    end = ceil(max_fc / bin_size) * bin_size
+    bins = []
+
+    current = start
+    while current <= end:
+        upper = current + bin_size
+        count = sum(
+            1
+            for v in values
+            if (v >= current and v < upper) or (upper == end and v == max_fc)
+        )
+        bins.append({"lower": current, "upper": upper, "count": count})
+        current = upper
+
+    return {
+        "project_id": project_id,
+        "bin_size": bin_size,
+        "bins": bins,
+        "min_fc": min_fc,
+        "max_fc": max_fc,
+        "avg_fc": avg_fc,
+    }
+
+
+def reading_aggregates(rows) -> tuple:
+    """
+    summary_aggregates() computed in Python from (estimated_fc, rating) rows,
+    plus the non-null estimated_fc values for histogram_payload().
+    """
+    values = []
+    counts = {"GOOD": 0, "FAIR": 0, "POOR": 0}
+    readings_count = 0
+    for estimated_fc, rating in rows:
+        readings_count += 1
+        if estimated_fc is not None:
+            values.append(estimated_fc)
+        if rating in counts:
+            counts[rating] += 1
+    agg = {
+        "readings_count": readings_count,
+        "min_fc": min(values) if values else None,
+        "max_fc": max(values) if values else None,
+        "avg_fc": sum(values) / len(values) if values else None,
+        **{rating.lower(): count for rating, count in counts.items()},
+    }
+    return agg, values
 
 
 class ProjectListCreateView(APIView):
@@ -142,39 +270,12 @@ class ProjectSummaryView(APIView):
         if not project:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        readings_qs = Reading.objects.filter(project=project)
-
-        agg = readings_qs.aggregate(
-            readings_count=Count("id"),
-            min_fc=Min("estimated_fc"),
-            max_fc=Max("estimated_fc"),
-            avg_fc=Avg("estimated_fc"),
-        )
-
-        rating_counts = readings_qs.values("rating").annotate(count=Count("id"))
-        good_count = next(
-            (r["count"] for r in rating_counts if r["rating"] == "GOOD"), 0
-        )
-        fair_count = next(
-            (r["count"] for r in rating_counts if r["rating"] == "FAIR"), 0
-        )
-        poor_count = next(
-            (r["count"] for r in rating_counts if r["rating"] == "POOR"), 0
-        )
-
-        payload = {
-            "project_id": project.id,
-            "readings_count": agg["readings_count"] or 0,
-            "min_fc": agg["min_fc"],
-            "max_fc": agg["max_fc"],
-            "avg_fc": agg["avg_fc"],
-            "good_count": good_count,
-            "fair_count": fair_count,
-            "poor_count": poor_count,
-        }
+        not_modified_response = not_modified(request, project)
+        if not_modified_response:
+            return not_modified_response
 
-        serializer = ProjectSummarySerializer(payload)
-        return Response(serializer.data)
+        agg = Reading.objects.filter(project=project).aggregate(**summary_aggregates())
+        return with_validators(Response(summary_payload(project.id, agg)), request, project)
 
 
 class ProjectRatingsView(APIView):
@@ -185,22 +286,12 @@ class ProjectRatingsView(APIView):
         if not project:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        readings_qs = Reading.objects.filter(project=project)
-        rating_counts = readings_qs.values("rating").annotate(count=Count("id"))
+        not_modified_response = not_modified(request, project)
+        if not_modified_response:
+            return not_modified_response
 
-        good = next((r["count"] for r in rating_counts if r["rating"] == "GOOD"), 0)
-        fair = next((r["count"] for r in rating_counts if r["rating"] == "FAIR"), 0)
-        poor = next((r["count"] for r in rating_counts if r["rating"] == "POOR"), 0)
-        total = good + fair + poor
-
-        payload = {
-            "project_id": project.id,
-            "good": good,
-            "fair": fair,
-            "poor": poor,
-            "total": total,
-        }
-        return Response(payload)
+        agg = Reading.objects.filter(project=project).aggregate(**rating_aggregates())
+        return with_validators(Response(ratings_payload(project.id, agg)), request, project)
 
 
 class ProjectHistogramView(APIView):
@@ -211,241 +302,115 @@ class ProjectHistogramView(APIView):
         if not project:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            bin_size = float(request.query_params.get("bin_size", 2.0))
-        except (TypeError, ValueError):
-            return Response(
-                {"detail": "bin_size must be numeric."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        bin_size, error = parse_bin_size(request.query_params)
+        if error:
+            return error
 
-        if bin_size <= 0:
-            return Response(
-                {"detail": "bin_size must be greater than zero."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        not_modified_response = not_modified(request, project)
+        if not_modified_response:
+            return not_modified_response
 
-        readings_qs = Reading.objects.filter(project=project).exclude(
-            estimated_fc__isnull=True
-        )
+        readings_qs = histogram_queryset(project.id)
         values = list(readings_qs.values_list("estimated_fc", flat=True))
-
-        if not values:
-            return Response(
-                {
-                    "project_id": project.id,
-                    "bin_size": bin_size,
-                    "bins": [],
-                    "min_fc": None,
-                    "max_fc": None,
-                    "avg_fc": None,
-                }
-            )
-
-        min_fc = min(values)
-        max_fc = max(values)
-        avg_fc = readings_qs.aggregate(avg=Avg("estimated_fc"))["avg"]
-
-        start = floor(min_fc / bin_size) * bin_size
-        end = ceil(max_fc / bin_size) * bin_size
-        bins = []
-
-        current = start
-        while current <= end:
-            upper = current + bin_size
-            count = sum(
-                1
-                for v in values
-                if (v >= current and v < upper) or (upper == end and v == max_fc)
-            )
-            bins.append({"lower": current, "upper": upper, "count": count})
-            current = upper
-
-        payload = {
-            "project_id": project.id,
-            "bin_size": bin_size,
-            "bins": bins,
-            "min_fc": min_fc,
-            "max_fc": max_fc,
-            "avg_fc": avg_fc,
-        }
-        return Response(payload)
+        avg_fc = readings_qs.aggregate(avg=Avg("estimated_fc"))["avg"] if values else None
+        return with_validators(Response(histogram_payload(project.id, bin_size, values, avg_fc)), request, project)
 
 
 class ProjectReportView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def _pie_image(self, good: int, fair: int, poor: int):
-        fig, ax = plt.subplots(figsize=(3, 3))
-        counts = [good, fair, poor]
-        labels = ["GOOD", "FAIR", "POOR"]
-        colors = ["#34d399", "#fbbf24", "#f87171"]
-        if sum(counts) == 0:
-            counts = [1, 0, 0]
-            labels = ["NO DATA", "", ""]
-            colors = ["#94a3b8", "#ffffff00", "#ffffff00"]
-        ax.pie(counts, labels=labels, colors=colors, autopct="%1.0f%%")
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", transparent=True)
-        plt.close(fig)
-        buf.seek(0)
-        return buf
-
-    def _hist_image(self, values, bin_size: float):
-        fig, ax = plt.subplots(figsize=(4, 3))
-        if values:
-            bins = max(1, int((max(values) - min(values)) / bin_size))
-            ax.hist(values, bins=bins, color="#34d399", alpha=0.8)
-            ax.set_xlabel("Estimated fc' (MPa)")
-            ax.set_ylabel("Count")
-        else:
-            ax.text(0.5, 0.5, "No readings", ha="center", va="center")
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", transparent=True)
-        plt.close(fig)
-        buf.seek(0)
-        return buf
-
-    def _scatter_image(self, measured, predicted):
-        fig, ax = plt.subplots(figsize=(4, 3))
-        if measured and predicted:
-            ax.scatter(predicted, measured, color="#10b981", edgecolors="#0f172a")
-            mn = min(min(measured), min(predicted))
-            mx = max(max(measured), max(predicted))
-            ax.plot([mn, mx], [mn, mx], linestyle="--", color="#94a3b8")
-            ax.set_xlabel("Predicted fc' (MPa)")
-            ax.set_ylabel("Measured fc' (MPa)")
-        else:
-            ax.text(0.5, 0.5, "No calibration points", ha="center", va="center")
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", transparent=True)
-        plt.close(fig)
-        buf.seek(0)
-        return buf
-
     def get(self, request, pk):
         project = Project.objects.filter(pk=pk, owner=request.user).first()
         if not project:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        # Summary data
-        readings_qs = Reading.objects.filter(project=project)
-        agg = readings_qs.aggregate(
-            readings_count=Count("id"),
-            min_fc=Min("estimated_fc"),
-            max_fc=Max("estimated_fc"),
-            avg_fc=Avg("estimated_fc"),
-        )
+        profiler = start_profiler("project-report")
+        engine = ReportEngine(project, version=project.data_version, profiler=profiler)
+        try:
+            with EXPORT_JOBS.track(kind="project-report"):
+                content, renderer = engine.render(
+                    "project-summary-pdf", chart_backend=request.query_params.get("chart_backend") or None
+                )
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            profiler.finish()
 
-        rating_counts = readings_qs.values("rating").annotate(count=Count("id"))
-        good = next((r["count"] for r in rating_counts if r["rating"] == "GOOD"), 0)
-        fair = next((r["count"] for r in rating_counts if r["rating"] == "FAIR"), 0)
-        poor = next((r["count"] for r in rating_counts if r["rating"] == "POOR"), 0)
+        response = HttpResponse(content, content_type=renderer.content_type)
+        response["Content-Disposition"] = f'attachment; filename="sonreb-report-{project.id}.pdf"'
+        return response
 
-        # Histogram values
-        values = list(
-            readings_qs.exclude(estimated_fc__isnull=True).values_list(
-                "estimated_fc", flat=True
-            )
-        )
 
-        # Calibration diagnostics
-        model = (
-            CalibrationModel.objects.filter(project=project).first()
-        )
-        calib_points = CalibrationPoint.objects.filter(project=project)
-        measured = []
-        predicted = []
-        if model:
-            for p in calib_points:
-                if model.use_carbonation and p.carbonation_depth is not None:
-                    pred = (
-                        model.a0
-                        + model.a1 * p.rh_index
-                        + model.a2 * p.upv
-                        + (model.a3 or 0.0) * p.carbonation_depth
-                    )
-                else:
-                    pred = model.a0 + model.a1 * p.rh_index + model.a2 * p.upv
-                measured.append(p.core_fc)
-                predicted.append(pred)
-
-        # Build charts
-        pie_buf = self._pie_image(good, fair, poor)
-        hist_buf = self._hist_image(values, bin_size=2.0)
-        scatter_buf = self._scatter_image(measured, predicted)
-
-        # Build PDF
-        pdf_buf = io.BytesIO()
-        c = canvas.Canvas(pdf_buf, pagesize=A4)
-        width, height = A4
-
-        y = height - 40
-        c.setFont("Helvetica-Bold", 14)
-        c.drawString(40, y, f"SONREB Report - {project.name}")
-        y -= 18
-        c.setFont("Helvetica", 10)
-        c.drawString(40, y, f"Location: {project.location}")
-        y -= 14
-        c.drawString(40, y, f"Readings: {agg['readings_count'] or 0}")
-        y -= 14
-        c.drawString(
-            40,
-            y,
-            f"fc' avg: {agg['avg_fc'] or '--'} | min: {agg['min_fc'] or '--'} | max: {agg['max_fc'] or '--'}",
-        )
-        y -= 20
-
-        if model:
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(40, y, "Calibration Model")
-            y -= 14
-            c.setFont("Helvetica", 10)
-            c.drawString(
-                40,
-                y,
-                f"fc' = {model.a0:.3f} + {model.a1:.4f}*RH + {model.a2:.4f}*UPV"
-                + (f" + {model.a3:.4f}*cd" if model.use_carbonation and model.a3 else ""),
-            )
-            y -= 12
-            c.drawString(
-                40,
-                y,
-                f"R²: {model.r2:.3f} | RMSE: {(model.rmse if model.rmse is not None else '--')}"
-                f" | Points: {model.points_used}",
-            )
-            y -= 12
-            c.drawString(
-                40,
-                y,
-                f"UPV range: {model.upv_min or '--'}–{model.upv_max or '--'} | RH range: {model.rh_min or '--'}–{model.rh_max or '--'}",
-            )
-            if model.use_carbonation:
-                y -= 12
-                c.drawString(
-                    40,
-                    y,
-                    f"Carbonation range: {model.carbonation_min or '--'}–{model.carbonation_max or '--'}",
-                )
-            y -= 10
-        else:
-            c.drawString(40, y, "No calibration model for this project.")
-            y -= 10
+class ProjectBundleView(APIView):
+    """
+    Several dashboard resources of one project in one response, chosen with
+    ``?include=`` (default: all of PARTS). One ownership check serves every
+    part, and summary, ratings and histogram share a single pass over the
+    readings (the reading list itself when ``readings`` is included).
+    """
 
-        # Charts placement
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(40, y, "Charts")
-        y -= 12
+    permission_classes = [IsAuthenticated]
+    PARTS = ("project", "members", "summary", "ratings", "histogram", "calibration_model", "readings", "reports")
+    READING_STATS = ("summary", "ratings", "histogram")
 
-        c.drawImage(ImageReader(pie_buf), 40, y - 170, width=160, height=160, mask="auto")
-        c.drawImage(ImageReader(hist_buf), 220, y - 160, width=200, height=150, mask="auto")
-        y -= 180
-        c.drawImage(ImageReader(scatter_buf), 40, y - 170, width=320, height=160, mask="auto")
+    def get(self, request, pk):
+        include = request.query_params.get("include")
+        parts = [part.strip() for part in include.split(",") if part.strip()] if include else list(self.PARTS)
+        unknown = [part for part in parts if part not in self.PARTS]
+        if unknown:
+            return Response(
+                {"detail": f"Unknown include: {', '.join(unknown)}. Choose from {', '.join(self.PARTS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        c.showPage()
-        c.save()
-        pdf_buf.seek(0)
+        project = Project.objects.filter(pk=pk, owner=request.user).first()
+        if not project:
+            return Response(status=status.HTTP_404_NOT_FOUND)
 
-        response = HttpResponse(pdf_buf.getvalue(), content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="sonreb-report-{project.id}.pdf"'
-        return response
+        bin_size = None
+        if "histogram" in parts:
+            bin_size, error = parse_bin_size(request.query_params)
+            if error:
+                return error
+
+        not_modified_response = not_modified(request, project)
+        if not_modified_response:
+            return not_modified_response
+
+        data = {}
+        if "project" in parts:
+            data["project"] = ProjectSerializer(project).data
+        if "members" in parts:
+            data["members"] = MemberSerializer(project.members.all(), many=True).data
+
+        if "readings" in parts:
+            readings = serialize_reading_list(reading_list_queryset(project.id))
+            data["readings"] = readings
+            rows = ((row["estimated_fc"], row["rating"]) for row in readings)
+        elif any(part in parts for part in self.READING_STATS):
+            rows = Reading.objects.filter(project=project).values_list("estimated_fc", "rating")
+        else:
+            rows = None
+        if rows is not None:
+            agg, values = reading_aggregates(rows)
+            if "summary" in parts:
+                data["summary"] = summary_payload(project.id, agg)
+            if "ratings" in parts:
+                data["ratings"] = ratings_payload(project.id, agg)
+            if "histogram" in parts:
+                data["histogram"] = histogram_payload(project.id, bin_size, values, agg["avg_fc"])
+
+        if "calibration_model" in parts:
+            model = CalibrationModel.objects.filter(project=project).first()
+            data["calibration_model"] = CalibrationModelSerializer(model).data if model else None
+        if "reports" in parts:
+            reports = (
+                Report.objects.filter(project=project)
+                .select_related("project")
+                .annotate(photo_count=Count("photos"))
+                .order_by("-created_at", "-id")
+            )
+            data["reports"] = ReportListSerializer(reports, many=True).data
+
+        data = {part: data[part] for part in self.PARTS if part in data}
+        return with_validators(Response(data), request, project)
@@ -0,0 +1,48 @@
+# backend/apps/readings/async_views.py
+"""
+Async versions of the read-heavy readings endpoints, used when ASYNC_VIEWS=True.
+Responses match the sync views.
+
+The reading list is read through the async ORM. The report summary loads
+the project asynchronously, but ReportEngine (default cache, numpy) is
+synchronous and runs in a thread.
+"""
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .views import ReadingListCreateView, aowned_reading_list, report_summary_payload
+from apps.projects.conditional import not_modified, with_validators
+from apps.projects.models import Project
+from core.async_views import AsyncAPIView
+
+
+class AsyncReadingListCreateView(AsyncAPIView, ReadingListCreateView):
+    """Async GET; POST (estimate + insert) runs the sync implementation in a thread."""
+
+    async def get(self, request):
+        return Response(await aowned_reading_list(request))
+
+    async def post(self, request):
+        return await sync_to_async(super().post)(request)
+
+
+class AsyncReportSummaryView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        project_id = request.query_params.get("project")
+        if not project_id:
+            return Response({"detail": "project query parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
+        project = await Project.objects.filter(id=project_id, owner=request.user).afirst()
+        if project is None:
+            return Response({"detail": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        not_modified_response = not_modified(request, project)
+        if not_modified_response:
+            return not_modified_response
+
+        # The collect/compute pipeline and its caches are synchronous.
+        payload = await sync_to_async(report_summary_payload)(request, project)
+        return with_validators(Response(payload), request, project)
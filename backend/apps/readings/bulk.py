@@ -0,0 +1,111 @@
+# backend/apps/readings/bulk.py
+"""
+Bulk reading ingest.
+
+Estimates are computed for the whole batch at once with the project's latest
+calibration model. On PostgreSQL (psycopg 3) the rows are then streamed with
+``COPY ... FROM STDIN``; other backends fall back to batched ``bulk_create``.
+"""
+import numpy as np
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.calibration.models import CalibrationModel
+from apps.projects.versioning import bump_data_version
+from .models import Reading
+from .utils import get_rating, predict_fc_array
+
+COPY_FIELDS = (
+    "project",
+    "member",
+    "member_text",
+    "location_tag",
+    "upv",
+    "rh_index",
+    "carbonation_depth",
+    "estimated_fc",
+    "rating",
+    "model_used",
+    "created_at",
+)
+BATCH_SIZE = 500
+
+
+def estimate_fc(project, upv, rh_index, carbonation_depth) -> tuple[np.ndarray, str]:
+    """Array counterpart of ``compute_estimated_fc`` for many readings."""
+    upv = np.asarray(upv, dtype=float)
+    rh_index = np.asarray(rh_index, dtype=float)
+    model = CalibrationModel.objects.filter(project=project).order_by("-created_at").first()
+    if model is None:
+        return 0.005 * upv + 0.25 * rh_index, "Default SonReb Model"
+
+    # compute_estimated_fc only applies carbonation for positive depths.
+    carb = np.array([c if c is not None and c > 0 else np.nan for c in carbonation_depth], dtype=float)
+    estimated = predict_fc_array(model, upv, rh_index, carb)
+    invalid = np.flatnonzero(~np.isfinite(estimated))
+    if invalid.size:
+        raise ValueError(
+            f"Reading {int(invalid[0])}: UPV and RH must be positive to apply the SonReb model."
+        )
+    return estimated, "Project Calibrated Model"
+
+
+def build_readings(project, rows: list[dict]) -> list[Reading]:
+    """
+    ``rows`` are validated dicts with member (id or None), member_text,
+    location_tag, upv, rh_index and carbonation_depth.
+    """
+    estimated, model_used = estimate_fc(
+        project,
+        [row["upv"] for row in rows],
+        [row["rh_index"] for row in rows],
+        [row.get("carbonation_depth") for row in rows],
+    )
+    now = timezone.now()
+    return [
+        Reading(
+            project=project,
+            member_id=row.get("member"),
+            member_text=row.get("member_text") or "",
+            location_tag=row.get("location_tag") or "",
+            upv=row["upv"],
+            rh_index=row["rh_index"],
+            carbonation_depth=row.get("carbonation_depth"),
+            estimated_fc=float(fc),
+            rating=get_rating(float(fc), project.design_fc),
+            model_used=model_used,
+            created_at=now,
+        )
+        for row, fc in zip(rows, estimated)
+    ]
+
+
+def copy_supported() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def _copy_readings(readings: list[Reading]):
+    fields = [Reading._meta.get_field(name) for name in COPY_FIELDS]
+    table = connection.ops.quote_name(Reading._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+            for reading in readings:
+                copy.write_row([getattr(reading, field.attname) for field in fields])
+
+
+def insert_readings(readings: list[Reading]) -> int:
+    """Insert ``readings`` in one transaction and return how many were written."""
+    if not readings:
+        return 0
+    with transaction.atomic():
+        if copy_supported():
+            _copy_readings(readings)
+        else:
+            Reading.objects.bulk_create(readings, batch_size=BATCH_SIZE)
+        bump_data_version(*{reading.project_id for reading in readings})
+    return len(readings)
@@ -0,0 +1,148 @@
+# backend/apps/readings/columnar.py
+"""
+Columnar (Parquet / Arrow IPC) export of the raw readings and calibration
+point tables.
+
+Rows are pulled from the database in keyset-paginated ``values_list`` chunks
+and appended to the writer one record batch at a time, so memory stays flat
+no matter how many readings a project has.
+"""
+from apps.calibration.models import CalibrationPoint
+from .models import Reading
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.file", "arrow"),
+}
+
+# (output column, ORM lookup, arrow type name)
+READING_COLUMNS = [
+    ("id", "id", "int64"),
+    ("project_id", "project_id", "int64"),
+    ("member_id", "member_id", "int64"),
+    ("member_label", "member__member_id", "string"),
+    ("member_text", "member_text", "string"),
+    ("location_tag", "location_tag", "string"),
+    ("upv", "upv", "float64"),
+    ("rh_index", "rh_index", "float64"),
+    ("carbonation_depth", "carbonation_depth", "float64"),
+    ("estimated_fc", "estimated_fc", "float64"),
+    ("rating", "rating", "string"),
+    ("model_used", "model_used", "string"),
+    ("created_at", "created_at", "timestamp"),
+]
+
+CALIBRATION_POINT_COLUMNS = [
+    ("id", "id", "int64"),
+    ("project_id", "project_id", "int64"),
+    ("member_id", "member_id", "int64"),
+    ("member_label", "member__member_id", "string"),
+    ("upv", "upv", "float64"),
+    ("rh_index", "rh_index", "float64"),
+    ("carbonation_depth", "carbonation_depth", "float64"),
+    ("core_fc", "core_fc", "float64"),
+    ("notes", "notes", "string"),
+    ("created_at", "created_at", "timestamp"),
+]
+
+TABLES = {
+    "readings": (Reading, READING_COLUMNS),
+    "calibration_points": (CalibrationPoint, CALIBRATION_POINT_COLUMNS),
+}
+
+
+def pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa
+        import pyarrow.parquet  # noqa
+        return True
+    except Exception:
+        return False
+
+
+def _arrow_type(pa, name: str):
+    if name == "timestamp":
+        return pa.timestamp("us", tz="UTC")
+    return getattr(pa, name)()
+
+
+def build_schema(columns):
+    import pyarrow as pa
+
+    return pa.schema([(name, _arrow_type(pa, type_name)) for name, _, type_name in columns])
+
+
+def iter_value_chunks(queryset, lookups, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield lists of ``values_list`` tuples ordered by primary key.
+
+    Uses keyset pagination (``id > last_id``) rather than OFFSET so every
+    chunk is a single indexed range scan.
+    """
+    if "id" not in lookups:
+        raise ValueError("lookups must include 'id' for keyset pagination.")
+    id_pos = lookups.index("id")
+    base = queryset.order_by("id").values_list(*lookups)
+    last_id = None
+    while True:
+        qs = base if last_id is None else base.filter(id__gt=last_id)
+        rows = list(qs[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1][id_pos]
+
+
+def iter_record_batches(queryset, columns, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    import pyarrow as pa
+
+    schema = build_schema(columns)
+    lookups = [lookup for _, lookup, _ in columns]
+    for rows in iter_value_chunks(queryset, lookups, chunk_size):
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(zip(*rows), schema)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_columnar(queryset, columns, sink, fmt: str = "parquet", chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream ``queryset`` into ``sink`` (a writable binary file object) as
+    Parquet or Arrow IPC. Returns the number of rows written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported columnar format: {fmt}")
+
+    schema = build_schema(columns)
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        write = writer.write_batch
+    else:
+        writer = pa.ipc.new_file(sink, schema)
+        write = writer.write_batch
+
+    rows_written = 0
+    try:
+        for batch in iter_record_batches(queryset, columns, chunk_size):
+            write(batch)
+            rows_written += batch.num_rows
+    finally:
+        writer.close()
+    return rows_written
+
+
+def export_table(project, table: str, sink, fmt: str = "parquet", chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    try:
+        model, columns = TABLES[table]
+    except KeyError:
+        raise ValueError(f"Unknown table: {table}")
+    queryset = model.objects.filter(project=project)
+    return write_columnar(queryset, columns, sink, fmt=fmt, chunk_size=chunk_size)
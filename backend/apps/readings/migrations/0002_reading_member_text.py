@@ -2,6 +2,8 @@
 
 from django.db import migrations, models
 
+from ._operations import AddFieldIfMissing
+
 
 class Migration(migrations.Migration):
 
@@ -10,7 +12,7 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.AddField(
+        AddFieldIfMissing(
             model_name='reading',
             name='member_text',
             field=models.CharField(blank=True, max_length=255),
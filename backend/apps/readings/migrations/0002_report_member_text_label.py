@@ -1,5 +1,7 @@
 from django.db import migrations, models
 
+from ._operations import AddFieldIfMissing
+
 
 class Migration(migrations.Migration):
 
@@ -8,7 +10,7 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.AddField(
+        AddFieldIfMissing(
             model_name="reading",
             name="member_text",
             field=models.CharField(blank=True, max_length=255, verbose_name="Member"),
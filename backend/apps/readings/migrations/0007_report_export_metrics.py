@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readings', '0006_readingfolder'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='export_metrics',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_structure_fields'),
+        ('readings', '0007_report_export_metrics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reading',
+            index=models.Index(fields=['project', 'created_at'], name='reading_project_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reading',
+            index=models.Index(fields=['project', 'estimated_fc'], name='reading_project_fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reading',
+            index=models.Index(fields=['project', 'rating', 'estimated_fc'], name='reading_project_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reading',
+            index=models.Index(fields=['project', 'location_tag'], name='reading_project_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['project', 'created_at'], name='report_project_created_idx'),
+        ),
+    ]
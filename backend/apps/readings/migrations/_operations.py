@@ -0,0 +1,24 @@
+# backend/apps/readings/migrations/_operations.py
+from django.db import migrations
+
+
+class AddFieldIfMissing(migrations.AddField):
+    """
+    0002_reading_member_text and 0002_report_member_text_label both add
+    ``reading.member_text`` on parallel branches. SQLite rebuilds the table and
+    tolerates the duplicate; other backends fail with "column already exists",
+    so skip the schema change when the column is already there.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        with schema_editor.connection.cursor() as cursor:
+            columns = {
+                col.name
+                for col in schema_editor.connection.introspection.get_table_description(
+                    cursor, model._meta.db_table
+                )
+            }
+        if model._meta.get_field(self.name).column in columns:
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
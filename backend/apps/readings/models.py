@@ -1,9 +1,10 @@
 # backend/apps/readings/models.py
 from django.db import models
 from apps.projects.models import Project, Member
+from apps.projects.versioning import VersionedDeleteMixin
 
 
-class Reading(models.Model):
+class Reading(VersionedDeleteMixin, models.Model):
     RATING_CHOICES = [
         ("GOOD", "GOOD"),
         ("FAIR", "FAIR"),
@@ -31,6 +32,18 @@ class Reading(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Per-project listings ordered by -created_at.
+            models.Index(fields=["project", "created_at"], name="reading_project_created_idx"),
+            # fc range filters, histograms and pass/fail counts.
+            models.Index(fields=["project", "estimated_fc"], name="reading_project_fc_idx"),
+            # Rating counts; covers the summary aggregate (min/max/avg fc) too.
+            models.Index(fields=["project", "rating", "estimated_fc"], name="reading_project_rating_idx"),
+            # Derived folders group by location_tag.
+            models.Index(fields=["project", "location_tag"], name="reading_project_location_idx"),
+        ]
+
     def __str__(self):
         label = self.member.member_id if self.member else (self.member_text or "No member")
         return f"{self.project.name} - {label} - {self.estimated_fc:.1f} MPa"
@@ -57,14 +70,21 @@ class Report(models.Model):
     )
     pdf_url = models.CharField(max_length=512, blank=True)
     csv_url = models.CharField(max_length=512, blank=True)
+    # Per-section timings of the last export (see core.instrumentation)
+    export_metrics = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "created_at"], name="report_project_created_idx"),
+        ]
+
     def __str__(self):
         return f"Report: {self.title} ({self.project.name})"
 
 
-class ReportPhoto(models.Model):
+class ReportPhoto(VersionedDeleteMixin, models.Model):
     report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="photos")
     image_url = models.CharField(max_length=512)
     caption = models.CharField(max_length=255, blank=True)
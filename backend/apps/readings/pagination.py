@@ -0,0 +1,45 @@
+# backend/apps/readings/pagination.py
+from urllib.parse import parse_qs, urlparse
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class ReportCursorPagination(CursorPagination):
+    """
+    Keyset pagination for report listings, newest first.
+
+    Opt-in: pagination only kicks in when the client sends ``limit`` or
+    ``cursor`` so the mobile app can keep consuming a plain JSON array. The
+    body stays a list and the next/previous cursors travel in the ``Link``
+    header (plus ``X-Next-Cursor`` for clients that don't parse links).
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = None
+    default_page_size = 50
+    page_size_query_param = "limit"
+    max_page_size = 200
+
+    def get_page_size(self, request):
+        page_size = super().get_page_size(request)
+        if page_size is None and self.cursor_query_param in request.query_params:
+            return self.default_page_size
+        return page_size
+
+    def get_paginated_response(self, data):
+        response = Response(data)
+        links = []
+        next_link = self.get_next_link()
+        previous_link = self.get_previous_link()
+        if next_link:
+            links.append(f'<{next_link}>; rel="next"')
+            response["X-Next-Cursor"] = self._cursor_from_link(next_link)
+        if previous_link:
+            links.append(f'<{previous_link}>; rel="prev"')
+        if links:
+            response["Link"] = ", ".join(links)
+        return response
+
+    def _cursor_from_link(self, link):
+        return parse_qs(urlparse(link).query).get(self.cursor_query_param, [""])[0]
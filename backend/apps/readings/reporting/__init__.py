@@ -0,0 +1,14 @@
+# backend/apps/readings/reporting/__init__.py
+from .collect import collect_report_data, normalize_filters
+from .compute import compute_report
+from .engine import ReportEngine
+from .renderers import RENDERERS, get_renderer
+
+__all__ = [
+    "ReportEngine",
+    "collect_report_data",
+    "compute_report",
+    "get_renderer",
+    "normalize_filters",
+    "RENDERERS",
+]
@@ -0,0 +1,255 @@
+# backend/apps/readings/reporting/charts.py
+"""
+Chart drawing for PDF renderers.
+
+Renderers describe *what* to draw (pie slices, histogram values, scatter
+points) and a chart backend decides *how* it lands on the ReportLab canvas:
+``vector`` (default) draws native ReportLab graphics, ``matplotlib``
+rasterises a figure to PNG.
+"""
+import io
+
+import numpy as np
+from django.conf import settings
+from reportlab.graphics import renderPDF
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing, Group, String
+from reportlab.graphics.widgets.markers import makeMarker
+from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
+
+RATING_COLORS = {"GOOD": "#34d399", "FAIR": "#fbbf24", "POOR": "#f87171"}
+NO_DATA_COLOR = "#94a3b8"
+
+
+def matplotlib_available():
+    try:
+        import matplotlib  # noqa
+        return True
+    except Exception:
+        return False
+
+
+class MatplotlibCharts:
+    """Rasterised charts: render each figure to PNG and embed it."""
+
+    name = "matplotlib"
+
+    def available(self):
+        return matplotlib_available()
+
+    def _pyplot(self):
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        return plt
+
+    def _draw_figure(self, c, fig, x, y, width, height, tight=True):
+        plt = self._pyplot()
+        buf = io.BytesIO()
+        if tight:
+            fig.tight_layout()
+        fig.savefig(buf, format="png", transparent=True)
+        plt.close(fig)
+        buf.seek(0)
+        c.drawImage(ImageReader(buf), x, y, width=width, height=height, preserveAspectRatio=True, mask="auto")
+
+    def pie(self, c, x, y, width, height, slices, show_labels=True):
+        """``slices`` is a list of (label, value, color); zero slices are dropped."""
+        plt = self._pyplot()
+        slices = [s for s in slices if s[1] > 0]
+        if not slices:
+            slices = [("NO DATA", 1, NO_DATA_COLOR)]
+        fig, ax = plt.subplots(figsize=(width / 72.0, height / 72.0))
+        ax.pie(
+            [s[1] for s in slices],
+            labels=[s[0] for s in slices] if show_labels else None,
+            colors=[s[2] for s in slices],
+            autopct=lambda pct: f"{pct:.1f}%",
+            startangle=90,
+            textprops={"fontsize": 8, "color": "#0f172a"},
+        )
+        ax.axis("equal")
+        self._draw_figure(c, fig, x, y, width, height)
+
+    def histogram(self, c, x, y, width, height, values, bins, xlabel="Estimated fc' (MPa)"):
+        plt = self._pyplot()
+        fig, ax = plt.subplots(figsize=(width / 72.0, height / 72.0))
+        if len(values):
+            ax.hist(values, bins=bins, color="#34d399", edgecolor="#0f172a", alpha=0.8)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel("Count")
+        else:
+            ax.text(0.5, 0.5, "No readings", ha="center", va="center")
+        self._draw_figure(c, fig, x, y, width, height)
+
+    def scatter(self, c, x, y, width, height, xs, ys, xlabel, ylabel, regression=False, empty_text="No data"):
+        plt = self._pyplot()
+        fig, ax = plt.subplots(figsize=(width / 72.0, height / 72.0))
+        if len(xs):
+            ax.scatter(xs, ys, c="#34d399", edgecolors="#0f172a")
+            min_xy, max_xy = min(list(xs) + list(ys)), max(list(xs) + list(ys))
+            # identity reference
+            ax.plot([min_xy, max_xy], [min_xy, max_xy], "k--", lw=1, alpha=0.5, label="y = x")
+            if regression and len(xs) >= 2:
+                m, b = np.polyfit(xs, ys, 1)
+                ax.plot(
+                    [min_xy, max_xy],
+                    [m * min_xy + b, m * max_xy + b],
+                    color="#60a5fa",
+                    lw=1.2,
+                    alpha=0.9,
+                    label="Regression",
+                )
+                ax.legend(fontsize=7)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+        else:
+            ax.text(0.5, 0.5, empty_text, ha="center", va="center")
+        self._draw_figure(c, fig, x, y, width, height)
+
+
+class VectorCharts:
+    """
+    Native ReportLab vector charts drawn straight onto the canvas: no figure
+    creation, PNG encoding or image decoding, and much smaller PDFs.
+    """
+
+    name = "vector"
+    font = "Helvetica"
+    font_size = 7
+
+    def available(self):
+        return True
+
+    def _label(self, drawing, x, y, text, angle=0, anchor="middle"):
+        label = String(0, 0, text, fontName=self.font, fontSize=self.font_size, textAnchor=anchor)
+        if angle:
+            group = Group(label)
+            group.translate(x, y)
+            group.rotate(angle)
+            drawing.add(group)
+        else:
+            label.x, label.y = x, y
+            drawing.add(label)
+
+    def _no_data(self, c, x, y, width, height, text):
+        drawing = Drawing(width, height)
+        self._label(drawing, width / 2, height / 2, text)
+        renderPDF.draw(drawing, c, x, y)
+
+    def pie(self, c, x, y, width, height, slices, show_labels=True):
+        slices = [s for s in slices if s[1] > 0]
+        if not slices:
+            slices = [("NO DATA", 1, NO_DATA_COLOR)]
+        total = float(sum(s[1] for s in slices))
+
+        drawing = Drawing(width, height)
+        pie = Pie()
+        size = min(width, height) * 0.6
+        pie.x = (width - size) / 2
+        pie.y = (height - size) / 2
+        pie.width = pie.height = size
+        pie.data = [s[1] for s in slices]
+        pie.startAngle = 90
+        pie.direction = "anticlockwise"
+        pie.sideLabels = True
+        pie.sideLabelsOffset = 0.08
+        if show_labels:
+            pie.labels = [f"{s[0]} {s[1] / total * 100:.1f}%" for s in slices]
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 0.5
+        pie.slices.fontName = self.font
+        pie.slices.fontSize = self.font_size
+        for i, s in enumerate(slices):
+            pie.slices[i].fillColor = colors.HexColor(s[2])
+        drawing.add(pie)
+        renderPDF.draw(drawing, c, x, y)
+
+    def histogram(self, c, x, y, width, height, values, bins, xlabel="Estimated fc' (MPa)"):
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            self._no_data(c, x, y, width, height, "No readings")
+            return
+        counts, edges = np.histogram(values, bins=bins)
+
+        drawing = Drawing(width, height)
+        chart = VerticalBarChart()
+        chart.x, chart.y = 30, 28
+        chart.width, chart.height = width - 40, height - 38
+        chart.data = [[int(v) for v in counts]]
+        chart.barSpacing = 0
+        chart.groupSpacing = 0
+        chart.bars[0].fillColor = colors.HexColor("#34d399")
+        chart.bars[0].strokeColor = colors.HexColor("#0f172a")
+        chart.bars[0].strokeWidth = 0.3
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.labels.fontName = self.font
+        chart.valueAxis.labels.fontSize = self.font_size
+        chart.categoryAxis.categoryNames = [f"{edge:.0f}" for edge in edges[:-1]]
+        chart.categoryAxis.labels.fontName = self.font
+        chart.categoryAxis.labels.fontSize = self.font_size
+        chart.categoryAxis.labels.boxAnchor = "n"
+        drawing.add(chart)
+        self._label(drawing, chart.x + chart.width / 2, 4, xlabel)
+        self._label(drawing, 8, chart.y + chart.height / 2, "Count", angle=90)
+        renderPDF.draw(drawing, c, x, y)
+
+    def scatter(self, c, x, y, width, height, xs, ys, xlabel, ylabel, regression=False, empty_text="No data"):
+        if not len(xs):
+            self._no_data(c, x, y, width, height, empty_text)
+            return
+        xs = [float(v) for v in xs]
+        ys = [float(v) for v in ys]
+        min_xy, max_xy = min(xs + ys), max(xs + ys)
+
+        series = [list(zip(xs, ys)), [(min_xy, min_xy), (max_xy, max_xy)]]
+        if regression and len(xs) >= 2:
+            m, b = np.polyfit(xs, ys, 1)
+            series.append([(min_xy, m * min_xy + b), (max_xy, m * max_xy + b)])
+
+        drawing = Drawing(width, height)
+        plot = LinePlot()
+        plot.x, plot.y = 34, 28
+        plot.width, plot.height = width - 44, height - 38
+        plot.data = series
+        # points only for the scatter series
+        plot.lines[0].strokeColor = None
+        plot.lines[0].symbol = makeMarker("FilledCircle", size=3.5)
+        plot.lines[0].symbol.fillColor = colors.HexColor("#34d399")
+        plot.lines[0].symbol.strokeColor = colors.HexColor("#0f172a")
+        plot.lines[0].symbol.strokeWidth = 0.3
+        # identity reference
+        plot.lines[1].strokeColor = colors.HexColor("#64748b")
+        plot.lines[1].strokeWidth = 0.7
+        plot.lines[1].strokeDashArray = (3, 2)
+        if len(series) > 2:
+            plot.lines[2].strokeColor = colors.HexColor("#60a5fa")
+            plot.lines[2].strokeWidth = 1.2
+        for axis in (plot.xValueAxis, plot.yValueAxis):
+            axis.labels.fontName = self.font
+            axis.labels.fontSize = self.font_size
+        drawing.add(plot)
+        self._label(drawing, plot.x + plot.width / 2, 4, xlabel)
+        self._label(drawing, 8, plot.y + plot.height / 2, ylabel, angle=90)
+        renderPDF.draw(drawing, c, x, y)
+
+
+CHART_BACKENDS = {
+    "vector": VectorCharts,
+    "matplotlib": MatplotlibCharts,
+}
+
+DEFAULT_CHART_BACKEND = "vector"
+
+
+def get_chart_backend(name=None):
+    name = name or getattr(settings, "REPORT_CHART_BACKEND", DEFAULT_CHART_BACKEND)
+    backend = CHART_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"chart backend must be one of {'|'.join(CHART_BACKENDS)}")
+    return backend()
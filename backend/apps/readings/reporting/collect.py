@@ -0,0 +1,155 @@
+# backend/apps/readings/reporting/collect.py
+"""
+Data-collection stage: one batched set of queries per report.
+
+Everything downstream (compute, renderers) works on the plain dict returned
+here, so it can be pickled into the cache and never touches the ORM again.
+"""
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, NullIf
+
+from apps.calibration.models import CalibrationModel, CalibrationPoint
+from ..models import Reading, ReportPhoto
+
+FILTER_KEYS = ("folder", "filter_element", "filter_location", "filter_fc_min", "filter_fc_max")
+
+PROJECT_FIELDS = ("id", "name", "location", "client", "structure_age", "latitude", "longitude", "design_fc")
+
+MODEL_FIELDS = (
+    "id",
+    "a0",
+    "a1",
+    "a2",
+    "a3",
+    "r2",
+    "rmse",
+    "points_used",
+    "use_carbonation",
+    "upv_min",
+    "upv_max",
+    "rh_min",
+    "rh_max",
+    "carbonation_min",
+    "carbonation_max",
+)
+
+REPORT_FIELDS = (
+    "id",
+    "title",
+    "folder",
+    "date_range",
+    "company",
+    "client_name",
+    "engineer_name",
+    "engineer_title",
+    "engineer_license",
+    "logo_url",
+    "signature_url",
+)
+
+READING_COLUMNS = (
+    "id",
+    "location_tag",
+    "member_label",
+    "upv",
+    "rh_index",
+    "carbonation_depth",
+    "estimated_fc",
+    "rating",
+)
+
+CORE_COLUMNS = ("id", "core_fc", "upv", "rh_index", "carbonation_depth")
+
+
+def normalize_filters(params) -> dict:
+    """Pick the report filters out of query params / request data."""
+    filters = {}
+    for key in FILTER_KEYS:
+        value = params.get(key) if params is not None else None
+        filters[key] = value if value not in [None, ""] else None
+    return filters
+
+
+def filter_readings(readings, filters: dict):
+    # Folder is treated as a location label (best-effort).
+    if filters.get("folder"):
+        readings = readings.filter(location_tag__icontains=filters["folder"])
+    if filters.get("filter_element"):
+        element = filters["filter_element"]
+        readings = readings.filter(Q(member_text__icontains=element) | Q(member__member_id__icontains=element))
+    if filters.get("filter_location"):
+        readings = readings.filter(location_tag__icontains=filters["filter_location"])
+    if filters.get("filter_fc_min") is not None:
+        try:
+            readings = readings.filter(estimated_fc__gte=float(filters["filter_fc_min"]))
+        except ValueError:
+            pass
+    if filters.get("filter_fc_max") is not None:
+        try:
+            readings = readings.filter(estimated_fc__lte=float(filters["filter_fc_max"]))
+        except ValueError:
+            pass
+    return readings
+
+
+def _columns(rows, names):
+    if not rows:
+        return {name: [] for name in names}
+    return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+
+def collect_report_data(project, report=None, filters=None) -> dict:
+    """
+    Load everything a report needs for ``project`` (and optionally a
+    ``Report`` row for cover details and photos).
+
+    Readings and cores come back column-oriented (dict of lists) so the
+    compute stage can turn them straight into numpy arrays.
+    """
+    filters = normalize_filters(filters)
+    design_fc = project.design_fc or None
+
+    model = CalibrationModel.objects.filter(project=project).values(*MODEL_FIELDS).first()
+
+    readings = filter_readings(Reading.objects.filter(project=project), filters)
+    reading_rows = list(
+        readings.annotate(
+            # Free-text member wins over the FK label, matching the export grid.
+            member_label=Coalesce(NullIf(F("member_text"), Value("")), F("member__member_id"))
+        )
+        .order_by("created_at", "id")
+        .values_list(*READING_COLUMNS)
+    )
+
+    core_rows = list(
+        CalibrationPoint.objects.filter(project=project).order_by("created_at", "id").values_list(*CORE_COLUMNS)
+    )
+
+    # Unfiltered pass/fail for the cover badge, in one aggregate.
+    project_pass_fail = None
+    if design_fc:
+        project_pass_fail = Reading.objects.filter(project=project).aggregate(
+            passed=Count("id", filter=Q(estimated_fc__gte=design_fc)),
+            failed=Count("id", filter=Q(estimated_fc__lt=design_fc)),
+        )
+
+    report_data = None
+    photos = []
+    if report is not None:
+        report_data = {field: getattr(report, field) for field in REPORT_FIELDS}
+        photos = list(
+            ReportPhoto.objects.filter(report=report)
+            .order_by("created_at", "id")
+            .values("id", "image_url", "caption", "location_tag")
+        )
+
+    return {
+        "project": {field: getattr(project, field) for field in PROJECT_FIELDS},
+        "report": report_data,
+        "filters": filters,
+        "model": model,
+        "readings": _columns(reading_rows, READING_COLUMNS),
+        "cores": _columns(core_rows, CORE_COLUMNS),
+        "project_pass_fail": project_pass_fail,
+        "photos": photos,
+    }
@@ -0,0 +1,147 @@
+# backend/apps/readings/reporting/compute.py
+"""
+Compute stage: vectorised predictions and statistics over collected data.
+"""
+import math
+
+import numpy as np
+
+from ..utils import predict_fc_array
+
+WARNING_KEYS = ("rh_low", "rh_high", "upv_low", "upv_high")
+
+
+def _float_array(values):
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def _optional(value):
+    """Convert numpy scalars / NaN into JSON-friendly Python values."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def histogram(values, bin_size: float = 2.0) -> list:
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return []
+    vmin, vmax = float(values.min()), float(values.max())
+    bins = np.arange(vmin, vmax + bin_size, bin_size)
+    counts, edges = np.histogram(values, bins=bins)
+    return [
+        {"lower": float(edges[i]), "upper": float(edges[i + 1]), "count": int(counts[i])}
+        for i in range(len(counts))
+    ]
+
+
+def range_warnings(model, upv, rh_index) -> dict:
+    """Count readings outside the calibrated UPV/RH range of ``model``."""
+    breakdown = dict.fromkeys(WARNING_KEYS, 0)
+    if not model:
+        return breakdown
+    checks = (
+        ("rh_low", rh_index, model.get("rh_min"), np.less),
+        ("rh_high", rh_index, model.get("rh_max"), np.greater),
+        ("upv_low", upv, model.get("upv_min"), np.less),
+        ("upv_high", upv, model.get("upv_max"), np.greater),
+    )
+    for key, values, bound, op in checks:
+        if bound is not None:
+            breakdown[key] = int(np.count_nonzero(op(values, bound)))
+    return breakdown
+
+
+def compute_report(data: dict, bin_size: float = 2.0) -> dict:
+    model = data["model"]
+    readings = data["readings"]
+    cores = data["cores"]
+    design_fc = data["project"]["design_fc"] or 0
+
+    fc = _float_array(readings["estimated_fc"])
+    upv = _float_array(readings["upv"])
+    rh_index = _float_array(readings["rh_index"])
+    ratings = np.array(readings["rating"], dtype=object)
+
+    total_readings = int(fc.size)
+    has_fc = fc[np.isfinite(fc)]
+
+    warnings_breakdown = range_warnings(model, upv, rh_index)
+    warnings = sum(warnings_breakdown.values())
+
+    pass_fail = {"pass": 0, "fail": 0}
+    pass_pct = fail_pct = None
+    if design_fc:
+        pass_fail["pass"] = int(np.count_nonzero(fc >= design_fc))
+        pass_fail["fail"] = int(np.count_nonzero(fc < design_fc))
+        total_pf = pass_fail["pass"] + pass_fail["fail"]
+        if total_pf > 0:
+            pass_pct = pass_fail["pass"] / total_pf
+            fail_pct = pass_fail["fail"] / total_pf
+
+    # Core verification: predictions for every calibration point at once.
+    measured = _float_array(cores["core_fc"])
+    if model and measured.size:
+        predicted = predict_fc_array(
+            model,
+            _float_array(cores["upv"]),
+            _float_array(cores["rh_index"]),
+            _float_array(cores["carbonation_depth"]),
+        )
+    else:
+        predicted = np.full(measured.shape, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        error_pct = np.where(
+            np.isfinite(predicted) & (predicted != 0) & (measured != 0),
+            (predicted - measured) / measured * 100.0,
+            np.nan,
+        )
+
+    core_table = [
+        {
+            "id": core_id,
+            "measured_fc": core_fc,
+            "predicted_fc": _optional(pred),
+            "error_pct": _optional(err),
+            "upv": core_upv,
+            "rh_index": core_rh,
+            "carbonation_depth": carb,
+        }
+        for core_id, core_fc, pred, err, core_upv, core_rh, carb in zip(
+            cores["id"],
+            cores["core_fc"],
+            predicted,
+            error_pct,
+            cores["upv"],
+            cores["rh_index"],
+            cores["carbonation_depth"],
+        )
+    ]
+
+    return {
+        "summary": {
+            "total_readings": total_readings,
+            "total_cores": len(cores["id"]),
+            "mean_estimated_fc": float(has_fc.mean()) if has_fc.size else None,
+            "min_fc": float(has_fc.min()) if has_fc.size else None,
+            "max_fc": float(has_fc.max()) if has_fc.size else None,
+            "quality": {
+                "good": int(np.count_nonzero(ratings == "GOOD")),
+                "fair": int(np.count_nonzero(ratings == "FAIR")),
+                "poor": int(np.count_nonzero(ratings == "POOR")),
+            },
+            "warnings": warnings,
+            "warnings_breakdown": warnings_breakdown,
+            "design_fc": design_fc,
+            "pass_fail": pass_fail,
+            "pass_pct": pass_pct,
+            "fail_pct": fail_pct,
+            "project_pass_fail": data["project_pass_fail"],
+        },
+        "core_verification": core_table,
+        "histogram": histogram(fc, bin_size),
+        "bin_size": bin_size,
+        "scatter": [{"measured": row["measured_fc"], "predicted": row["predicted_fc"]} for row in core_table],
+    }
@@ -0,0 +1,114 @@
+# backend/apps/readings/reporting/engine.py
+"""
+Collect -> compute -> render pipeline shared by every report endpoint.
+
+Each stage's output is cached independently in the default Django cache:
+
+* collect: keyed by project, report, filters and a caller-supplied data
+  ``version``. Without a version we cannot tell whether readings changed,
+  so no stage is cached.
+* compute: keyed by the collect key and the bin size.
+* render: keyed by the collect key, bin size, renderer and its options.
+  Rendered PDFs and CSVs can be large, so this stage is opt-in: only outputs
+  up to settings.REPORT_RENDER_CACHE_MAX_BYTES are cached (0, the default,
+  disables it).
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core import metrics
+from core.instrumentation import NULL_PROFILER
+from .collect import collect_report_data, normalize_filters
+from .compute import compute_report
+from .renderers import get_renderer
+
+CACHE_PREFIX = "report-engine"
+CACHE_TIMEOUT = 60 * 10
+
+
+def _options_key(options: dict) -> str:
+    return hashlib.blake2b(
+        json.dumps(options, sort_keys=True, cls=DjangoJSONEncoder).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+class ReportEngine:
+    def __init__(self, project, report=None, filters=None, version=None, use_cache=True, profiler=None):
+        self.project = project
+        self.report = report
+        self.filters = normalize_filters(filters)
+        self.version = version
+        self.use_cache = use_cache
+        self.profiler = profiler or NULL_PROFILER
+        self._data = None
+        self._stats = {}
+
+    def _cached(self, key, producer, max_bytes=None):
+        if not self.use_cache or key is None:
+            return producer()
+        stage = key.split(":", 1)[0]
+        key = f"{CACHE_PREFIX}:{key}"
+        value = cache.get(key)
+        metrics.CACHE_REQUESTS.inc(cache=f"{CACHE_PREFIX}-{stage}", result="miss" if value is None else "hit")
+        if value is None:
+            value = producer()
+            if max_bytes is None or len(value) <= max_bytes:
+                cache.set(key, value, CACHE_TIMEOUT)
+        return value
+
+    def _key(self, stage, *parts):
+        """Cache key for a stage; every stage derives from the versioned input."""
+        if self.version is None:
+            return None
+        return ":".join(
+            str(part)
+            for part in (
+                stage,
+                self.project.id,
+                self.report.id if self.report else "-",
+                self.version,
+                _options_key(self.filters),
+                *parts,
+            )
+        )
+
+    def collect(self) -> dict:
+        if self._data is None:
+            with self.profiler.section("collect"):
+                self._data = self._cached(
+                    self._key("collect"),
+                    lambda: collect_report_data(self.project, report=self.report, filters=self.filters),
+                )
+        return self._data
+
+    def compute(self, bin_size: float = 2.0) -> dict:
+        if bin_size not in self._stats:
+            data = self.collect()
+            with self.profiler.section("compute"):
+                self._stats[bin_size] = self._cached(
+                    self._key("compute", bin_size), lambda: compute_report(data, bin_size=bin_size)
+                )
+        return self._stats[bin_size]
+
+    def render(self, renderer_name: str, bin_size: float = 2.0, **options) -> tuple[bytes, object]:
+        """Return ``(content, renderer)`` for the named renderer."""
+        renderer = get_renderer(renderer_name, **options)
+        renderer.profiler = self.profiler
+        data = self.collect()
+        stats = self.compute(bin_size=bin_size)
+        max_bytes = getattr(settings, "REPORT_RENDER_CACHE_MAX_BYTES", 0)
+        key = None
+        if max_bytes > 0:
+            key = self._key("render", bin_size, renderer.name, _options_key(options))
+        with self.profiler.section("render"):
+            content = self._cached(key, lambda: renderer.render(data, stats), max_bytes=max_bytes)
+        return content, renderer
+
+    def payload(self, bin_size: float = 2.0) -> dict:
+        """JSON-ready summary payload (no bytes round-trip)."""
+        renderer = get_renderer("json")
+        return renderer.build_payload(self.collect(), self.compute(bin_size=bin_size))
@@ -0,0 +1,808 @@
+# backend/apps/readings/reporting/renderers.py
+"""
+Pluggable output renderers for the reporting engine.
+
+Every renderer takes the collected ``data`` and computed ``stats`` dicts and
+returns bytes; none of them query the database.
+"""
+import csv
+import io
+import json
+import os
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from reportlab.lib.pagesizes import A4, letter
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+from core.instrumentation import NULL_PROFILER
+from .charts import RATING_COLORS, get_chart_backend
+
+
+def image_from_url(url: str):
+    """Resolve a MEDIA_URL link to a local file and open it for ReportLab."""
+    if not url:
+        return None
+    media_prefix = getattr(settings, "MEDIA_URL", None)
+    media_root = getattr(settings, "MEDIA_ROOT", None)
+    if media_prefix and media_root and media_prefix in url:
+        rel = url.split(media_prefix, 1)[-1]
+        path = os.path.join(media_root, rel.replace("/", os.sep))
+        if os.path.exists(path):
+            try:
+                return ImageReader(path)
+            except Exception:
+                return None
+    return None
+
+
+def field_grid(data: dict) -> list:
+    readings = data["readings"]
+    return [
+        {
+            "id": reading_id,
+            "location": location,
+            "member": member,
+            "upv": upv,
+            "rh_index": rh_index,
+            "estimated_fc": fc,
+        }
+        for reading_id, location, member, upv, rh_index, fc in zip(
+            readings["id"],
+            readings["location_tag"],
+            readings["member_label"],
+            readings["upv"],
+            readings["rh_index"],
+            readings["estimated_fc"],
+        )
+    ]
+
+
+def model_equation(model: dict, precision: bool = True) -> str:
+    # a1 is the UPV exponent and a2 the RH exponent (see GenerateModelView).
+    if precision:
+        eq = f"fc = {model['a0']:.4f} * UPV^{model['a1']:.3f} * RH^{model['a2']:.3f}"
+        if model["use_carbonation"] and model["a3"]:
+            eq += f" * Carb^{model['a3']:.3f}"
+        return eq
+    eq = f"fc = {model['a0']} * UPV^{model['a1']} * RH^{model['a2']}"
+    if model["use_carbonation"] and model["a3"]:
+        eq += f" * Carb^{model['a3']}"
+    return eq
+
+
+class BaseRenderer:
+    name = ""
+    content_type = "application/octet-stream"
+    extension = ""
+
+    def __init__(self, **options):
+        self.options = options
+        self.profiler = NULL_PROFILER
+
+    def render(self, data: dict, stats: dict) -> bytes:
+        raise NotImplementedError
+
+
+class JSONRenderer(BaseRenderer):
+    """The payload served by ReportSummaryView."""
+
+    name = "json"
+    content_type = "application/json"
+    extension = "json"
+
+    def build_payload(self, data: dict, stats: dict) -> dict:
+        summary = {
+            key: stats["summary"][key]
+            for key in (
+                "total_readings",
+                "total_cores",
+                "mean_estimated_fc",
+                "quality",
+                "warnings",
+                "warnings_breakdown",
+                "design_fc",
+                "pass_fail",
+                "pass_pct",
+                "fail_pct",
+            )
+        }
+        model = data["model"]
+        return {
+            "project": {"id": data["project"]["id"], "name": data["project"]["name"]},
+            "active_model_id": str(model["id"]) if model else None,
+            "summary": summary,
+            "core_verification": stats["core_verification"],
+            "field_grid": field_grid(data),
+            "histogram": stats["histogram"],
+            "scatter": stats["scatter"],
+        }
+
+    def render(self, data: dict, stats: dict) -> bytes:
+        return json.dumps(self.build_payload(data, stats), cls=DjangoJSONEncoder).encode("utf-8")
+
+
+class CSVRenderer(BaseRenderer):
+    name = "csv"
+    content_type = "text/csv"
+    extension = "csv"
+
+    def render(self, data: dict, stats: dict) -> bytes:
+        project = data["project"]
+        report = data["report"] or {}
+        filters = data["filters"]
+        model = data["model"]
+        summary = stats["summary"]
+        photos = data["photos"]
+        exclusion_notes = self.options.get("exclusion_notes", "")
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(["Report", report.get("title", "")])
+        writer.writerow(["Project", project["name"]])
+        writer.writerow(["Structure age (years)", project["structure_age"]])
+        writer.writerow(["Coordinates", f"{project['latitude']}, {project['longitude']}"])
+        writer.writerow(["Folder", report.get("folder") or ""])
+        writer.writerow(["Date Range", report.get("date_range") or ""])
+        writer.writerow(["Engineer", report.get("engineer_name") or ""])
+        writer.writerow(["Logo URL", report.get("logo_url") or ""])
+        writer.writerow(["Signature URL", report.get("signature_url") or ""])
+        if photos:
+            writer.writerow(["Photos"])
+            writer.writerow(["Image URL", "Caption", "Location"])
+            for ph in photos:
+                writer.writerow([ph["image_url"], ph["caption"] or "", ph["location_tag"] or ""])
+        writer.writerow([])
+        writer.writerow([])
+
+        # Summary
+        writer.writerow(["Summary"])
+        writer.writerow(["Total readings", summary["total_readings"]])
+        writer.writerow(["Total cores", summary["total_cores"]])
+        if summary["mean_estimated_fc"] is not None:
+            writer.writerow(["Mean estimated fc", f"{summary['mean_estimated_fc']:.2f}"])
+        writer.writerow(["Warnings", summary["warnings"]])
+        breakdown = summary["warnings_breakdown"]
+        writer.writerow(["Warnings breakdown"])
+        writer.writerow(
+            [
+                f"RH below min: {breakdown.get('rh_low', 0)}",
+                f"RH above max: {breakdown.get('rh_high', 0)}",
+                f"UPV below min: {breakdown.get('upv_low', 0)}",
+                f"UPV above max: {breakdown.get('upv_high', 0)}",
+            ]
+        )
+        if project["design_fc"]:
+            pass_pct, fail_pct = summary["pass_pct"], summary["fail_pct"]
+            writer.writerow(["Pass/Fail vs design fc", project["design_fc"]])
+            writer.writerow(["Category", "Count", "Percent"])
+            writer.writerow(
+                ["Pass", summary["pass_fail"]["pass"], f"{(pass_pct * 100):.1f}%" if pass_pct is not None else ""]
+            )
+            writer.writerow(
+                ["Fail", summary["pass_fail"]["fail"], f"{(fail_pct * 100):.1f}%" if fail_pct is not None else ""]
+            )
+        writer.writerow([])
+        # Filters / exclusion log
+        writer.writerow(["Filters / Exclusion Log"])
+        writer.writerow(["Folder filter", filters["folder"] or ""])
+        writer.writerow(["Filter element", filters["filter_element"] or ""])
+        writer.writerow(["Filter location", filters["filter_location"] or ""])
+        writer.writerow(["fc_min", filters["filter_fc_min"] or ""])
+        writer.writerow(["fc_max", filters["filter_fc_max"] or ""])
+        writer.writerow(["Exclusion notes", exclusion_notes or ""])
+        writer.writerow([])
+
+        # Active model
+        writer.writerow(["Active Model"])
+        if model:
+            writer.writerow(["Equation", model_equation(model, precision=False)])
+            writer.writerow(["r2", model["r2"], "rmse", model["rmse"]])
+        else:
+            writer.writerow(["No active model"])
+        writer.writerow([])
+
+        # Cores
+        writer.writerow(["Core Verification"])
+        writer.writerow(["ID", "Measured_fc", "Predicted_fc", "% Error", "UPV", "RH", "Carb"])
+        for core in stats["core_verification"]:
+            predicted, err_pct = core["predicted_fc"], core["error_pct"]
+            writer.writerow(
+                [
+                    core["id"],
+                    core["measured_fc"],
+                    f"{predicted:.2f}" if predicted else "",
+                    f"{err_pct:.1f}" if err_pct is not None else "",
+                    core["upv"],
+                    core["rh_index"],
+                    core["carbonation_depth"] or "",
+                ]
+            )
+        writer.writerow([])
+
+        # Readings
+        readings = data["readings"]
+        writer.writerow(["Field Readings"])
+        writer.writerow(["ID", "Location", "Member", "UPV", "RH", "Carb", "Estimated_fc", "Rating"])
+        writer.writerows(
+            [reading_id, location or "", member or "", upv, rh_index, carb or "", fc, rating]
+            for reading_id, location, member, upv, rh_index, carb, fc, rating in zip(
+                readings["id"],
+                readings["location_tag"],
+                readings["member_label"],
+                readings["upv"],
+                readings["rh_index"],
+                readings["carbonation_depth"],
+                readings["estimated_fc"],
+                readings["rating"],
+            )
+        )
+
+        return buffer.getvalue().encode("utf-8")
+
+
+class PDFRenderer(BaseRenderer):
+    name = "pdf"
+    content_type = "application/pdf"
+    extension = "pdf"
+    pagesize = letter
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.charts = get_chart_backend(options.get("chart_backend"))
+
+    def render(self, data: dict, stats: dict) -> bytes:
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=self.pagesize)
+        self.draw(c, data, stats)
+        c.showPage()
+        c.save()
+        return buffer.getvalue()
+
+    def draw(self, c, data: dict, stats: dict):
+        raise NotImplementedError
+
+    def chart(self, kind: str, c, *args, **kwargs):
+        with self.profiler.section("render.charts"):
+            getattr(self.charts, kind)(c, *args, **kwargs)
+
+    def load_image(self, url: str):
+        with self.profiler.section("render.images"):
+            return image_from_url(url)
+
+    def draw_image(self, c, reader, *args, **kwargs):
+        # ReportLab decodes the image lazily, on first draw.
+        with self.profiler.section("render.images"):
+            c.drawImage(reader, *args, **kwargs)
+
+
+class ProjectSummaryPDFRenderer(PDFRenderer):
+    """One-page A4 project overview (ProjectReportView)."""
+
+    name = "project-summary-pdf"
+    pagesize = A4
+
+    def draw(self, c, data: dict, stats: dict):
+        project = data["project"]
+        model = data["model"]
+        summary = stats["summary"]
+        quality = summary["quality"]
+        width, height = self.pagesize
+
+        y = height - 40
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(40, y, f"SONREB Report - {project['name']}")
+        y -= 18
+        c.setFont("Helvetica", 10)
+        c.drawString(40, y, f"Location: {project['location']}")
+        y -= 14
+        c.drawString(40, y, f"Readings: {summary['total_readings']}")
+        y -= 14
+        c.drawString(
+            40,
+            y,
+            f"fc' avg: {summary['mean_estimated_fc'] or '--'} | min: {summary['min_fc'] or '--'}"
+            f" | max: {summary['max_fc'] or '--'}",
+        )
+        y -= 20
+
+        if model:
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(40, y, "Calibration Model")
+            y -= 14
+            c.setFont("Helvetica", 10)
+            c.drawString(40, y, model_equation(model))
+            y -= 12
+            c.drawString(
+                40,
+                y,
+                f"R²: {model['r2']:.3f} | RMSE: {(model['rmse'] if model['rmse'] is not None else '--')}"
+                f" | Points: {model['points_used']}",
+            )
+            y -= 12
+            c.drawString(
+                40,
+                y,
+                f"UPV range: {model['upv_min'] or '--'}–{model['upv_max'] or '--'}"
+                f" | RH range: {model['rh_min'] or '--'}–{model['rh_max'] or '--'}",
+            )
+            if model["use_carbonation"]:
+                y -= 12
+                c.drawString(
+                    40,
+                    y,
+                    f"Carbonation range: {model['carbonation_min'] or '--'}–{model['carbonation_max'] or '--'}",
+                )
+            y -= 10
+        else:
+            c.drawString(40, y, "No calibration model for this project.")
+            y -= 10
+
+        # Charts placement
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(40, y, "Charts")
+        y -= 12
+
+        if not self.charts.available():
+            return
+
+        self.chart(
+            "pie",
+            c,
+            40,
+            y - 170,
+            160,
+            160,
+            [(label, quality[label.lower()], RATING_COLORS[label]) for label in ("GOOD", "FAIR", "POOR")],
+        )
+        values = [v for v in data["readings"]["estimated_fc"] if v is not None]
+        bin_size = stats["bin_size"]
+        bins = max(1, int((max(values) - min(values)) / bin_size)) if values else 1
+        self.chart("histogram", c, 220, y - 160, 200, 150, values, bins)
+        y -= 180
+        points = [(p["predicted"], p["measured"]) for p in stats["scatter"] if p["predicted"] is not None]
+        self.chart(
+            "scatter",
+            c,
+            40,
+            y - 170,
+            320,
+            160,
+            [p[0] for p in points],
+            [p[1] for p in points],
+            "Predicted fc' (MPa)",
+            "Measured fc' (MPa)",
+            empty_text="No calibration points",
+        )
+
+
+class ReportExportPDFRenderer(PDFRenderer):
+    """Full multi-page report export (ReportExportView)."""
+
+    name = "pdf"
+    pagesize = letter
+
+    def draw(self, c, data: dict, stats: dict):
+        self.c = c
+        self.width, self.height = self.pagesize
+        self.y = self.height - 72
+        self.draw_cover(data, stats)
+        self.draw_model(data)
+        self.draw_summary(data, stats)
+        self.draw_filters(data, stats)
+        self.draw_charts(data, stats)
+        self.draw_photos(data)
+        self.draw_core_verification(stats)
+        self.draw_field_grid(data)
+        self.draw_overview(data, stats)
+
+    def new_page_if_below(self, limit):
+        if self.y < limit:
+            self.c.showPage()
+            self.y = self.height - 72
+
+    def draw_cover(self, data, stats):
+        c = self.c
+        project = data["project"]
+        report = data["report"] or {}
+        project_pass_fail = stats["summary"]["project_pass_fail"]
+
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(72, self.y, f"Report: {report.get('title', '')}")
+        logo_reader = self.load_image(report.get("logo_url"))
+        if logo_reader:
+            try:
+                self.draw_image(
+                    c, logo_reader, self.width - 140, self.y - 10, width=64, height=32, preserveAspectRatio=True, mask="auto"
+                )
+            except Exception:
+                pass
+        self.y -= 20
+        c.setFont("Helvetica", 10)
+        c.drawString(72, self.y, f"Project: {project['name']}")
+        c.drawString(
+            72,
+            self.y - 14,
+            f"Age: {project['structure_age']} years  |  Lat/Long: {project['latitude']}, {project['longitude']}",
+        )
+        self.y -= 28
+        for label, key in (
+            ("Folder", "folder"),
+            ("Date Range", "date_range"),
+            ("Company", "company"),
+            ("Client", "client_name"),
+        ):
+            if report.get(key):
+                c.drawString(72, self.y, f"{label}: {report[key]}")
+                self.y -= 14
+        c.drawString(
+            72,
+            self.y,
+            f"Engineer: {report.get('engineer_name') or ''} {report.get('engineer_title') or ''}"
+            f" {report.get('engineer_license') or ''}",
+        )
+        self.y -= 20
+        if project_pass_fail is not None:
+            passed, failed = project_pass_fail["passed"], project_pass_fail["failed"]
+            badge_color = (0.2, 0.8, 0.5) if passed >= failed else (0.8, 0.3, 0.3)
+            c.setFillColorRGB(*badge_color)
+            c.rect(72, self.y - 10, 140, 12, fill=1, stroke=0)
+            c.setFillColorRGB(0, 0, 0)
+            c.drawString(74, self.y, f"Pass {passed} / Fail {failed}")
+            self.y -= 16
+
+    def draw_model(self, data):
+        c = self.c
+        model = data["model"]
+        if not model:
+            return
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Active Model")
+        self.y -= 14
+        c.setFont("Helvetica", 10)
+        c.drawString(72, self.y, model_equation(model))
+        self.y -= 14
+        c.drawString(
+            72, self.y, f"r2 {model['r2'] or 0:.2f} | rmse {model['rmse'] or 0:.2f} | points {model['points_used']}"
+        )
+        self.y -= 14
+
+    def draw_summary(self, data, stats):
+        c = self.c
+        project = data["project"]
+        summary = stats["summary"]
+        warnings = summary["warnings"]
+        breakdown = summary["warnings_breakdown"]
+
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Summary")
+        self.y -= 14
+        c.setFont("Helvetica", 10)
+        # warnings badge + pass/fail badge
+        if warnings > 0:
+            c.setFillColorRGB(0.8, 0.3, 0.3)
+        else:
+            c.setFillColorRGB(0.2, 0.8, 0.5)
+        c.rect(72, self.y - 10, 80, 12, fill=1, stroke=0)
+        c.setFillColorRGB(0, 0, 0)
+        c.drawString(74, self.y, f"Warnings: {warnings}")
+
+        # warnings breakdown table
+        self.y -= 12
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(72, self.y, "Warnings breakdown")
+        self.y -= 12
+        c.setFont("Helvetica", 9)
+        total_warn = max(warnings, 1)
+        rows = [
+            ("RH < min", "rh_low", "#fbbf24"),
+            ("RH > max", "rh_high", "#d97706"),
+            ("UPV < min", "upv_low", "#22d3ee"),
+            ("UPV > max", "upv_high", "#0891b2"),
+        ]
+        c.drawString(72, self.y, "Reason")
+        c.drawString(180, self.y, "Count")
+        c.drawString(240, self.y, "Percent")
+        self.y -= 12
+        for label, key, _ in rows:
+            val = breakdown.get(key, 0)
+            c.drawString(72, self.y, label)
+            c.drawString(180, self.y, str(val))
+            c.drawString(240, self.y, f"{(val / total_warn) * 100:.1f}%")
+            self.y -= 12
+        c.setFont("Helvetica", 10)
+        if warnings > 0 and self.charts.available():
+            self.new_page_if_below(150)
+            slices = [(f"{label} ({breakdown[key]})", breakdown[key], color) for label, key, color in rows]
+            self.chart("pie", c, 72, self.y - 120, 180, 120, slices)
+            self.y -= 130
+
+        # pass/fail against design fc using filtered readings
+        if project["design_fc"]:
+            passed, failed = summary["pass_fail"]["pass"], summary["pass_fail"]["fail"]
+            pass_pct = passed / max(passed + failed, 1)
+            badge_color = (0.2, 0.8, 0.5) if pass_pct >= 0.5 else (0.8, 0.3, 0.3)
+            c.setFillColorRGB(*badge_color)
+            c.rect(160, self.y - 10, 120, 12, fill=1, stroke=0)
+            c.setFillColorRGB(0, 0, 0)
+            c.drawString(162, self.y, f"Pass {passed} / Fail {failed}")
+            # mini pass/fail bar and percentages
+            self.y -= 12
+            bar_w = 180
+            bar_h = 8
+            pass_w = int(bar_w * pass_pct)
+            c.setFillColorRGB(0.2, 0.8, 0.5)
+            c.rect(72, self.y - bar_h, pass_w, bar_h, fill=1, stroke=0)
+            c.setFillColorRGB(0.8, 0.3, 0.3)
+            c.rect(72 + pass_w, self.y - bar_h, bar_w - pass_w, bar_h, fill=1, stroke=0)
+            c.setFillColorRGB(0, 0, 0)
+            c.setFont("Helvetica", 8)
+            c.drawString(72, self.y - bar_h - 10, f"Pass {pass_pct * 100:.1f}% | Fail {(1 - pass_pct) * 100:.1f}%")
+            c.setFont("Helvetica", 10)
+            self.y -= 16
+            # pass/fail table
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(72, self.y, "Pass/Fail vs design fc table")
+            self.y -= 12
+            c.setFont("Helvetica", 9)
+            c.drawString(72, self.y, "Category")
+            c.drawString(180, self.y, "Count")
+            c.drawString(250, self.y, "Percent")
+            self.y -= 12
+            c.drawString(72, self.y, "Pass")
+            c.drawString(180, self.y, str(passed))
+            c.drawString(250, self.y, f"{pass_pct * 100:.1f}%")
+            self.y -= 12
+            c.drawString(72, self.y, "Fail")
+            c.drawString(180, self.y, str(failed))
+            c.drawString(250, self.y, f"{(1 - pass_pct) * 100:.1f}%")
+            self.y -= 16
+            c.drawString(
+                72,
+                self.y,
+                f"Design fc {project['design_fc']} MPa -> Pass {passed} ({pass_pct * 100:.1f}%)"
+                f" / Fail {failed} ({(1 - pass_pct) * 100:.1f}%)",
+            )
+            self.y -= 14
+            if passed + failed > 0 and self.charts.available():
+                self.new_page_if_below(140)
+                slices = [(f"Pass {passed}", passed, "#34d399"), (f"Fail {failed}", failed, "#f87171")]
+                self.chart("pie", c, 72, self.y - 120, 180, 120, slices)
+                self.y -= 130
+        self.y -= 14
+        c.drawString(72, self.y, f"Total readings: {summary['total_readings']} | Total cores: {summary['total_cores']}")
+        self.y -= 14
+        if summary["mean_estimated_fc"] is not None:
+            c.drawString(72, self.y, f"Mean estimated fc: {summary['mean_estimated_fc']:.2f} MPa")
+            self.y -= 14
+        quality = summary["quality"]
+        c.drawString(72, self.y, f"Quality: GOOD {quality['good']} / FAIR {quality['fair']} / POOR {quality['poor']}")
+        self.y -= 20
+
+    def draw_filters(self, data, stats):
+        c = self.c
+        filters = data["filters"]
+        project = data["project"]
+        summary = stats["summary"]
+        exclusion_notes = self.options.get("exclusion_notes", "")
+
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(72, self.y, "Filters / Exclusion Log")
+        self.y -= 12
+        c.setFont("Helvetica", 9)
+        c.drawString(
+            72,
+            self.y,
+            f"Folder: {filters['folder'] or ''}  | Element: {filters['filter_element'] or ''}"
+            f"  | Location: {filters['filter_location'] or ''}",
+        )
+        self.y -= 12
+        c.drawString(72, self.y, f"fc_min: {filters['filter_fc_min'] or ''}  | fc_max: {filters['filter_fc_max'] or ''}")
+        self.y -= 12
+        if exclusion_notes:
+            c.drawString(72, self.y, f"Exclusion notes: {exclusion_notes}")
+            self.y -= 12
+        if project["design_fc"]:
+            passed, failed = summary["pass_fail"]["pass"], summary["pass_fail"]["fail"]
+            c.drawString(
+                72, self.y, f"Pass/Fail vs design fc {project['design_fc']} MPa: PASS {passed} / FAIL {failed}"
+            )
+            self.y -= 14
+            # simple pass/fail bar
+            total_pf = max(passed + failed, 1)
+            bar_width = 250
+            pass_width = bar_width * passed / total_pf
+            c.setFillColorRGB(0.2, 0.8, 0.5)
+            c.rect(72, self.y - 10, pass_width, 8, fill=1, stroke=0)
+            c.setFillColorRGB(0.8, 0.3, 0.3)
+            c.rect(72 + pass_width, self.y - 10, bar_width - pass_width, 8, fill=1, stroke=0)
+            c.setFillColorRGB(0, 0, 0)
+            self.y -= 16
+        c.drawString(72, self.y, f"Warnings: {summary['warnings']}")
+        self.y -= 20
+
+    def draw_charts(self, data, stats):
+        c = self.c
+        if not self.charts.available():
+            return
+        points = [(p["measured"], p["predicted"]) for p in stats["scatter"] if p["predicted"] and p["measured"]]
+        values = [v for v in data["readings"]["estimated_fc"] if v is not None]
+        if points:
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, self.y, "Scatter (Measured vs Predicted)")
+            self.y -= 14
+            self.chart(
+                "scatter",
+                c,
+                72,
+                self.y - 180,
+                250,
+                180,
+                [p[0] for p in points],
+                [p[1] for p in points],
+                "Measured fc'",
+                "Predicted fc'",
+                regression=True,
+            )
+            self.y -= 190
+        if values:
+            c.setFont("Helvetica-Bold", 12)
+            c.drawString(72, self.y, "Histogram of Estimated fc'")
+            self.y -= 14
+            self.chart("histogram", c, 72, self.y - 180, 250, 180, values, bins=8)
+            self.y -= 190
+
+    def draw_photos(self, data):
+        c = self.c
+        photos = data["photos"]
+        if not photos:
+            return
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Photos by Location")
+        self.y -= 16
+        photos_by_loc = {}
+        for ph in photos:
+            photos_by_loc.setdefault(ph["location_tag"] or "Unspecified", []).append(ph)
+        thumb_w, thumb_h = 120, 80
+        gap = 10
+        for loc, plist in photos_by_loc.items():
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(72, self.y, f"Location: {loc}")
+            self.y -= 14
+            x = 72
+            c.setFont("Helvetica", 8)
+            for ph in plist[:4]:
+                img_reader = self.load_image(ph["image_url"])
+                if img_reader:
+                    try:
+                        self.draw_image(
+                            c,
+                            img_reader,
+                            x,
+                            self.y - thumb_h,
+                            width=thumb_w,
+                            height=thumb_h,
+                            preserveAspectRatio=True,
+                            mask="auto",
+                        )
+                        c.drawString(x, self.y - thumb_h - 10, (ph["caption"] or ph["location_tag"] or "Photo")[:30])
+                        x += thumb_w + gap
+                        if x + thumb_w > self.width - 72:
+                            x = 72
+                            self.y -= thumb_h + 24
+                    except Exception:
+                        continue
+            self.y -= thumb_h + 16
+            extra = len(plist) - min(len(plist), 4)
+            if extra > 0:
+                c.setFont("Helvetica", 9)
+                c.drawString(72, self.y, f"Additional photos at {loc}: {extra}")
+                self.y -= 12
+            self.new_page_if_below(120)
+
+    def draw_core_verification(self, stats):
+        c = self.c
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Core Verification (first 5)")
+        self.y -= 14
+        c.setFont("Helvetica", 10)
+        for core in stats["core_verification"][:5]:
+            predicted, err_pct = core["predicted_fc"], core["error_pct"]
+            pred_str = f"{predicted:.2f}" if predicted else "0.00"
+            err_str = f"{err_pct:.1f}%" if err_pct is not None else "N/A"
+            c.drawString(72, self.y, f"Core {core['id']}: lab {core['measured_fc']:.2f} / est {pred_str} / err {err_str}")
+            self.y -= 14
+            self.new_page_if_below(100)
+
+    def draw_field_grid(self, data):
+        c = self.c
+        readings = data["readings"]
+        if not readings["id"]:
+            return
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Field Assessment Grid")
+        self.y -= 14
+
+        def draw_grid_header():
+            c.setFont("Helvetica-Bold", 9)
+            c.drawString(72, self.y, "ID")
+            c.drawString(110, self.y, "Location")
+            c.drawString(220, self.y, "Member")
+            c.drawString(330, self.y, "R")
+            c.drawString(370, self.y, "UPV")
+            c.drawString(430, self.y, "fc est")
+            self.y -= 12
+            c.setFont("Helvetica", 9)
+
+        draw_grid_header()
+        for reading_id, location, member, rh_index, upv, fc in zip(
+            readings["id"],
+            readings["location_tag"],
+            readings["member_label"],
+            readings["rh_index"],
+            readings["upv"],
+            readings["estimated_fc"],
+        ):
+            if self.y < 100:
+                c.showPage()
+                self.y = self.height - 72
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(72, self.y, "Field Assessment Grid (cont.)")
+                self.y -= 14
+                draw_grid_header()
+            c.drawString(72, self.y, str(reading_id))
+            c.drawString(110, self.y, (location or "-")[:18])
+            c.drawString(220, self.y, (member or "-")[:14])
+            c.drawString(330, self.y, f"{rh_index or 0:.1f}")
+            c.drawString(370, self.y, f"{upv or 0:.0f}")
+            c.drawString(430, self.y, f"{fc or 0:.2f}")
+            self.y -= 12
+
+    def draw_overview(self, data, stats):
+        c = self.c
+        report = data["report"] or {}
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, self.y, "Charts Overview")
+        self.y -= 14
+        c.setFont("Helvetica", 10)
+        c.drawString(72, self.y, "Scatter (Measured vs Estimated cores) – see app for visuals.")
+        self.y -= 14
+        for core in stats["core_verification"][:5]:
+            c.drawString(
+                72, self.y, f"Core {core['id']}: measured {core['measured_fc']:.2f} / predicted {core['predicted_fc'] or 0:.2f}"
+            )
+            self.y -= 14
+            self.new_page_if_below(100)
+        c.drawString(72, self.y, "Histogram (estimated fc') – see app for visuals.")
+        self.y -= 14
+        c.drawString(72, self.y, "Add photos/signature on cover:")
+        self.y -= 14
+        signature_url = report.get("signature_url")
+        if signature_url:
+            sig_reader = self.load_image(signature_url)
+            if sig_reader:
+                try:
+                    self.draw_image(c, sig_reader, 72, self.y - 40, width=80, height=40, preserveAspectRatio=True, mask="auto")
+                    self.y -= 50
+                except Exception:
+                    c.drawString(72, self.y, f"Signature: {signature_url}")
+                    self.y -= 14
+            else:
+                c.drawString(72, self.y, f"Signature: {signature_url}")
+                self.y -= 14
+
+
+RENDERERS = {
+    renderer.name: renderer
+    for renderer in (JSONRenderer, CSVRenderer, ReportExportPDFRenderer, ProjectSummaryPDFRenderer)
+}
+
+
+def get_renderer(name: str, **options) -> BaseRenderer:
+    try:
+        renderer_class = RENDERERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown report renderer: {name}")
+    return renderer_class(**options)
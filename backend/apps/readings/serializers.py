@@ -1,5 +1,8 @@
 # backend/apps/readings/serializers.py
-from rest_framework import serializers
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, NullIf
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from .models import Reading, Report, ReportPhoto, ReadingFolder
 
 
@@ -42,6 +45,64 @@ class ReadingSerializer(serializers.ModelSerializer):
         ]
 
 
+def _datetime_formatter():
+    field = serializers.DateTimeField()
+    tz = field.default_timezone()
+    if tz is None or (api_settings.DATETIME_FORMAT or "").lower() != ISO_8601:
+        return field.to_representation
+
+    # DateTimeField.to_representation for aware values (USE_TZ) and ISO 8601
+    # output, without resolving the timezone and format again for every row.
+    def to_iso(value):
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+    return to_iso
+
+
+def _reading_list_values(queryset):
+    return queryset.values(
+        *(name for name in ReadingSerializer.Meta.fields if name not in ("project_name", "member_label")),
+        project_name=F("project__name"),
+        member_label=Coalesce("member__member_id", NullIf("member_text", Value(""))),
+    )
+
+
+def _format_reading_rows(rows: list[dict]) -> list[dict]:
+    to_datetime = _datetime_formatter()
+    for row in rows:
+        if row["created_at"] is not None:
+            row["created_at"] = to_datetime(row["created_at"])
+    return rows
+
+
+def serialize_reading_list(queryset) -> list[dict]:
+    """
+    Read-only fast path for ReadingSerializer(queryset, many=True).data.
+
+    One ``values()`` query with ``project_name`` and ``member_label`` done in
+    SQL and ``created_at`` formatted like DRF's DateTimeField. Renders to the
+    same JSON bytes as the serializer.
+    """
+    return _format_reading_rows(list(_reading_list_values(queryset)))
+
+
+async def aserialize_reading_list(queryset) -> list[dict]:
+    """serialize_reading_list through the async ORM."""
+    return _format_reading_rows([row async for row in _reading_list_values(queryset)])
+
+
+class BulkReadingSerializer(serializers.Serializer):
+    """One row of a bulk ingest; ``member`` is a member id or free text."""
+
+    member = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    member_text = serializers.CharField(required=False, allow_blank=True, max_length=255)
+    location_tag = serializers.CharField(required=False, allow_blank=True, max_length=255)
+    upv = serializers.FloatField()
+    rh_index = serializers.FloatField()
+    carbonation_depth = serializers.FloatField(required=False, allow_null=True)
+
+
 class ReportSerializer(serializers.ModelSerializer):
     project_name = serializers.CharField(source="project.name", read_only=True)
     photos = serializers.SerializerMethodField()
@@ -71,10 +132,28 @@ class ReportSerializer(serializers.ModelSerializer):
             "status",
             "pdf_url",
             "csv_url",
+            "export_metrics",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["created_at", "updated_at", "project_name", "status", "pdf_url", "csv_url"]
+        read_only_fields = [
+            "created_at",
+            "updated_at",
+            "project_name",
+            "status",
+            "pdf_url",
+            "csv_url",
+            "export_metrics",
+        ]
+
+
+class ReportListSerializer(ReportSerializer):
+    """Summary row for report listings: a photo count instead of nested photos."""
+
+    photo_count = serializers.IntegerField(read_only=True)
+
+    class Meta(ReportSerializer.Meta):
+        fields = [f for f in ReportSerializer.Meta.fields if f != "photos"] + ["photo_count"]
 
 
 class ReportPhotoSerializer(serializers.ModelSerializer):
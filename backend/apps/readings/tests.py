@@ -1,3 +1,937 @@
-from django.test import TestCase
+import csv
+import io
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Avg, Q
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from apps.calibration.async_views import AsyncCalibrationDiagnosticsView
+from apps.calibration.models import CalibrationModel, CalibrationPoint
+from apps.calibration.views import CalibrationDiagnosticsView
+from apps.projects.async_views import AsyncProjectHistogramView, AsyncProjectRatingsView, AsyncProjectSummaryView
+from apps.projects.models import Member, Project
+from apps.projects.views import ProjectHistogramView, ProjectRatingsView, ProjectSummaryView
+from core.response_cache import FileBackend, LocalBackend, ResponseCache
+from . import bulk, columnar
+from .columnar import pyarrow_available
+from .async_views import AsyncReadingListCreateView, AsyncReportSummaryView
+from .models import Reading, Report, ReportPhoto
+from .reporting.charts import CHART_BACKENDS
+from .reporting import engine as report_engine
+from .reporting.renderers import RENDERERS, get_renderer
+from .serializers import ReadingSerializer, serialize_reading_list
+from .views import ReadingBulkCreateView, ReadingListCreateView, ReportSummaryView, reading_list_queryset
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+# SQLite: "SCAN readings_reading" without "USING ... INDEX" is a full table scan.
+SQLITE_FULL_SCAN = re.compile(r"\bSCAN (readings_reading|\w+ AS readings_reading)\b(?! USING)")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on readings_reading\b")
+
+
+def seed_project(owner, name, readings=120, cores=6, photos=1):
+    project = Project.objects.create(owner=owner, name=name, location="Site", design_fc=21)
+    member = Member.objects.create(project=project, member_id="C1", type="Column")
+    for i in range(cores):
+        CalibrationPoint.objects.create(
+            project=project, member=member, upv=3600 + i * 100, rh_index=28 + i, core_fc=18 + i * 2
+        )
+    CalibrationModel.objects.create(
+        project=project, a0=0.01, a1=0.9, a2=0.5, r2=0.8, rmse=0.1, points_used=cores,
+        upv_min=3600, upv_max=4400, rh_min=26, rh_max=44,
+    )
+    Reading.objects.bulk_create(
+        Reading(
+            project=project,
+            member=member if i % 2 else None,
+            member_text="" if i % 2 else f"B{i}",
+            location_tag=f"L{i % 4}",
+            upv=3500 + i * 7,
+            rh_index=25 + i % 20,
+            estimated_fc=12 + i % 25,
+            rating=("GOOD", "FAIR", "POOR")[i % 3],
+            model_used="Project Calibrated Model",
+        )
+        for i in range(readings)
+    )
+    report = Report.objects.create(project=project, title=f"{name} report")
+    ReportPhoto.objects.bulk_create(
+        ReportPhoto(report=report, image_url=f"http://testserver/media/photo{i}.png") for i in range(photos)
+    )
+    return project, report
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReadingQueryPlanTests(TestCase):
+    """
+    EXPLAIN every query an endpoint sends and fail if the readings table is
+    read with a full scan instead of one of the project-scoped indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Main")
+        # Other projects' readings make a table scan observable.
+        other = User.objects.create_user(username="other@example.com", password="secret123")
+        seed_project(other, "Other", readings=300)
+        cls.reading = Reading.objects.filter(project=cls.project).first()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                return [row[-1] for row in cursor.fetchall()], SQLITE_FULL_SCAN
+            if connection.vendor == "postgresql":
+                # Tiny test tables make seq scans cheapest; ask whether an index *can* serve it.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}")
+                return [row[0] for row in cursor.fetchall()], POSTGRES_FULL_SCAN
+        self.skipTest(f"No query plan check for {connection.vendor}")
+
+    def assert_no_reading_scans(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data, format="json" if method == "post" else None)
+        self.assertLess(response.status_code, 400, f"{method.upper()} {url} -> {response.status_code}")
+
+        selects = [q["sql"] for q in queries if q["sql"].lstrip().upper().startswith("SELECT")]
+        checked = 0
+        for sql in selects:
+            if "readings_reading" not in sql:
+                continue
+            plan, full_scan = self.explain(sql)
+            checked += 1
+            offending = [line for line in plan if full_scan.search(line)]
+            self.assertFalse(
+                offending,
+                f"{method.upper()} {url} scans readings_reading:\n{sql}\n" + "\n".join(plan),
+            )
+        self.assertTrue(checked, f"{method.upper()} {url} sent no readings query")
+
+    def assert_uses_index(self, url, index_name):
+        if connection.vendor != "sqlite":
+            self.skipTest("Index choice is only pinned for SQLite plans")
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        plans = []
+        for sql in (q["sql"] for q in queries if "readings_reading" in q["sql"]):
+            plan, _ = self.explain(sql)
+            plans.extend(plan)
+        self.assertTrue(any(index_name in line for line in plans), f"{url} does not use {index_name}:\n" + "\n".join(plans))
+
+    def test_hot_queries_use_composite_indexes(self):
+        pk = self.project.id
+        self.assert_uses_index(f"/api/readings/?project={pk}", "reading_project_created_idx")
+        self.assert_uses_index(f"/api/readings/readings/folders/derived/?project={pk}", "reading_project_location_idx")
+        self.assert_uses_index(f"/api/projects/{pk}/summary/", "reading_project_rating_idx")
+        self.assert_uses_index(f"/api/projects/{pk}/stats/fc-histogram/", "reading_project_fc_idx")
+
+    def test_reading_list(self):
+        self.assert_no_reading_scans("get", f"/api/readings/?project={self.project.id}")
+
+    def test_reading_detail(self):
+        self.assert_no_reading_scans("get", f"/api/readings/{self.reading.id}/")
+
+    def test_derived_folders(self):
+        self.assert_no_reading_scans("get", f"/api/readings/readings/folders/derived/?project={self.project.id}")
+
+    def test_report_summary(self):
+        self.assert_no_reading_scans("get", f"/api/readings/reports/summary/?project={self.project.id}")
+
+    def test_report_summary_fc_range(self):
+        self.assert_no_reading_scans(
+            "get", f"/api/readings/reports/summary/?project={self.project.id}&filter_fc_min=15&filter_fc_max=30"
+        )
+
+    def test_report_export_csv(self):
+        self.assert_no_reading_scans("post", "/api/readings/reports/export/", {"report_id": self.report.id, "format": "csv"})
+
+    def test_report_export_pdf(self):
+        self.assert_no_reading_scans("post", "/api/readings/reports/export/", {"report_id": self.report.id})
+
+    def test_columnar_export(self):
+        if not pyarrow_available():
+            self.skipTest("pyarrow is not installed")
+        self.assert_no_reading_scans("get", f"/api/readings/export/columnar/?project={self.project.id}&table=readings")
+
+    def test_project_summary(self):
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/summary/")
+
+    def test_project_ratings(self):
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/stats/ratings/")
+
+    def test_project_histogram(self):
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/stats/fc-histogram/")
+
+    def test_project_report_pdf(self):
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/reports/summary/")
+
+    def test_project_bundle(self):
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/bundle/")
+        self.assert_no_reading_scans("get", f"/api/projects/{self.project.id}/bundle/?include=summary,histogram")
+
+
+class ConditionalGetTests(TestCase):
+    """Dashboard polls revalidate against the project's data version."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Main", readings=30)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        pk = self.project.id
+        self.urls = [
+            f"/api/projects/{pk}/summary/",
+            f"/api/projects/{pk}/stats/ratings/",
+            f"/api/projects/{pk}/stats/fc-histogram/?bin_size=3",
+            f"/api/readings/reports/summary/?project={pk}",
+            f"/api/projects/{pk}/bundle/",
+        ]
+
+    def poll(self, url, etag):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        return response, len(queries)
+
+    def test_unchanged_project_is_a_single_query_304(self):
+        for url in self.urls:
+            etag = self.client.get(url)["ETag"]
+            response, queries = self.poll(url, etag)
+            self.assertEqual(response.status_code, 304, url)
+            self.assertEqual(response["ETag"], etag, url)
+            self.assertEqual(queries, 1, url)
+
+    def test_writes_change_the_etag(self):
+        url = self.urls[0]
+        writes = [
+            lambda: self.client.post(
+                "/api/readings/", {"project": self.project.id, "upv": 4000, "rh_index": 30}, format="json"
+            ),
+            lambda: Reading.objects.filter(project=self.project).first().delete(),
+            lambda: CalibrationPoint.objects.create(project=self.project, upv=4000, rh_index=30, core_fc=25),
+            lambda: self.client.patch(f"/api/readings/reports/{self.report.id}/", {"notes": "x"}, format="json"),
+        ]
+        etag = self.client.get(url)["ETag"]
+        for write in writes:
+            write()
+            response, _ = self.poll(url, etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+            etag = response["ETag"]
+
+    def test_full_project_save_does_not_write_back_a_stale_version(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        Reading.objects.create(project=self.project, upv=4000, rh_index=30, estimated_fc=20, rating="GOOD")
+        bumped = Project.objects.values_list("data_version", flat=True).get(pk=self.project.pk)
+        stale.name = "Renamed"
+        stale.save()
+        self.assertEqual(Project.objects.values_list("data_version", flat=True).get(pk=self.project.pk), bumped + 1)
+
+    def test_export_bookkeeping_keeps_the_etag(self):
+        url = self.urls[3]
+        etag = self.client.get(url)["ETag"]
+        Report.objects.filter(pk=self.report.pk).first().save(update_fields=["status", "pdf_url"])
+        self.assertEqual(self.poll(url, etag)[0].status_code, 304)
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def backends(self):
+        return [LocalBackend(ttl=60, max_entries=2), FileBackend(self.directory, ttl=60, max_entries=2, prune_every=1)]
+
+    def test_lru_eviction(self):
+        for backend in self.backends():
+            cache = ResponseCache(backend)
+            cache.get_or_compute("a", lambda: 1)
+            cache.get_or_compute("b", lambda: 2)
+            if isinstance(backend, FileBackend):  # mtimes written in the same tick may tie
+                stale = time.time() - 10
+                os.utime(os.path.join(self.directory, "b.pickle"), (stale, stale))
+            cache.get_or_compute("a", lambda: "recomputed")  # refreshes "a"
+            cache.get_or_compute("c", lambda: 3)  # evicts "b"
+            self.assertEqual(cache.get_or_compute("a", lambda: "recomputed"), 1)
+            self.assertEqual(cache.get_or_compute("b", lambda: "recomputed"), "recomputed")
+
+    def test_ttl_expiry(self):
+        for backend in self.backends():
+            backend.ttl = -1
+            cache = ResponseCache(backend)
+            cache.get_or_compute("a", lambda: 1)
+            self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_concurrent_requests_compute_once(self):
+        for backend in self.backends():
+            cache = ResponseCache(backend)
+            calls = []
+            started = threading.Event()
+
+            def producer():
+                calls.append(1)
+                started.set()
+                time.sleep(0.2)
+                return "value"
+
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(cache.get_or_compute("k", producer))) for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(results, ["value"] * 8)
+        self.assertEqual([name for name in os.listdir(self.directory) if name.endswith(".lock")], [])
+
+    def test_file_backend_prunes_every_few_writes(self):
+        cache = ResponseCache(FileBackend(self.directory, ttl=60, max_entries=2, prune_every=4))
+        for key in "abc":
+            cache.get_or_compute(key, lambda: key)
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+        cache.get_or_compute("d", lambda: "d")
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+
+class ProjectBundleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Main", readings=40)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"/api/projects/{self.project.id}/bundle/"
+
+    def test_parts_match_the_standalone_endpoints(self):
+        pk = self.project.id
+        standalone = {
+            "project": f"/api/projects/{pk}/",
+            "members": f"/api/projects/{pk}/members/",
+            "summary": f"/api/projects/{pk}/summary/",
+            "ratings": f"/api/projects/{pk}/stats/ratings/",
+            "histogram": f"/api/projects/{pk}/stats/fc-histogram/?bin_size=3",
+            "calibration_model": f"/api/calibration/active/?project={pk}",
+            "readings": f"/api/readings/?project={pk}",
+            "reports": f"/api/readings/reports/?project={pk}&photos=count",
+        }
+        bundle = self.client.get(self.url, {"bin_size": 3}).json()
+        self.assertEqual(list(bundle), list(standalone))
+        for part, url in standalone.items():
+            expected = self.client.get(url).json()
+            for payload in (expected, bundle[part]):
+                # Python and SQL averages may differ in the last bits.
+                if isinstance(payload, dict) and payload.get("avg_fc") is not None:
+                    payload["avg_fc"] = round(payload["avg_fc"], 9)
+            self.assertEqual(bundle[part], expected, part)
+
+    def test_include_selects_parts_and_scans_readings_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"include": "summary,ratings,histogram"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {"summary", "ratings", "histogram"})
+        self.assertEqual(sum("readings_reading" in q["sql"] for q in queries), 1)
+
+    def test_unknown_part_is_rejected(self):
+        response = self.client.get(self.url, {"include": "summary,secrets"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_other_owners_project_is_not_found(self):
+        other = User.objects.create_user(username="other@example.com", password="secret123")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class ReadingListFastPathTests(TestCase):
+    def test_matches_reading_serializer_bytes(self):
+        user = User.objects.create_user(username="owner@example.com", password="secret123")
+        project, _ = seed_project(user, "Main", readings=30)
+        blank = Member.objects.create(project=project, member_id="", type="Beam")
+        first, second, third = Reading.objects.filter(project=project)[:3]
+        Reading.objects.filter(pk=first.pk).update(member=blank)
+        Reading.objects.filter(pk=second.pk).update(member=None, member_text="")
+        Reading.objects.filter(pk=third.pk).update(carbonation_depth=3.5)
+
+        queryset = reading_list_queryset(project.id)
+        expected = JSONRenderer().render(
+            ReadingSerializer(queryset.select_related("project", "member"), many=True).data
+        )
+        self.assertEqual(JSONRenderer().render(serialize_reading_list(queryset)), expected)
+
+
+def legacy_readings(project, folder=None, filter_element=None, filter_location=None, fc_min=None, fc_max=None):
+    """The filtered readings as the views built them before ReportEngine."""
+    readings = Reading.objects.filter(project=project).order_by("created_at", "id")
+    if folder:
+        readings = readings.filter(location_tag__icontains=folder)
+    if filter_element:
+        readings = readings.filter(
+            Q(member_text__icontains=filter_element) | Q(member__member_id__icontains=filter_element)
+        )
+    if filter_location:
+        readings = readings.filter(location_tag__icontains=filter_location)
+    if fc_min is not None:
+        readings = readings.filter(estimated_fc__gte=fc_min)
+    if fc_max is not None:
+        readings = readings.filter(estimated_fc__lte=fc_max)
+    return readings
+
+
+def legacy_summary(project, readings) -> dict:
+    """ReportSummaryView's figures, computed one query per figure like the pre-engine view."""
+    model = CalibrationModel.objects.filter(project=project).first()
+    breakdown = {"rh_low": 0, "rh_high": 0, "upv_low": 0, "upv_high": 0}
+    for r in readings:
+        breakdown["rh_low"] += r.rh_index < model.rh_min
+        breakdown["rh_high"] += r.rh_index > model.rh_max
+        breakdown["upv_low"] += r.upv < model.upv_min
+        breakdown["upv_high"] += r.upv > model.upv_max
+    pass_fail = {
+        "pass": readings.filter(estimated_fc__gte=project.design_fc).count(),
+        "fail": readings.filter(estimated_fc__lt=project.design_fc).count(),
+    }
+    histogram = []
+    values = np.array([r.estimated_fc for r in readings], dtype=float)
+    if len(values):
+        counts, edges = np.histogram(values, bins=np.arange(values.min(), values.max() + 2.0, 2.0))
+        histogram = [
+            {"lower": float(edges[i]), "upper": float(edges[i + 1]), "count": int(counts[i])}
+            for i in range(len(counts))
+        ]
+    return {
+        "summary": {
+            "total_readings": readings.count(),
+            "total_cores": CalibrationPoint.objects.filter(project=project).count(),
+            "mean_estimated_fc": readings.aggregate(Avg("estimated_fc"))["estimated_fc__avg"],
+            "quality": {q.lower(): readings.filter(rating=q).count() for q in ("GOOD", "FAIR", "POOR")},
+            "warnings": sum(breakdown.values()),
+            "warnings_breakdown": breakdown,
+            "pass_fail": pass_fail,
+        },
+        "field_grid": [
+            {
+                "id": r.id,
+                "location": r.location_tag,
+                "member": r.member_text or (r.member.member_id if r.member else None),
+                "upv": r.upv,
+                "rh_index": r.rh_index,
+                "estimated_fc": r.estimated_fc,
+            }
+            for r in readings
+        ],
+        "histogram": histogram,
+        "predicted": [
+            model.a0 * c.upv ** model.a1 * c.rh_index ** model.a2
+            for c in CalibrationPoint.objects.filter(project=project).order_by("created_at", "id")
+        ],
+    }
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ReportEngineParityTests(TestCase):
+    """The engine-backed endpoints return what the per-view implementations did."""
+
+    FILTERS = [
+        {},
+        {"filter_location": "L1"},
+        {"filter_element": "B1"},
+        {"filter_fc_min": "20", "filter_fc_max": "30"},
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Main", readings=45, photos=2)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def legacy(self, filters):
+        readings = legacy_readings(
+            self.project,
+            filter_element=filters.get("filter_element"),
+            filter_location=filters.get("filter_location"),
+            fc_min=float(filters["filter_fc_min"]) if "filter_fc_min" in filters else None,
+            fc_max=float(filters["filter_fc_max"]) if "filter_fc_max" in filters else None,
+        )
+        return readings, legacy_summary(self.project, readings)
+
+    def test_summary_matches_the_legacy_view(self):
+        for filters in self.FILTERS:
+            payload = self.client.get("/api/readings/reports/summary/", {"project": self.project.id, **filters}).json()
+            _, expected = self.legacy(filters)
+            summary = payload["summary"]
+            self.assertAlmostEqual(summary.pop("mean_estimated_fc"), expected["summary"].pop("mean_estimated_fc"))
+            self.assertEqual({key: summary[key] for key in expected["summary"]}, expected["summary"], filters)
+            self.assertEqual(payload["field_grid"], expected["field_grid"], filters)
+            self.assertEqual(payload["histogram"], expected["histogram"], filters)
+            for core, predicted in zip(payload["core_verification"], expected["predicted"]):
+                self.assertAlmostEqual(core["predicted_fc"], predicted)
+
+    def test_csv_export_matches_the_legacy_export(self):
+        for filters in self.FILTERS:
+            response = self.client.post(
+                "/api/readings/reports/export/",
+                {"report_id": self.report.id, "format": "csv", **filters},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 200)
+            content = b"".join(response.streaming_content) if response.streaming else response.content
+            rows = list(csv.reader(io.StringIO(content.decode("utf-8"))))
+            readings, expected = self.legacy(filters)
+            summary = expected["summary"]
+
+            def row(label):
+                return next(r for r in rows if r and r[0] == label)
+
+            self.assertEqual(row("Total readings"), ["Total readings", str(summary["total_readings"])])
+            self.assertEqual(row("Mean estimated fc"), ["Mean estimated fc", f"{summary['mean_estimated_fc']:.2f}"])
+            self.assertEqual(row("Warnings"), ["Warnings", str(summary["warnings"])])
+            self.assertEqual(row("Pass")[1], str(summary["pass_fail"]["pass"]))
+            self.assertEqual(row("Fail")[1], str(summary["pass_fail"]["fail"]))
+            start = rows.index(["Field Readings"]) + 2
+            legacy_rows = [
+                [
+                    str(r.id),
+                    r.location_tag or "",
+                    r.member_text or (r.member.member_id if r.member else ""),
+                    str(r.upv),
+                    str(r.rh_index),
+                    str(r.carbonation_depth or ""),
+                    str(r.estimated_fc),
+                    r.rating,
+                ]
+                for r in readings
+            ]
+            self.assertEqual(rows[start:], legacy_rows, filters)
+
+    def test_rendered_exports_are_not_cached_by_default(self):
+        engine = report_engine.ReportEngine(self.project, report=self.report, version=self.project.data_version)
+        rendered = []
+        original = report_engine.get_renderer
+
+        def counting_renderer(name, **options):
+            renderer = original(name, **options)
+            render = renderer.render
+            renderer.render = lambda data, stats: rendered.append(name) or render(data, stats)
+            return renderer
+
+        with self.settings(REPORT_RENDER_CACHE_MAX_BYTES=0):
+            report_engine.get_renderer = counting_renderer
+            self.addCleanup(setattr, report_engine, "get_renderer", original)
+            engine.render("csv")
+            engine.render("csv")
+            self.assertEqual(rendered, ["csv", "csv"])
+        with self.settings(REPORT_RENDER_CACHE_MAX_BYTES=10):  # smaller than the CSV
+            engine.render("csv")
+            engine.render("csv")
+            self.assertEqual(len(rendered), 4)
+        with self.settings(REPORT_RENDER_CACHE_MAX_BYTES=10 * 1024 * 1024):
+            engine.render("csv")
+            engine.render("csv")
+            self.assertEqual(len(rendered), 5)
+            # Stages are keyed on the data version, never on the data itself.
+            report_engine.ReportEngine(self.project, report=self.report, version=self.project.data_version).render("csv")
+            self.assertEqual(len(rendered), 5)
+            report_engine.ReportEngine(self.project, report=self.report, version="next").render("csv")
+            self.assertEqual(len(rendered), 6)
+            report_engine.ReportEngine(self.project, report=self.report).render("csv")
+            self.assertEqual(len(rendered), 7)
+
+    def test_renderer_errors_are_not_reported_as_unknown(self):
+        with self.assertRaisesRegex(ValueError, "Unknown report renderer"):
+            get_renderer("nope")
+        with mock.patch.dict(RENDERERS, {"broken": lambda **options: {}["missing"]}):
+            with self.assertRaises(KeyError):
+                get_renderer("broken")
+
+
+class AsyncViewTests(TestCase):
+    """The ASYNC_VIEWS implementations answer exactly like the sync views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.other = User.objects.create_user(username="other@example.com", password="secret123")
+        cls.project, _ = seed_project(cls.user, "Main", readings=30)
+        cls.other_project, _ = seed_project(cls.other, "Other", readings=5)
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def call(self, view_class, url, user=None, kwargs=None, **headers):
+        request = self.factory.get(url, **headers)
+        force_authenticate(request, user=user or self.user)
+        view = view_class.as_view()
+        if view_class.view_is_async:
+            view = async_to_sync(view)
+        response = view(request, **(kwargs or {}))
+        if hasattr(response, "render"):
+            response.render()
+        cache.clear()  # the next call must not be served from the other view's cache
+        return response
+
+    def assertSameResponse(self, sync_view, async_view, url, **options):
+        expected = self.call(sync_view, url, **options)
+        actual = self.call(async_view, url, **options)
+        self.assertEqual(actual.status_code, expected.status_code, url)
+        self.assertEqual(actual.content, expected.content, url)
+        self.assertEqual(actual.get("ETag"), expected.get("ETag"), url)
+        return actual
+
+    def test_reading_list(self):
+        for url in ("/api/readings/", f"/api/readings/?project={self.project.id}",
+                    f"/api/readings/?project={self.other_project.id}"):
+            self.assertSameResponse(ReadingListCreateView, AsyncReadingListCreateView, url)
+        response = self.call(AsyncReadingListCreateView, "/api/readings/")
+        self.assertEqual(len(response.data), 30)
+
+    def test_report_summary(self):
+        for project in (self.project, self.other_project):
+            url = f"/api/readings/reports/summary/?project={project.id}&filter_location=L1"
+            self.assertSameResponse(ReportSummaryView, AsyncReportSummaryView, url)
+
+    def test_project_dashboards(self):
+        pairs = [
+            (ProjectSummaryView, AsyncProjectSummaryView, "summary/"),
+            (ProjectRatingsView, AsyncProjectRatingsView, "stats/ratings/"),
+            (ProjectHistogramView, AsyncProjectHistogramView, "stats/fc-histogram/?bin_size=3"),
+            (ProjectHistogramView, AsyncProjectHistogramView, "stats/fc-histogram/?bin_size=-1"),
+        ]
+        for sync_view, async_view, path in pairs:
+            for project in (self.project, self.other_project):
+                url = f"/api/projects/{project.id}/{path}"
+                response = self.assertSameResponse(sync_view, async_view, url, kwargs={"pk": project.id})
+                if project is self.project and response.status_code == 200:
+                    etag = response["ETag"]
+                    revalidated = self.call(
+                        async_view, url, kwargs={"pk": project.id}, HTTP_IF_NONE_MATCH=etag
+                    )
+                    self.assertEqual(revalidated.status_code, 304, url)
+
+    def test_calibration_diagnostics(self):
+        for project in (self.project, self.other_project, "abc"):
+            url = f"/api/calibration/diagnostics/?project={getattr(project, 'id', project)}"
+            self.assertSameResponse(CalibrationDiagnosticsView, AsyncCalibrationDiagnosticsView, url)
+
+    def test_other_owners_data_is_not_queried(self):
+        calls = [
+            (AsyncCalibrationDiagnosticsView, f"/api/calibration/diagnostics/?project={self.other_project.id}", None),
+            (AsyncProjectSummaryView, f"/api/projects/{self.other_project.id}/summary/", {"pk": self.other_project.id}),
+            (AsyncProjectRatingsView, f"/api/projects/{self.other_project.id}/stats/ratings/", {"pk": self.other_project.id}),
+        ]
+        for view, url, kwargs in calls:
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.call(view, url, kwargs=kwargs).status_code, 404)
+            tables = " ".join(query["sql"] for query in queries)
+            self.assertNotIn("readings_reading", tables, url)
+            self.assertNotIn("calibration_", tables, url)
+
+
+class ColumnarExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, _ = seed_project(cls.user, "Main", readings=25, cores=4)
+        Reading.objects.filter(pk=Reading.objects.filter(project=cls.project).first().pk).update(carbonation_depth=4.5)
+        other = User.objects.create_user(username="other@example.com", password="secret123")
+        cls.other_project, _ = seed_project(other, "Other", readings=3)
+
+    def setUp(self):
+        if not pyarrow_available():
+            self.skipTest("pyarrow is not installed")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def export(self, **params):
+        return self.client.get("/api/readings/export/columnar/", {"project": self.project.id, **params})
+
+    def decode(self, response, fmt):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        content = b"".join(response.streaming_content)
+        if fmt == "parquet":
+            return pq.read_table(io.BytesIO(content)).to_pydict()
+        return pa.ipc.open_file(pa.BufferReader(content)).read_all().to_pydict()
+
+    def test_columns_match_the_tables(self):
+        for table, (model, columns) in columnar.TABLES.items():
+            rows = list(
+                model.objects.filter(project=self.project).order_by("id").values_list(*(c[1] for c in columns))
+            )
+            expected = {name: list(values) for (name, _, _), values in zip(columns, zip(*rows))}
+            for fmt, (content_type, ext) in columnar.FORMATS.items():
+                response = self.export(table=table, file_format=fmt)
+                self.assertEqual(response.status_code, 200, (table, fmt))
+                self.assertEqual(response["Content-Type"], content_type)
+                self.assertIn(f"project_{self.project.id}_{table}.{ext}", response["Content-Disposition"])
+                self.assertEqual(self.decode(response, fmt), expected, (table, fmt))
+
+    def test_chunks_cover_every_row_once(self):
+        sink = io.BytesIO()
+        self.assertEqual(columnar.export_table(self.project, "readings", sink, fmt="arrow", chunk_size=4), 25)
+        import pyarrow as pa
+
+        ids = pa.ipc.open_file(pa.BufferReader(sink.getvalue())).read_all().column("id").to_pylist()
+        expected = Reading.objects.filter(project=self.project).order_by("id").values_list("id", flat=True)
+        self.assertEqual(ids, list(expected))
+
+    def test_rejects_bad_requests(self):
+        self.assertEqual(self.export(table="users").status_code, 400)
+        self.assertEqual(self.export(file_format="xlsx").status_code, 400)
+        response = self.client.get("/api/readings/export/columnar/", {"project": self.other_project.id})
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get("/api/readings/export/columnar/", {"project": "abc"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "Project not found."})
+
+
+class ReportListPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, first = seed_project(cls.user, "Main", readings=3, photos=2)
+        base = timezone.now() - timedelta(days=1)
+        reports = [first] + [Report.objects.create(project=cls.project, title=f"R{i}") for i in range(8)]
+        for i, report in enumerate(reports):
+            # Three reports share each timestamp, so ties are broken by id.
+            Report.objects.filter(pk=report.pk).update(created_at=base + timedelta(minutes=i // 3))
+            ReportPhoto.objects.bulk_create(
+                ReportPhoto(report=report, image_url=f"http://testserver/media/{report.pk}-{n}.png")
+                for n in range(i % 4)
+            )
+        other = User.objects.create_user(username="other@example.com", password="secret123")
+        seed_project(other, "Other", readings=1)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def expected_ids(self):
+        return list(
+            Report.objects.filter(project__owner=self.user).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def pages(self, **params):
+        ids, cursor = [], None
+        while True:
+            query = {"limit": 4, **params, **({"cursor": cursor} if cursor else {})}
+            response = self.client.get("/api/readings/reports/", query)
+            self.assertEqual(response.status_code, 200)
+            self.assertIsInstance(response.json(), list)
+            ids.extend(report["id"] for report in response.json())
+            cursor = response.get("X-Next-Cursor")
+            if not cursor:
+                self.assertNotIn('rel="next"', response.get("Link", ""))
+                return ids
+
+    def test_without_limit_returns_every_report_newest_first(self):
+        response = self.client.get("/api/readings/reports/")
+        self.assertNotIn("Link", response)
+        self.assertEqual([report["id"] for report in response.json()], self.expected_ids())
+
+    def test_cursor_pages_follow_the_listing_order(self):
+        self.assertEqual(self.pages(), self.expected_ids())
+        self.assertEqual(self.pages(photos="count"), self.expected_ids())
+
+    def test_pages_are_stable_while_reports_are_added(self):
+        expected = self.expected_ids()
+        response = self.client.get("/api/readings/reports/", {"limit": 4})
+        ids = [report["id"] for report in response.json()]
+        Report.objects.create(project=self.project, title="Newest")
+        cursor = response["X-Next-Cursor"]
+        while cursor:
+            response = self.client.get("/api/readings/reports/", {"limit": 4, "cursor": cursor})
+            ids.extend(report["id"] for report in response.json())
+            cursor = response.get("X-Next-Cursor")
+        self.assertEqual(ids, expected)
+
+    def test_photo_count(self):
+        counts = {report.id: report.photos.count() for report in Report.objects.filter(project=self.project)}
+        self.assertEqual(set(counts.values()), {0, 1, 2, 3})
+        listed = self.client.get("/api/readings/reports/", {"photos": "count"}).json()
+        self.assertEqual({report["id"]: report["photo_count"] for report in listed}, counts)
+        self.assertNotIn("photos", listed[0])
+        full = self.client.get("/api/readings/reports/").json()
+        self.assertEqual({report["id"]: len(report["photos"]) for report in full}, counts)
+
+
+class ReadingBulkIngestTests(TestCase):
+    URL = "/api/readings/bulk/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, _ = seed_project(cls.user, "Main", readings=0, cores=4)
+        CalibrationModel.objects.filter(project=cls.project).update(use_carbonation=True, a3=-0.1)
+        cls.member = Member.objects.get(project=cls.project)
+        other = User.objects.create_user(username="other@example.com", password="secret123")
+        cls.other_project, _ = seed_project(other, "Other", readings=0, cores=0)
+        cls.other_member = Member.objects.get(project=cls.other_project)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def rows(self):
+        return [
+            {"upv": 4000, "rh_index": 30, "member": str(self.member.id), "location_tag": "L1"},
+            {"upv": 3650.5, "rh_index": 27.5, "carbonation_depth": 2.5, "member": "B7"},
+            {"upv": 4400, "rh_index": 41, "carbonation_depth": 0, "member": str(self.other_member.id)},
+            {"upv": 3800, "rh_index": 35, "carbonation_depth": None},
+        ]
+
+    def post(self, rows, project=None):
+        return self.client.post(self.URL, {"project": (project or self.project).id, "readings": rows}, format="json")
+
+    def version(self, project=None):
+        return Project.objects.values_list("data_version", flat=True).get(pk=(project or self.project).pk)
+
+    def test_rejects_invalid_batches_without_writing(self):
+        too_many = mock.patch.object(ReadingBulkCreateView, "max_rows", 2)
+        cases = [
+            ([], None),
+            ({"upv": 4000, "rh_index": 30}, None),
+            ([{"upv": 4000}, {"upv": "fast", "rh_index": 30}], None),
+            ([{"upv": 4000, "rh_index": 30}, {"upv": -1, "rh_index": 30}], "Reading 1"),
+        ]
+        for rows, detail in cases:
+            response = self.post(rows)
+            self.assertEqual(response.status_code, 400, rows)
+            if detail:
+                self.assertIn(detail, response.json()["detail"])
+        errors = self.post([{"upv": 4000, "rh_index": 30}, {"upv": 4000}]).json()
+        self.assertEqual(errors[0], {})
+        self.assertIn("rh_index", errors[1])
+        with too_many:
+            self.assertEqual(self.post(self.rows()).status_code, 400)
+        self.assertEqual(self.post(self.rows(), project=self.other_project).status_code, 404)
+        self.assertFalse(Reading.objects.exists())
+
+    def test_matches_single_create(self):
+        for project in (self.project, Project.objects.create(owner=self.user, name="Uncalibrated", location="Site")):
+            rows = self.rows()
+            single = []
+            for row in rows:
+                response = self.client.post("/api/readings/", {"project": project.id, **row}, format="json")
+                self.assertEqual(response.status_code, 201)
+                single.append(Reading.objects.get(pk=response.json()["id"]))
+            response = self.post(rows, project=project)
+            self.assertEqual(response.json(), {"project": project.id, "created": len(rows)})
+            batch = Reading.objects.filter(project=project).exclude(pk__in=[r.pk for r in single]).order_by("id")
+            for one, many in zip(single, batch):
+                self.assertAlmostEqual(many.estimated_fc, one.estimated_fc)
+                for field in ("rating", "model_used", "member_id", "member_text", "location_tag", "carbonation_depth"):
+                    self.assertEqual(getattr(many, field), getattr(one, field), field)
+            self.assertEqual(batch.count(), len(rows))
+
+    def test_bumps_the_data_version_once(self):
+        version = self.version()
+        other_version = self.version(self.other_project)
+        self.assertEqual(self.post(self.rows()).status_code, 201)
+        self.assertEqual(self.version(), version + 1)
+        self.assertEqual(self.version(self.other_project), other_version)
+
+    def test_bulk_create_fallback(self):
+        if connection.vendor == "sqlite":
+            self.assertFalse(bulk.copy_supported())
+        rows = self.rows() * 2
+        with mock.patch.object(bulk, "copy_supported", return_value=False), \
+                mock.patch.object(bulk, "BATCH_SIZE", 3), CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.post(rows).status_code, 201)
+        inserts = [q["sql"] for q in queries if q["sql"].startswith("INSERT INTO")]
+        self.assertEqual(len(inserts), 3)
+        self.assertFalse(any(q["sql"].startswith("COPY") for q in queries))
+        self.assertEqual(Reading.objects.filter(project=self.project).count(), len(rows))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ChartBackendTests(TestCase):
+    """Both PDF renderers draw every chart through whichever backend is selected."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Main", readings=30, photos=0)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def render_pdfs(self, name):
+        export = self.client.post(
+            "/api/readings/reports/export/", {"report_id": self.report.id, "chart_backend": name}, format="json"
+        )
+        summary = self.client.get(f"/api/projects/{self.project.id}/reports/summary/", {"chart_backend": name})
+        return [
+            b"".join(export.streaming_content) if export.streaming else export.content,
+            b"".join(summary.streaming_content) if summary.streaming else summary.content,
+        ], [export.status_code, summary.status_code]
+
+    def spy(self, backend, calls) -> ExitStack:
+        stack = ExitStack()
+        for kind in ("pie", "histogram", "scatter"):
+            def record(*args, _kind=kind, _draw=getattr(backend, kind), **kwargs):
+                calls.append(_kind)
+                return _draw(*args, **kwargs)
+
+            stack.enter_context(mock.patch.object(backend, kind, record))
+        return stack
+
+    def test_pdfs_render_with_each_backend(self):
+        for name, backend in CHART_BACKENDS.items():
+            with self.subTest(backend=name):
+                if not backend().available():
+                    self.skipTest(f"{name} charts are not available")
+                cache.clear()
+                calls = []
+                with self.spy(backend, calls):
+                    pdfs, statuses = self.render_pdfs(name)
+                self.assertEqual(statuses, [200, 200])
+                self.assertEqual(set(calls), {"pie", "histogram", "scatter"})
+                for pdf in pdfs:
+                    self.assertTrue(pdf.startswith(b"%PDF"))
+                    # Raster charts are embedded images; vector charts are drawn as paths.
+                    self.assertEqual(b"/Subtype /Image" in pdf, name == "matplotlib")
+
+    def test_unknown_backend_is_rejected(self):
+        self.assertEqual(self.render_pdfs("ascii")[1], [400, 400])
@@ -1,7 +1,9 @@
 # backend/apps/readings/urls.py
+from django.conf import settings
 from django.urls import path
 from .views import (
     ReadingListCreateView,
+    ReadingBulkCreateView,
     ReadingDetailView,
     ReportListCreateView,
     ReportDetailView,
@@ -14,19 +16,27 @@ from .views import (
     ReadingFolderListCreateView,
     ReadingFolderDetailView,
     ReadingFolderDerivedView,
+    ColumnarExportView,
 )
+from .async_views import AsyncReadingListCreateView, AsyncReportSummaryView
+
+# ASYNC_VIEWS selects the async implementations of the read-heavy endpoints.
+ReadingListView = AsyncReadingListCreateView if settings.ASYNC_VIEWS else ReadingListCreateView
+SummaryView = AsyncReportSummaryView if settings.ASYNC_VIEWS else ReportSummaryView
 
 urlpatterns = [
-    path("", ReadingListCreateView.as_view(), name="reading-list-create"),
+    path("", ReadingListView.as_view(), name="reading-list-create"),
+    path("bulk/", ReadingBulkCreateView.as_view(), name="reading-bulk-create"),
     path("<int:pk>/", ReadingDetailView.as_view(), name="reading-detail"),
     path("reports/", ReportListCreateView.as_view(), name="report-list-create"),
     path("reports/<int:pk>/", ReportDetailView.as_view(), name="report-detail"),
     path("reports/export/", ReportExportView.as_view(), name="report-export"),
+    path("export/columnar/", ColumnarExportView.as_view(), name="reading-export-columnar"),
     path("reports/folders/", ReportFolderListView.as_view(), name="report-folders"),
     path("readings/folders/", ReadingFolderListCreateView.as_view(), name="reading-folders"),
     path("readings/folders/derived/", ReadingFolderDerivedView.as_view(), name="reading-folders-derived"),
     path("reports/upload/", ReportUploadView.as_view(), name="report-upload"),
-    path("reports/summary/", ReportSummaryView.as_view(), name="report-summary"),
+    path("reports/summary/", SummaryView.as_view(), name="report-summary"),
     path("reports/photos/", ReportPhotoListCreateView.as_view(), name="report-photo-create"),
     path("reports/photos/<int:pk>/", ReportPhotoDetailView.as_view(), name="report-photo-delete"),
     path("folders/", ReadingFolderListCreateView.as_view(), name="reading-folder-list"),
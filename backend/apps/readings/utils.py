@@ -1,5 +1,8 @@
 # backend/apps/readings/utils.py
 from typing import Optional
+
+import numpy as np
+
 from apps.projects.models import Project
 from apps.calibration.models import CalibrationModel
 
@@ -63,3 +66,27 @@ def get_rating(
     elif estimated_fc >= 17.0:
         return "FAIR"
     return "POOR"
+
+
+def predict_fc_array(model, upv, rh_index, carbonation_depth=None):
+    """
+    Vectorised power-law prediction for many points at once:
+    fc = a0 * UPV^a1 * RH^a2 (* carb^a3 when the model uses carbonation).
+
+    ``model`` may be a CalibrationModel or a dict with the same field names.
+    Returns a float array with NaN where UPV/RH are not positive.
+    """
+    get = model.get if isinstance(model, dict) else lambda key: getattr(model, key)
+    upv = np.asarray(upv, dtype=float)
+    rh_index = np.asarray(rh_index, dtype=float)
+    valid = (upv > 0) & (rh_index > 0)
+
+    predicted = np.full(upv.shape, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        predicted[valid] = get("a0") * upv[valid] ** get("a1") * rh_index[valid] ** get("a2")
+        a3 = get("a3")
+        if get("use_carbonation") and a3 and carbonation_depth is not None:
+            carb = np.asarray(carbonation_depth, dtype=float)
+            apply = valid & np.isfinite(carb) & (carb != 0)
+            predicted[apply] *= carb[apply] ** a3
+    return predicted
@@ -0,0 +1,348 @@
+# backend/benchmarks/loadtest.py
+"""
+End-to-end load test against a running server, driven by a scenario file.
+
+    python manage.py generate_synthetic_data --owners 4 --readings 5000
+    python manage.py runserver --noreload        # or gunicorn/uvicorn
+    python benchmarks/loadtest.py --clients 32 --duration 30
+    python benchmarks/loadtest.py --scenario benchmarks/scenarios/default.json --json out.json
+
+Clients log in as the synthetic owners (<prefix><n>@example.com), discover
+their projects, members and reports, then pick requests from the scenario by
+weight. Paths and bodies may use {project}, {member} and {report}, which are
+filled from the logged-in owner's data. Only the standard library is used so
+it runs from any Python without the backend's dependencies.
+
+Access tokens are short-lived (JWT_ACCESS_MINUTES), so each owner's session
+renews its token through /api/auth/refresh/ shortly before it expires, and a
+request that still gets a 401 is retried once after renewing. Renewals are
+serialized per owner because a refresh token can only be used once; if the
+refresh is refused the session logs in again.
+
+The report lists requests/s, errors and p50/p95/p99 latency per endpoint;
+requests made during --warmup are not counted.
+"""
+import argparse
+import base64
+import http.client
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+DEFAULT_SCENARIO = Path(__file__).resolve().parent / "scenarios" / "default.json"
+PLACEHOLDERS = ("project", "member", "report")
+RENEW_BEFORE_S = 30
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class Connection:
+    """Keep-alive HTTP connection that reconnects once if the server drops it."""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.factory = lambda: cls(parts.hostname, parts.port, timeout=timeout)
+        self.prefix = parts.path.rstrip("/")
+        self.conn = self.factory()
+
+    def request(self, method, path, body=None, token=None):
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        for attempt in (1, 2):
+            try:
+                self.conn.request(method, self.prefix + path, body=payload, headers=headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                if response.getheader("Connection", "").lower() == "close":
+                    self.reset()
+                return response.status, data
+            except (http.client.HTTPException, ConnectionError):
+                self.reset()
+                if attempt == 2:
+                    raise
+
+    def reset(self):
+        self.conn.close()
+        self.conn = self.factory()
+
+
+def token_expiry(token):
+    """The ``exp`` claim of a JWT, read without checking the signature."""
+    try:
+        payload = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["exp"]
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class Session:
+    """One owner's access/refresh tokens, shared by the clients using that owner."""
+
+    def __init__(self, base_url, email, password, timeout):
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.renewals = 0
+        self.logins = 0
+        conn = Connection(base_url, timeout)
+        try:
+            self.login(conn)
+        finally:
+            conn.conn.close()
+
+    def _store(self, pair):
+        self.access = pair["token"]
+        self.refresh = pair.get("refresh")
+        self.expires_at = token_expiry(self.access)
+
+    def login(self, conn):
+        status, data = conn.request("POST", "/api/auth/login/", {"email": self.email, "password": self.password})
+        if status != 200:
+            raise SystemExit(f"Login failed for {self.email}: HTTP {status} {data[:200]!r}")
+        self.logins += 1
+        self._store(json.loads(data))
+
+    def token(self):
+        token = self.access
+        if self.expires_at is not None and time.time() >= self.expires_at - RENEW_BEFORE_S:
+            self.renew(token)
+            token = self.access
+        return token
+
+    def renew(self, stale):
+        """Replace ``stale`` with a fresh access token unless another client already did."""
+        with self.lock:
+            if self.access != stale:
+                return
+            conn = Connection(self.base_url, self.timeout)
+            try:
+                status, data = (None, None)
+                if self.refresh:
+                    status, data = conn.request("POST", "/api/auth/refresh/", {"refresh": self.refresh})
+                if status == 200:
+                    self._store(json.loads(data))
+                    self.renewals += 1
+                else:
+                    self.login(conn)
+            finally:
+                conn.conn.close()
+
+
+def login(base_url, email, password, timeout):
+    auth = Session(base_url, email, password, timeout)
+    conn = Connection(base_url, timeout)
+
+    def get(path):
+        status, data = conn.request("GET", path, token=auth.token())
+        if status != 200:
+            raise SystemExit(f"GET {path} failed for {email}: HTTP {status}")
+        return json.loads(data)
+
+    projects = [p["id"] for p in get("/api/projects/")]
+    if not projects:
+        raise SystemExit(f"{email} has no projects; run generate_synthetic_data first.")
+    members = {pk: [m["id"] for m in get(f"/api/projects/{pk}/members/")] for pk in projects}
+    reports = {pk: [r["id"] for r in get(f"/api/readings/reports/?project={pk}&photos=count")] for pk in projects}
+    conn.conn.close()
+    return {"email": email, "auth": auth, "projects": projects, "members": members, "reports": reports}
+
+
+def fill(template, values):
+    """Substitute placeholders; a value that is exactly "{name}" keeps the id's int type."""
+    if isinstance(template, str):
+        for name in PLACEHOLDERS:
+            if template == "{%s}" % name:
+                return values[name]
+            template = template.replace("{%s}" % name, str(values[name]))
+        return template
+    if isinstance(template, dict):
+        return {key: fill(value, values) for key, value in template.items()}
+    if isinstance(template, list):
+        return [fill(value, values) for value in template]
+    return template
+
+
+def needs(template, name):
+    return "{%s}" % name in json.dumps(template)
+
+
+def load_scenario(path):
+    scenario = json.loads(Path(path).read_text())
+    requests = scenario.get("requests") or []
+    if not requests:
+        raise SystemExit(f"{path} defines no requests.")
+    for item in requests:
+        item.setdefault("method", "GET")
+        item.setdefault("weight", 1)
+        item.setdefault("name", f"{item['method']} {item['path']}")
+        item.setdefault("expect", [200, 201])
+    return scenario
+
+
+def run(args):
+    scenario = load_scenario(args.scenario)
+    requests = scenario["requests"]
+    weights = [item["weight"] for item in requests]
+    clients = args.clients or scenario.get("clients", 16)
+    duration = args.duration or scenario.get("duration", 20)
+    warmup = args.warmup if args.warmup is not None else scenario.get("warmup", 2)
+    think = (args.think_ms if args.think_ms is not None else scenario.get("think_ms", 0)) / 1000
+
+    emails = [f"{args.prefix}{i}@example.com" for i in range(1, args.owners + 1)]
+    sessions = [login(args.base_url, email, args.password, args.timeout) for email in emails]
+    print(f"{len(sessions)} owners, {sum(len(s['projects']) for s in sessions)} projects; "
+          f"{clients} clients for {duration}s after {warmup}s warmup")
+
+    lock = threading.Lock()
+    stats = {item["name"]: {"latencies": [], "errors": 0, "statuses": {}} for item in requests}
+    start_at = time.perf_counter()
+    measure_from = start_at + warmup
+    stop_at = measure_from + duration
+
+    def client(index):
+        rng = random.Random(args.seed + index)
+        session = sessions[index % len(sessions)]
+        conn = Connection(args.base_url, args.timeout)
+        local = {name: {"latencies": [], "errors": 0, "statuses": {}} for name in stats}
+        try:
+            while True:
+                now = time.perf_counter()
+                if now >= stop_at:
+                    break
+                item = rng.choices(requests, weights)[0]
+                project = rng.choice(session["projects"])
+                values = {
+                    "project": project,
+                    "member": rng.choice(session["members"][project] or [""]),
+                    "report": rng.choice(session["reports"][project] or [""]),
+                }
+                if any(values[n] == "" and needs(item, n) for n in ("member", "report")):
+                    continue
+                path = fill(item["path"], values)
+                body = fill(item.get("body"), values)
+                auth = session["auth"]
+                sent = time.perf_counter()
+                try:
+                    token = auth.token()
+                    sent = time.perf_counter()
+                    status, _ = conn.request(item["method"], path, body, token)
+                    if status == 401:
+                        # Expired between the check and the request: renew and time the retry.
+                        auth.renew(token)
+                        token = auth.token()
+                        sent = time.perf_counter()
+                        status, _ = conn.request(item["method"], path, body, token)
+                except (OSError, http.client.HTTPException):
+                    status = "conn-error"
+                elapsed_ms = (time.perf_counter() - sent) * 1000
+                if sent >= measure_from:
+                    entry = local[item["name"]]
+                    entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+                    if status in item["expect"]:
+                        entry["latencies"].append(elapsed_ms)
+                    else:
+                        entry["errors"] += 1
+                if think:
+                    time.sleep(think)
+        finally:
+            conn.conn.close()
+            with lock:
+                for name, entry in local.items():
+                    stats[name]["latencies"].extend(entry["latencies"])
+                    stats[name]["errors"] += entry["errors"]
+                    for status, count in entry["statuses"].items():
+                        stats[name]["statuses"][status] = stats[name]["statuses"].get(status, 0) + count
+
+    threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = max(time.perf_counter() - measure_from, 1e-9)
+
+    rows = []
+    for name, entry in stats.items():
+        latencies = entry["latencies"]
+        count = len(latencies) + entry["errors"]
+        rows.append({
+            "endpoint": name,
+            "requests": count,
+            "rps": round(count / elapsed, 1),
+            "errors": entry["errors"],
+            "p50_ms": round(percentile(latencies, 50), 1) if latencies else None,
+            "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+            "p99_ms": round(percentile(latencies, 99), 1) if latencies else None,
+            "statuses": {str(k): v for k, v in sorted(entry["statuses"].items(), key=str)},
+        })
+    all_latencies = [ms for entry in stats.values() for ms in entry["latencies"]]
+    total = sum(row["requests"] for row in rows)
+    summary = {
+        "clients": clients,
+        "duration_s": round(elapsed, 1),
+        "requests": total,
+        "rps": round(total / elapsed, 1),
+        "errors": sum(row["errors"] for row in rows),
+        "p50_ms": round(percentile(all_latencies, 50), 1) if all_latencies else None,
+        "p95_ms": round(percentile(all_latencies, 95), 1) if all_latencies else None,
+        "p99_ms": round(percentile(all_latencies, 99), 1) if all_latencies else None,
+        "token_renewals": sum(s["auth"].renewals for s in sessions),
+        "relogins": sum(s["auth"].logins - 1 for s in sessions),
+    }
+    return summary, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", default=str(DEFAULT_SCENARIO))
+    parser.add_argument("--clients", type=int, help="concurrent clients (overrides the scenario)")
+    parser.add_argument("--duration", type=float, help="measured seconds (overrides the scenario)")
+    parser.add_argument("--warmup", type=float, help="unmeasured seconds before the run")
+    parser.add_argument("--think-ms", type=float, help="pause between a client's requests")
+    parser.add_argument("--owners", type=int, default=2, help="synthetic owners to log in as")
+    parser.add_argument("--prefix", default="loadtest")
+    parser.add_argument("--password", default="loadtest-pass")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    summary, rows = run(args)
+    width = max(len(row["endpoint"]) for row in rows) + 2
+    header = f"{'endpoint':<{width}}{'requests':>9}{'req/s':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in sorted(rows, key=lambda r: -r["requests"]):
+        print(
+            f"{row['endpoint']:<{width}}{row['requests']:>9}{row['rps']:>8}{row['errors']:>8}"
+            f"{row['p50_ms'] or '-':>9}{row['p95_ms'] or '-':>9}{row['p99_ms'] or '-':>9}"
+        )
+    print("-" * len(header))
+    print(
+        f"{'total':<{width}}{summary['requests']:>9}{summary['rps']:>8}{summary['errors']:>8}"
+        f"{summary['p50_ms'] or '-':>9}{summary['p95_ms'] or '-':>9}{summary['p99_ms'] or '-':>9}"
+    )
+    print(f"token renewals: {summary['token_renewals']}, re-logins: {summary['relogins']}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({"summary": summary, "endpoints": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
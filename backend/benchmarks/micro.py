@@ -0,0 +1,324 @@
+# backend/benchmarks/micro.py
+"""
+Micro-benchmarks for the numerical hot paths, runnable offline.
+
+    python benchmarks/micro.py run --save benchmarks/baselines/main.json
+    python benchmarks/micro.py run --sizes 1000 10000 --filter export --json current.json
+    python benchmarks/micro.py compare benchmarks/baselines/main.json current.json --threshold 10
+
+``run`` seeds a throwaway SQLite database with generate_synthetic_data (one
+project per size) and times:
+
+- compute_estimated_fc / get_rating for one reading, and their batch
+  counterparts (bulk.estimate_fc, a get_rating pass) over N readings
+- GenerateModelView.post regression with 12 and 1000 calibration points
+- ProjectHistogramView binning and ReportSummaryView aggregation
+- the N-reading list through ReadingSerializer and serialize_reading_list
+- ReportExportView CSV and PDF exports
+- rendering the N-reading list as DRF JSON, fast JSON, columnar JSON and
+  MessagePack (core.renderers), with the payload size in the results
+
+Views are called in-process through APIRequestFactory, so timings include
+serialization and rendering but no HTTP. The response cache and the default
+Django cache are both disabled, so every call does the full work. Like pytest-benchmark, each case is
+calibrated so one round lasts at least ~1 ms, then repeated for --min-time
+seconds (and at least --min-rounds rounds); the median per call is what
+``compare`` checks. ``compare`` exits with status 1 if any benchmark's median
+got slower than the baseline by more than --threshold percent.
+
+Baselines are only comparable on the same machine and Python/numpy versions,
+which are recorded in the JSON.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = [1000, 10000, 100000]
+CORE_SIZES = [12, 1000]
+RENDER_CASES = ("render_json_drf", "render_json", "render_columnar", "render_msgpack")
+
+
+class Timer:
+    def __init__(self, min_time, min_rounds, max_rounds):
+        self.min_time = min_time
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.results = {}
+
+    def __call__(self, name, func):
+        func()  # warmup
+        iterations = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            elapsed = time.perf_counter() - start
+            if elapsed >= 0.001 or iterations >= 100000:
+                break
+            iterations *= 10
+
+        rounds = [elapsed / iterations]
+        started = time.perf_counter()
+        while len(rounds) < self.max_rounds and (
+            len(rounds) < self.min_rounds or time.perf_counter() - started < self.min_time
+        ):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            rounds.append((time.perf_counter() - start) / iterations)
+
+        self.results[name] = {
+            "median": statistics.median(rounds),
+            "mean": statistics.fmean(rounds),
+            "min": min(rounds),
+            "max": max(rounds),
+            "stddev": statistics.stdev(rounds) if len(rounds) > 1 else 0.0,
+            "rounds": len(rounds),
+            "iterations": iterations,
+        }
+        print(f"{name:<40}{format_time(self.results[name]['median']):>12}  ({len(rounds)} rounds)", flush=True)
+
+
+def format_time(seconds):
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def setup_django(tmp):
+    os.environ.update(
+        DB_ENGINE="sqlite",
+        DB_NAME=os.path.join(tmp, "bench.sqlite3"),
+        EXPORT_PROFILING="False",
+        RESPONSE_CACHE="off",
+        SONREB_LOG_LEVEL=os.environ.get("SONREB_LOG_LEVEL", "WARNING"),
+    )
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    sys.path.insert(0, str(BACKEND_DIR))
+    import django
+
+    django.setup()
+    from django.test.utils import override_settings
+
+    # DEBUG keeps a query log; exports are written under the temp MEDIA_ROOT.
+    # DummyCache turns off the ReportEngine stage cache, so the report cases
+    # time the full collect/compute/render pipeline instead of cache hits.
+    override_settings(
+        DEBUG=False,
+        ALLOWED_HOSTS=["testserver"],
+        MEDIA_ROOT=os.path.join(tmp, "media"),
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+    ).enable()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def seed(prefix, readings, cores):
+    from django.core.management import call_command
+    from django.contrib.auth.models import User
+
+    from apps.projects.models import Project
+
+    call_command(
+        "generate_synthetic_data", owners=1, projects=1, readings=readings, cores=cores,
+        reports=1, photos=4, prefix=prefix, stdout=io.StringIO(),
+    )
+    owner = User.objects.get(email=f"{prefix}1@example.com")
+    project = Project.objects.get(owner=owner)
+    return owner, project, project.reports.get()
+
+
+def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(tmp)
+        import numpy as np
+        from django import get_version
+        from rest_framework.test import APIRequestFactory, force_authenticate
+
+        from apps.calibration.views import GenerateModelView
+        from apps.projects.views import ProjectHistogramView
+        from apps.readings import bulk
+        from apps.readings.models import Reading
+        from apps.readings.utils import compute_estimated_fc, get_rating
+        from apps.readings.serializers import ReadingSerializer, serialize_reading_list
+        from apps.readings.views import ReportExportView, ReportSummaryView, reading_list_queryset
+        from core import renderers
+        from rest_framework.renderers import JSONRenderer
+
+        factory = APIRequestFactory()
+        timer = Timer(args.min_time, args.min_rounds, args.max_rounds)
+
+        def wanted(name):
+            return not args.filter or any(f in name for f in args.filter)
+
+        def view_call(view, owner, method, path, data=None, **kwargs):
+            view = view.as_view()
+
+            def call():
+                request = getattr(factory, method)(path, data, format="json" if method == "post" else None)
+                force_authenticate(request, user=owner)
+                response = view(request, **kwargs)
+                if hasattr(response, "render"):
+                    response.render()
+                assert response.status_code < 400, f"{path} -> {response.status_code}"
+
+            return call
+
+        for cores in CORE_SIZES:
+            name = f"generate_model[{cores} points]"
+            if wanted(name):
+                owner, project, _ = seed(f"bench-cores{cores}-", readings=10, cores=cores)
+                timer(name, view_call(GenerateModelView, owner, "post", "/api/calibration/generate/",
+                                      {"project": project.id}))
+
+        owner, project, _ = seed("bench-scalar-", readings=10, cores=12)
+        if wanted("compute_estimated_fc[scalar]"):
+            timer("compute_estimated_fc[scalar]", lambda: compute_estimated_fc(project, 4000.0, 35.0, 8.0))
+        if wanted("get_rating[scalar]"):
+            timer("get_rating[scalar]", lambda: get_rating(23.4, project.design_fc))
+
+        for size in args.sizes:
+            names = [f"{case}[{size}]" for case in (
+                "estimate_fc_batch", "get_rating_batch", "histogram", "report_summary", "export_csv", "export_pdf",
+                "reading_list_drf", "reading_list_fast", *RENDER_CASES,
+            )]
+            if not any(wanted(name) for name in names):
+                continue
+            owner, project, report = seed(f"bench-{size}-", readings=size, cores=12)
+            rows = list(Reading.objects.filter(project=project).values_list("upv", "rh_index", "carbonation_depth"))
+            upv, rh, carb = (list(column) for column in zip(*rows))
+            values = np.asarray(bulk.estimate_fc(project, upv, rh, carb)[0]).tolist()
+
+            cases = {
+                "estimate_fc_batch": lambda: bulk.estimate_fc(project, upv, rh, carb),
+                "get_rating_batch": lambda: [get_rating(v, project.design_fc) for v in values],
+                "histogram": view_call(ProjectHistogramView, owner, "get",
+                                       f"/api/projects/{project.id}/stats/fc-histogram/", pk=project.id),
+                "report_summary": view_call(ReportSummaryView, owner, "get",
+                                            f"/api/readings/reports/summary/?project={project.id}"),
+                "export_csv": view_call(ReportExportView, owner, "post", "/api/readings/reports/export/",
+                                        {"report_id": report.id, "format": "csv"}),
+                "export_pdf": view_call(ReportExportView, owner, "post", "/api/readings/reports/export/",
+                                        {"report_id": report.id}),
+                "reading_list_drf": lambda: ReadingSerializer(
+                    reading_list_queryset(project.id).select_related("project", "member"), many=True
+                ).data,
+                "reading_list_fast": lambda: serialize_reading_list(reading_list_queryset(project.id)),
+            }
+            if any(wanted(f"{case}[{size}]") for case in RENDER_CASES):
+                readings = serialize_reading_list(reading_list_queryset(project.id))
+                render_cases = {
+                    "render_json_drf": JSONRenderer(),
+                    "render_json": renderers.FastJSONRenderer(),
+                    "render_columnar": renderers.ColumnarJSONRenderer(),
+                }
+                if renderers.MessagePackRenderer.available:
+                    render_cases["render_msgpack"] = renderers.MessagePackRenderer()
+                for case, renderer in render_cases.items():
+                    cases[case] = (lambda renderer: lambda: renderer.render(readings))(renderer)
+
+            for case, func in cases.items():
+                name = f"{case}[{size}]"
+                if wanted(name):
+                    timer(name, func)
+                    if case.startswith("render_"):
+                        timer.results[name]["bytes"] = len(func())
+
+        return {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "machine": {
+                "node": platform.node(),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "django": get_version(),
+            },
+            "benchmarks": timer.results,
+        }
+
+
+def compare(baseline_path, current_path, threshold):
+    baseline = json.loads(Path(baseline_path).read_text())
+    current = json.loads(Path(current_path).read_text())
+    if baseline["machine"] != current["machine"]:
+        print("warning: results come from different machines or library versions", file=sys.stderr)
+
+    names = list(dict.fromkeys([*baseline["benchmarks"], *current["benchmarks"]]))
+    width = max(len(name) for name in names) + 2
+    header = f"{'benchmark':<{width}}{'baseline':>12}{'current':>12}{'change':>10}"
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for name in names:
+        old = baseline["benchmarks"].get(name, {}).get("median")
+        new = current["benchmarks"].get(name, {}).get("median")
+        if old is None or new is None:
+            note = "new" if old is None else "missing"
+            print(f"{name:<{width}}{format_time(old):>12}{format_time(new):>12}{note:>10}")
+            continue
+        change = (new / old - 1) * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<{width}}{format_time(old):>12}{format_time(new):>12}{change:>+9.1f}%{flag}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {threshold}%.")
+        return 1
+    print(f"\nNo regressions over {threshold}%.")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="readings per project")
+    run_parser.add_argument("--filter", nargs="+", help="only run benchmarks whose name contains one of these")
+    run_parser.add_argument("--min-time", type=float, default=1.0, help="seconds to repeat each benchmark")
+    run_parser.add_argument("--min-rounds", type=int, default=3)
+    run_parser.add_argument("--max-rounds", type=int, default=200)
+    run_parser.add_argument("--save", "--json", dest="save", help="write results to this JSON file")
+    run_parser.add_argument("--compare", help="baseline JSON to compare the results against")
+    run_parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(compare(args.baseline, args.current, args.threshold))
+
+    results = run(args)
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.save).write_text(json.dumps(results, indent=2))
+    if args.compare:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+            json.dump(results, fh)
+        try:
+            sys.exit(compare(args.compare, fh.name, args.threshold))
+        finally:
+            os.unlink(fh.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# backend/benchmarks/sqlite_concurrency.py
+"""
+SQLite concurrency benchmark: write throughput and read latency with 1/8/32
+concurrent clients, with the default SQLite settings ("baseline") and the
+SQLITE_TUNING profile from core/settings.py ("tuned").
+
+Each client loops: insert one reading (like ReadingListCreateView.post), then
+run the project summary aggregate and fetch a page of readings. One extra
+thread mimics a report export by keeping a streaming read open.
+
+    python benchmarks/sqlite_concurrency.py --clients 1 8 32 --duration 5
+    python benchmarks/sqlite_concurrency.py --json results.json
+
+Every profile/client-count run happens in a fresh subprocess against a fresh
+database file, because journal_mode=WAL is persisted in the file.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+PROFILES = {"baseline": "False", "tuned": "True"}
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def run_worker(clients: int, duration: float, export_hold: float) -> dict:
+    """Runs inside the subprocess, with DB_NAME/SQLITE_TUNING already set."""
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SECRET_KEY", "benchmark")
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    import django
+
+    django.setup()
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.db import OperationalError, connection, transaction
+    from django.db.models import Avg, Count, Max, Min, Q
+
+    from apps.projects.models import Project
+    from apps.readings.models import Reading
+
+    call_command("migrate", verbosity=0)
+    owner = User.objects.create_user(username="bench@example.com", password="benchmark")
+    project = Project.objects.create(owner=owner, name="Benchmark", design_fc=21)
+    Reading.objects.bulk_create(
+        Reading(project=project, upv=3800 + i % 400, rh_index=30 + i % 10, estimated_fc=20 + i % 10,
+                rating="GOOD", model_used="bench")
+        for i in range(2000)
+    )
+    connection.close()
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    results = {"writes": 0, "write_errors": 0, "read_ms": [], "write_ms": []}
+
+    def client():
+        writes, errors, read_ms, write_ms = 0, 0, [], []
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    with transaction.atomic():
+                        Reading.objects.create(project=project, upv=4000, rh_index=35, estimated_fc=25,
+                                               rating="GOOD", model_used="bench")
+                    writes += 1
+                    write_ms.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors += 1
+
+                start = time.perf_counter()
+                try:
+                    Reading.objects.filter(project=project).aggregate(
+                        total=Count("id"), min_fc=Min("estimated_fc"), max_fc=Max("estimated_fc"),
+                        avg_fc=Avg("estimated_fc"), good=Count("id", filter=Q(rating="GOOD")),
+                    )
+                    list(Reading.objects.filter(project=project).order_by("-created_at")[:50])
+                    read_ms.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors += 1
+        finally:
+            connection.close()
+            with lock:
+                results["writes"] += writes
+                results["write_errors"] += errors
+                results["read_ms"].extend(read_ms)
+                results["write_ms"].extend(write_ms)
+
+    def exporter():
+        # Like a columnar/report export: stream readings in autocommit with a
+        # slow consumer, so the read stays open while clients write.
+        try:
+            while not stop.is_set():
+                try:
+                    rows = Reading.objects.filter(project=project).values_list("id", "estimated_fc")
+                    for i, _ in enumerate(rows.iterator(chunk_size=500)):
+                        if i == 0:
+                            time.sleep(export_hold)
+                except OperationalError:
+                    pass
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    threads.append(threading.Thread(target=exporter))
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    read_ms = results["read_ms"]
+    return {
+        "clients": clients,
+        "writes_per_s": round(results["writes"] / elapsed, 1),
+        "errors": results["write_errors"],
+        "write_p95_ms": round(percentile(results["write_ms"], 95) or 0, 2),
+        "read_p50_ms": round(statistics.median(read_ms), 2) if read_ms else None,
+        "read_p95_ms": round(percentile(read_ms, 95), 2) if read_ms else None,
+    }
+
+
+def run_profile(profile: str, clients: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DB_ENGINE="sqlite", DB_NAME=os.path.join(tmp, "bench.sqlite3"),
+                   SQLITE_TUNING=PROFILES[profile], EXPORT_PROFILING="False")
+        out = subprocess.run(
+            [sys.executable, __file__, "--worker", str(clients), "--duration", str(args.duration),
+             "--export-hold", str(args.export_hold)],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        return {"profile": profile, **json.loads(out.stdout.strip().splitlines()[-1])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per run")
+    parser.add_argument("--export-hold", type=float, default=0.2, help="seconds the export keeps its read open")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--json", help="also write results to this file")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.duration, args.export_hold)))
+        return
+
+    rows = [run_profile(profile, clients, args) for clients in args.clients for profile in args.profiles]
+    header = f"{'profile':<10}{'clients':>8}{'writes/s':>10}{'errors':>8}{'write p95':>11}{'read p50':>10}{'read p95':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['profile']:<10}{row['clients']:>8}{row['writes_per_s']:>10}{row['errors']:>8}"
+            f"{row['write_p95_ms']:>11}{row['read_p50_ms'] or '-':>10}{row['read_p95_ms'] or '-':>10}"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Periodic purge of used/expired verification codes and revoked tokens.
+from apps.accounts.maintenance import start_scheduler  # noqa: E402
+
+start_scheduler()
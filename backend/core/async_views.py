@@ -0,0 +1,51 @@
+# backend/core/async_views.py
+"""
+Async counterpart of DRF's APIView.
+
+DRF 3.16 only dispatches synchronous handlers. AsyncAPIView keeps DRF's
+request wrapping, authentication, permissions, throttling, exception handling
+and content negotiation, but awaits ``async def get(...)`` etc. The auth /
+permission step can hit the database (JWT user lookup), so it runs through
+``sync_to_async``; everything else stays on the event loop.
+
+Under ASGI a slow client then holds a coroutine instead of a worker thread.
+Django's async ORM still executes queries in the request's sync thread, so
+queries started together with ``asyncio.gather`` are issued back to back
+rather than truly in parallel; the handlers are written so they become
+parallel without changes once the database layer is natively async.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    view_is_async = True
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
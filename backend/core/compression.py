@@ -0,0 +1,199 @@
+# backend/core/compression.py
+"""
+Response compression negotiated from Accept-Encoding: brotli when the
+``brotli`` package is installed and the client accepts it, otherwise gzip.
+
+Only text-like content types are compressed (JSON, columnar JSON, CSV,
+text/*; never PDFs, images or Parquet), each at the level in LEVELS, merged
+with settings.COMPRESSION_LEVELS; the lookup is cached per content type.
+Bodies shorter than COMPRESSION_MIN_BYTES are sent as is. Streaming
+responses (CSV exports are FileResponses) are compressed chunk by chunk as
+they are sent, without buffering the whole file.
+
+Compressing authenticated responses exposes them to BREACH. Like Django's
+GZipMiddleware, gzip output carries a file name of 0 to
+COMPRESSION_MAX_RANDOM_BYTES random bytes, which makes length-based guessing
+much slower (not impossible). Brotli has no such field, so requests carrying
+credentials (an Authorization header or cookies) get gzip unless
+COMPRESSION_BROTLI_WITH_CREDENTIALS is set, trading brotli's smaller bodies
+for the padding.
+"""
+import secrets
+import struct
+import zlib
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# content type (or "type/" prefix): (gzip level, brotli quality)
+LEVELS = {
+    "application/json": (6, 5),
+    "application/vnd.sonreb.columnar+json": (6, 5),
+    "application/msgpack": (4, 4),
+    "application/javascript": (6, 5),
+    "application/xml": (6, 5),
+    "image/svg+xml": (6, 5),
+    "text/csv": (6, 5),
+    "text/": (6, 5),
+}
+
+
+@lru_cache(maxsize=64)
+def compression_levels(content_type: str):
+    """(gzip level, brotli quality) for a Content-Type, or None to leave it alone."""
+    levels = {**LEVELS, **getattr(settings, "COMPRESSION_LEVELS", {})}
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in levels:
+        return levels[media_type]
+    return levels.get(media_type.split("/", 1)[0] + "/")
+
+
+def choose_encoding(accept_encoding: str, allow_brotli=True):
+    """"br", "gzip" or None, by the client's q-values (brotli wins ties)."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in ("br", "gzip"):
+        if coding == "br" and (brotli is None or not allow_brotli):
+            continue
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def gzip_header(max_random_bytes=0) -> bytes:
+    """RFC 1952 header, mtime 0; with max_random_bytes, a random-length FNAME."""
+    if not max_random_bytes:
+        return b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+    return b"\x1f\x8b\x08\x08\x00\x00\x00\x00\x00\xff" + b"a" * secrets.randbelow(max_random_bytes) + b"\x00"
+
+
+class GzipCompressor:
+    def __init__(self, level, max_random_bytes=0):
+        # Raw deflate in a gzip container written here, so the header can be padded.
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._header = gzip_header(max_random_bytes)
+        self._crc = 0
+        self._size = 0
+
+    def _with_header(self, data: bytes) -> bytes:
+        if self._header is None:
+            return data
+        data, self._header = self._header + data, None
+        return data
+
+    def compress(self, data: bytes) -> bytes:
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        return self._with_header(self._zlib.compress(data))
+
+    def flush(self) -> bytes:
+        trailer = struct.pack("<II", self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF)
+        return self._with_header(self._zlib.flush() + trailer)
+
+
+class BrotliCompressor:
+    def __init__(self, quality):
+        self._brotli = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.process(data)
+
+    def flush(self) -> bytes:
+        return self._brotli.finish()
+
+
+def get_compressor(encoding, levels, max_random_bytes=0):
+    if encoding == "br":
+        return BrotliCompressor(levels[1])
+    return GzipCompressor(levels[0], max_random_bytes)
+
+
+def compress_stream(chunks, compressor):
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def compress_async_stream(chunks, compressor):
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    def __init__(self, get_response):
+        if not getattr(settings, "COMPRESSION_ENABLED", True):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.min_bytes = getattr(settings, "COMPRESSION_MIN_BYTES", 1024)
+        self.max_random_bytes = getattr(settings, "COMPRESSION_MAX_RANDOM_BYTES", 100)
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding") or response.status_code < 200 or response.status_code in (204, 304):
+            return response
+        levels = compression_levels(response.get("Content-Type", ""))
+        if levels is None:
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        has_credentials = "HTTP_AUTHORIZATION" in request.META or bool(request.COOKIES)
+        encoding = choose_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""),
+            allow_brotli=not has_credentials or getattr(settings, "COMPRESSION_BROTLI_WITH_CREDENTIALS", False),
+        )
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            length = response.get("Content-Length")
+            if length is not None and int(length) < self.min_bytes:
+                return response
+            compressor = get_compressor(encoding, levels, self.max_random_bytes)
+            if response.is_async:
+                response.streaming_content = compress_async_stream(response.streaming_content, compressor)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, compressor)
+            del response["Content-Length"]
+        else:
+            if len(response.content) < self.min_bytes:
+                return response
+            compressor = get_compressor(encoding, levels, self.max_random_bytes)
+            compressed = compressor.compress(response.content) + compressor.flush()
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The compressed body is a different byte sequence: strong ETags must go weak.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
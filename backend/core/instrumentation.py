@@ -0,0 +1,178 @@
+# backend/core/instrumentation.py
+"""
+Lightweight per-section profiling for expensive request pipelines
+(report exports, PDF rendering).
+
+For every named section we record wall time, CPU time of the current
+thread, SQL query count/time and, when enabled, the tracemalloc peak.
+Sections may nest; repeated sections with the same name are accumulated.
+
+tracemalloc is process-wide: it is started by the first profiler that traces
+memory and stopped when the last one finishes, and never stopped if something
+else started it. Peaks of concurrent exports include each other's allocations.
+"""
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger("sonreb.instrumentation")
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+def _acquire_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` hook counting queries and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class Profiler:
+    def __init__(self, name: str, trace_memory=None):
+        self.name = name
+        self.trace_memory = (
+            getattr(settings, "PROFILE_TRACE_MEMORY", False) if trace_memory is None else trace_memory
+        )
+        self.started_at = timezone.now()
+        self.sections = {}
+        self._stack = []
+        self._holds_tracing = False
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.thread_time()
+        # SQL totals only cover top-level sections, so nested ones aren't double counted.
+        self._sql_count = 0
+        self._sql_duration = 0.0
+        self._peak = 0
+        if self.trace_memory:
+            _acquire_tracing()
+            self._holds_tracing = True
+
+    @contextmanager
+    def section(self, name: str):
+        frame = {"peak": 0}
+        baseline = 0
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], peak)
+            tracemalloc.reset_peak()
+            baseline = current
+        self._stack.append(frame)
+
+        recorder = QueryRecorder()
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            with connection.execute_wrapper(recorder):
+                yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.thread_time() - start_cpu
+            self._stack.pop()
+            if not self._stack:
+                self._sql_count += recorder.count
+                self._sql_duration += recorder.duration
+            peak_kb = None
+            if self.trace_memory:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent["peak"] = max(parent["peak"], peak)
+                else:
+                    self._peak = max(self._peak, peak)
+                peak_kb = round(max(peak - baseline, 0) / 1024, 1)
+
+            entry = self.sections.setdefault(
+                name,
+                {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "sql_count": 0, "sql_ms": 0.0, "peak_kb": None},
+            )
+            entry["calls"] += 1
+            entry["wall_ms"] += wall * 1000
+            entry["cpu_ms"] += cpu * 1000
+            entry["sql_count"] += recorder.count
+            entry["sql_ms"] += recorder.duration * 1000
+            if peak_kb is not None:
+                entry["peak_kb"] = max(entry["peak_kb"] or 0, peak_kb)
+
+    def finish(self) -> dict:
+        """Stop recording and return (and log) the collected metrics."""
+        peak_kb = None
+        if self.trace_memory:
+            peak_kb = round(max(self._peak, tracemalloc.get_traced_memory()[1]) / 1024, 1)
+        if self._holds_tracing:
+            _release_tracing()
+            self._holds_tracing = False
+
+        result = {
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "total": {
+                "wall_ms": round((time.perf_counter() - self._start_wall) * 1000, 2),
+                "cpu_ms": round((time.thread_time() - self._start_cpu) * 1000, 2),
+                "sql_count": self._sql_count,
+                "sql_ms": round(self._sql_duration * 1000, 2),
+                "peak_kb": peak_kb,
+            },
+            "sections": {
+                name: {key: round(value, 2) if isinstance(value, float) else value for key, value in entry.items()}
+                for name, entry in self.sections.items()
+            },
+        }
+        logger.info(json.dumps(result))
+        return result
+
+
+class NullProfiler:
+    """Drop-in stand-in when profiling is disabled."""
+
+    def section(self, name: str):
+        return nullcontext()
+
+    def finish(self):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def start_profiler(name: str):
+    if not getattr(settings, "EXPORT_PROFILING", False):
+        return NULL_PROFILER
+    return Profiler(name)
@@ -0,0 +1,83 @@
+# backend/core/management/commands/slow_queries.py
+"""
+Dump or aggregate the slow queries captured by core.slow_queries.
+
+    python manage.py slow_queries                  # group by SQL fingerprint
+    python manage.py slow_queries --dump --limit 20
+    python manage.py slow_queries --view report-export --json
+"""
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.slow_queries import aggregate
+
+
+class Command(BaseCommand):
+    help = "Dump or aggregate captured slow queries by normalized SQL fingerprint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", help="JSONL capture file (default: SLOW_QUERY_LOG)")
+        parser.add_argument("--dump", action="store_true", help="list captures instead of aggregating")
+        parser.add_argument("--view", help="only captures from this URL name")
+        parser.add_argument("--min-ms", type=float, default=0, help="only captures at least this slow")
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+        parser.add_argument("--clear", action="store_true", help="delete the capture file(s) afterwards")
+
+    def handle(self, *args, **options):
+        path = options["file"] or getattr(settings, "SLOW_QUERY_LOG", "")
+        if not path:
+            raise CommandError("No capture file: set SLOW_QUERY_LOG or pass --file.")
+        paths = [p for p in (f"{path}.1", path) if os.path.exists(p)]
+
+        entries = []
+        for p in paths:
+            with open(p, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # partially written line
+                    if options["view"] and entry.get("view") != options["view"]:
+                        continue
+                    if entry["duration_ms"] < options["min_ms"]:
+                        continue
+                    entries.append(entry)
+
+        if options["dump"]:
+            rows = sorted(entries, key=lambda e: e["at"], reverse=True)[: options["limit"]]
+            if options["json"]:
+                self.stdout.write(json.dumps(rows, indent=2))
+            else:
+                for entry in rows:
+                    self.stdout.write(
+                        f"{entry['at']}  {entry['duration_ms']:>9.1f} ms  {entry.get('view') or '-'}  "
+                        f"[{entry['fingerprint']}]"
+                    )
+                    self.stdout.write(f"  {entry['normalized']}")
+                    self.stdout.write(f"  param types: {entry.get('param_types')}")
+                    for plan_line in entry["plan"]:
+                        self.stdout.write(f"    {plan_line}")
+        else:
+            groups = aggregate(entries)[: options["limit"]]
+            if options["json"]:
+                self.stdout.write(json.dumps(groups, indent=2))
+            else:
+                for group in groups:
+                    views = ", ".join(f"{view} x{count}" for view, count in sorted(group["views"].items()))
+                    self.stdout.write(
+                        f"[{group['fingerprint']}] {group['count']} calls, total {group['total_ms']:.1f} ms, "
+                        f"avg {group['avg_ms']:.1f} ms, max {group['max_ms']:.1f} ms  ({views})"
+                    )
+                    self.stdout.write(f"  {group['normalized']}")
+                    for plan_line in group["plan"]:
+                        self.stdout.write(f"    {plan_line}")
+
+        if not options["json"]:
+            self.stdout.write(f"{len(entries)} captures in {', '.join(paths) or 'no file'}.")
+        if options["clear"]:
+            for p in paths:
+                os.remove(p)
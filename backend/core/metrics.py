@@ -0,0 +1,292 @@
+# backend/core/metrics.py
+"""
+In-process metrics registry with a Prometheus text-format endpoint.
+
+Values live in an mmap'd array of float64, one file per worker process in
+METRICS_DIR (``metrics-<pid>.bin`` plus an append-only ``metrics-<pid>.keys``
+mapping slots to metric/label names), so any worker can serve /metrics for
+all of them. Without METRICS_DIR the array is anonymous memory and /metrics
+only reports the serving process. Clear METRICS_DIR when the server starts.
+
+Each thread writes to its own shard of the array, so recording a value is a
+dict lookup and an in-place float add with no lock; a lock is only taken the
+first time a thread or a label combination is seen. Readers sum the shards.
+Gauges of processes that have exited are dropped, counters are kept.
+
+With METRICS_ENABLED=False (the default) recording a value does nothing and
+the array is never allocated.
+"""
+import bisect
+import hmac
+import json
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+MAX_SLOTS = 4096
+MAX_SHARDS = 64
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = {}
+
+
+class ProcessStore:
+    def __init__(self, directory=None):
+        self.pid = os.getpid()
+        self.slots = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = 0
+        self._keys = None
+        size = MAX_SHARDS * MAX_SLOTS * 8
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"metrics-{self.pid}.bin")
+            with open(path, "w+b") as fh:
+                fh.truncate(size)
+                self._mmap = mmap.mmap(fh.fileno(), size)
+            self._keys = open(os.path.join(directory, f"metrics-{self.pid}.keys"), "w", encoding="utf-8")
+        else:
+            self._mmap = mmap.mmap(-1, size)
+        self.values = memoryview(self._mmap).cast("d")
+
+    def slot(self, key) -> int:
+        slot = self.slots.get(key)
+        if slot is None:
+            with self._lock:
+                slot = self.slots.get(key)
+                if slot is None:
+                    slot = len(self.slots)
+                    if slot >= MAX_SLOTS:
+                        raise RuntimeError(f"Metrics registry is full ({MAX_SLOTS} series).")
+                    if self._keys:
+                        # The key is on disk before any value is written to its slot.
+                        self._keys.write(f"{slot}\t{json.dumps(key)}\n")
+                        self._keys.flush()
+                    self.slots[key] = slot
+        return slot
+
+    def shard(self) -> int:
+        base = getattr(self._local, "base", None)
+        if base is None:
+            with self._lock:
+                # Past MAX_SHARDS threads share shards again; increments may then race.
+                base = (self._shards % MAX_SHARDS) * MAX_SLOTS
+                self._shards += 1
+            self._local.base = base
+        return base
+
+    def add(self, key, amount):
+        self.values[self.shard() + self.slot(key)] += amount
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ProcessStore:
+    global _store
+    store = _store
+    if store is None or store.pid != os.getpid():
+        # First use, or first use after a fork (e.g. gunicorn --preload).
+        with _store_lock:
+            if _store is None or _store.pid != os.getpid():
+                _store = ProcessStore(getattr(settings, "METRICS_DIR", "") or None)
+            store = _store
+    return store
+
+
+def enabled() -> bool:
+    return getattr(settings, "METRICS_ENABLED", False)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY[name] = self
+
+    def _labels(self, labels) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount=1.0, **labels):
+        if enabled():
+            get_store().add((self.name, self._labels(labels), ""), amount)
+
+
+class Gauge(Metric):
+    """Summed over live processes only."""
+
+    kind = "gauge"
+
+    def inc(self, amount=1.0, **labels):
+        if enabled():
+            get_store().add((self.name, self._labels(labels), ""), amount)
+
+    def dec(self, amount=1.0, **labels):
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        if not enabled():
+            return
+        store = get_store()
+        labelvalues = self._labels(labels)
+        store.add((self.name, labelvalues, f"b{bisect.bisect_left(self.buckets, value)}"), 1.0)
+        store.add((self.name, labelvalues, "sum"), value)
+        store.add((self.name, labelvalues, "count"), 1.0)
+
+
+REQUEST_LATENCY = Histogram(
+    "sonreb_http_request_duration_seconds", "Request latency by URL name.", ("view", "method")
+)
+REQUESTS = Counter("sonreb_http_requests_total", "Requests by URL name and status.", ("view", "method", "status"))
+IN_FLIGHT = Gauge("sonreb_http_requests_in_flight", "Requests currently being handled.")
+DB_QUERIES = Counter("sonreb_db_queries_total", "SQL queries sent, by URL name.", ("view",))
+DB_SECONDS = Counter("sonreb_db_query_seconds_total", "Time spent in SQL, by URL name.", ("view",))
+EXPORT_JOBS = Gauge("sonreb_export_jobs", "Report exports currently waiting or rendering.", ("kind",))
+CACHE_REQUESTS = Counter("sonreb_cache_requests_total", "Cache lookups by cache and result.", ("cache", "result"))
+THROTTLED = Counter("sonreb_throttled_requests_total", "Requests refused by a throttle.", ("scope", "key"))
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _read_process(values: np.ndarray, slots: dict, totals: dict, alive: bool):
+    summed = values.reshape(MAX_SHARDS, MAX_SLOTS).sum(axis=0)
+    for slot, key in slots.items():
+        metric = REGISTRY.get(key[0])
+        if metric is None or (metric.kind == "gauge" and not alive):
+            continue
+        series = (key[0], tuple(key[1]), key[2])
+        totals[series] = totals.get(series, 0.0) + float(summed[slot])
+
+
+def collect() -> dict:
+    """{(metric name, label values, part): value} summed over processes."""
+    totals = {}
+    directory = getattr(settings, "METRICS_DIR", "")
+    if not directory:
+        store = get_store()
+        values = np.frombuffer(store._mmap, dtype=np.float64)
+        _read_process(values, {slot: key for key, slot in store.slots.items()}, totals, alive=True)
+        return totals
+
+    get_store()  # make sure this process has registered its files
+    for keys_path in Path(directory).glob("metrics-*.keys"):
+        pid = int(keys_path.stem.split("-", 1)[1])
+        slots = {}
+        with open(keys_path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.endswith("\n"):  # skip a line still being written
+                    slot, key = line.rstrip("\n").split("\t", 1)
+                    slots[int(slot)] = json.loads(key)
+        try:
+            with open(keys_path.with_suffix(".bin"), "rb") as fh:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    values = np.frombuffer(mm, dtype=np.float64).copy()
+        except (FileNotFoundError, ValueError):
+            continue
+        _read_process(values, slots, totals, alive=_process_alive(pid))
+    return totals
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names, values, extra=()) -> str:
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(totals=None) -> str:
+    totals = collect() if totals is None else totals
+    by_metric = {}
+    for (name, labelvalues, part), value in totals.items():
+        by_metric.setdefault(name, {}).setdefault(labelvalues, {})[part] = value
+
+    lines = []
+    for name, metric in REGISTRY.items():
+        series = by_metric.get(name, {})
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        for labelvalues, parts in sorted(series.items()):
+            if metric.kind == "histogram":
+                cumulative = 0.0
+                for index, bound in enumerate((*metric.buckets, float("inf"))):
+                    cumulative += parts.get(f"b{index}", 0.0)
+                    le = "+Inf" if bound == float("inf") else _number(bound)
+                    lines.append(
+                        f"{name}_bucket{_labels_text(metric.labelnames, labelvalues, [('le', le)])} {_number(cumulative)}"
+                    )
+                lines.append(f"{name}_sum{_labels_text(metric.labelnames, labelvalues)} {_number(parts.get('sum', 0.0))}")
+                lines.append(f"{name}_count{_labels_text(metric.labelnames, labelvalues)} {_number(parts.get('count', 0.0))}")
+            else:
+                lines.append(f"{name}{_labels_text(metric.labelnames, labelvalues)} {_number(parts.get('', 0.0))}")
+
+    # Derived: hit ratio per cache, from the lookup counters.
+    lookups = {}
+    for (labelvalues, parts) in by_metric.get(CACHE_REQUESTS.name, {}).items():
+        cache_name, result = labelvalues
+        lookups.setdefault(cache_name, {})[result] = parts.get("", 0.0)
+    lines.append("# HELP sonreb_cache_hit_ratio Cache hits / lookups since start.")
+    lines.append("# TYPE sonreb_cache_hit_ratio gauge")
+    for cache_name, results in sorted(lookups.items()):
+        total = results.get("hit", 0.0) + results.get("miss", 0.0)
+        if total:
+            lines.append(f'sonreb_cache_hit_ratio{{cache="{_escape(cache_name)}"}} {_number(results.get("hit", 0.0) / total)}')
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    token = getattr(settings, "METRICS_TOKEN", "")
+    # Paths, user-visible counts and timings are not for anonymous callers.
+    if not getattr(settings, "METRICS_ENABLED", False) or not token:
+        raise Http404
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(supplied, token):
+        return HttpResponse("Unauthorized\n", status=401, content_type="text/plain")
+    return HttpResponse(render_prometheus(), content_type=CONTENT_TYPE)
@@ -0,0 +1,239 @@
+# backend/core/middleware.py
+"""
+Request instrumentation.
+
+MetricsMiddleware records latency, status, in-flight requests and SQL per
+URL name in core.metrics (opt-in with METRICS_ENABLED=True).
+
+SlowQueryMiddleware captures queries slower than SLOW_QUERY_MS with their
+EXPLAIN output (see core.slow_queries; off when SLOW_QUERY_MS is 0).
+
+ServerTimingMiddleware is opt-in with SERVER_TIMING=True. Every response gets
+a ``Server-Timing`` header and one JSON log line on the ``sonreb.timing``
+logger with:
+
+- total: time spent below this middleware
+- db: SQL query count and cumulative time (``connection.execute_wrapper``)
+- serialize: time inside top-level ``serializer.data`` calls
+- render: DRF/template response rendering (JSON encoding, PDF bytes, ...)
+- app: what is left, i.e. Python in views, auth, permissions and middleware
+"""
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from . import metrics
+from .instrumentation import QueryRecorder
+from .slow_queries import SlowQueryRecorder
+
+logger = logging.getLogger("sonreb.timing")
+
+_current = ContextVar("sonreb_request_timing", default=None)
+_serializers_instrumented = False
+
+
+class RequestTiming:
+    def __init__(self):
+        self.queries = QueryRecorder()
+        self.serialize = 0.0
+        self.render = 0.0
+        self.render_started = None
+        self.serializer_depth = 0
+
+
+def instrument_serializers():
+    """Time ``BaseSerializer.data``; nested serializers are counted once, by their parent."""
+    global _serializers_instrumented
+    if _serializers_instrumented:
+        return
+    from rest_framework.serializers import BaseSerializer
+
+    original = BaseSerializer.data.fget
+
+    def data(self):
+        timing = _current.get()
+        if timing is None:
+            return original(self)
+        timing.serializer_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self)
+        finally:
+            timing.serializer_depth -= 1
+            if not timing.serializer_depth:
+                timing.serialize += time.perf_counter() - start
+
+    BaseSerializer.data = property(data)
+    _serializers_instrumented = True
+
+
+def _add_execute_wrapper(wrapper):
+    connection.execute_wrappers.append(wrapper)
+
+
+def _remove_execute_wrapper(wrapper):
+    connection.execute_wrappers.remove(wrapper)
+
+
+class InstrumentationMiddleware:
+    """
+    Sync and async capable base: ``begin`` before the view, ``query_wrapper``
+    around its SQL, ``cleanup`` even if it raised, ``end`` with the response.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = self.begin(request)
+        try:
+            with connection.execute_wrapper(self.query_wrapper(state)):
+                response = self.get_response(request)
+        finally:
+            self.cleanup(state)
+        return self.end(request, response, state)
+
+    async def __acall__(self, request):
+        # Under ASGI the ORM runs in the request's sync thread, which has its
+        # own connection object, so the wrapper is installed from there.
+        state = self.begin(request)
+        wrapper = self.query_wrapper(state)
+        await sync_to_async(_add_execute_wrapper)(wrapper)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(_remove_execute_wrapper)(wrapper)
+            self.cleanup(state)
+        return self.end(request, response, state)
+
+    def begin(self, request):
+        raise NotImplementedError
+
+    def query_wrapper(self, state):
+        raise NotImplementedError
+
+    def cleanup(self, state):
+        pass
+
+    def end(self, request, response, state):
+        return response
+
+
+class MetricsMiddleware(InstrumentationMiddleware):
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", False):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def begin(self, request):
+        metrics.IN_FLIGHT.inc()
+        return QueryRecorder(), time.perf_counter()
+
+    def query_wrapper(self, state):
+        return state[0]
+
+    def cleanup(self, state):
+        metrics.IN_FLIGHT.dec()
+
+    def end(self, request, response, state):
+        queries, start = state
+        elapsed = time.perf_counter() - start
+        match = request.resolver_match
+        view = (match.url_name if match else None) or "unmatched"
+        metrics.REQUEST_LATENCY.observe(elapsed, view=view, method=request.method)
+        metrics.REQUESTS.inc(view=view, method=request.method, status=response.status_code)
+        if queries.count:
+            metrics.DB_QUERIES.inc(queries.count, view=view)
+            metrics.DB_SECONDS.inc(queries.duration, view=view)
+        return response
+
+
+class SlowQueryMiddleware(InstrumentationMiddleware):
+    def __init__(self, get_response):
+        self.threshold_ms = getattr(settings, "SLOW_QUERY_MS", 0)
+        if not self.threshold_ms:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def begin(self, request):
+        return SlowQueryRecorder(request, self.threshold_ms)
+
+    def query_wrapper(self, state):
+        return state
+
+
+class ServerTimingMiddleware(InstrumentationMiddleware):
+    def __init__(self, get_response):
+        if not getattr(settings, "SERVER_TIMING", False):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        instrument_serializers()
+
+    def begin(self, request):
+        timing = RequestTiming()
+        return timing, _current.set(timing), time.perf_counter()
+
+    def query_wrapper(self, state):
+        return state[0].queries
+
+    def cleanup(self, state):
+        _current.reset(state[1])
+
+    def end(self, request, response, state):
+        timing, _, start = state
+        total = time.perf_counter() - start
+
+        spans = {
+            "total": total,
+            "db": timing.queries.duration,
+            "serialize": timing.serialize,
+            "render": timing.render,
+        }
+        spans["app"] = max(total - timing.queries.duration - timing.serialize - timing.render, 0.0)
+        response["Server-Timing"] = ", ".join(
+            f'db;dur={spans[name] * 1000:.2f};desc="{timing.queries.count} queries"'
+            if name == "db"
+            else f"{name};dur={spans[name] * 1000:.2f}"
+            for name in ("total", "db", "serialize", "render", "app")
+        )
+
+        match = request.resolver_match
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "view": match.view_name if match else None,
+                    "status": response.status_code,
+                    "sql_count": timing.queries.count,
+                    **{f"{name}_ms": round(value * 1000, 2) for name, value in spans.items()},
+                }
+            )
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        # Called right before the handler renders the response (DRF's
+        # Response included); the post-render callback closes the span.
+        timing = _current.get()
+        if timing is not None:
+            timing.render_started = time.perf_counter()
+
+            def rendered(response):
+                timing.render += time.perf_counter() - timing.render_started
+
+            response.add_post_render_callback(rendered)
+        return response
@@ -0,0 +1,114 @@
+# backend/core/renderers.py
+"""
+Response formats, chosen by the Accept header or ``?format=``:
+
+- ``application/json`` (default): DRF's JSON, encoded with orjson when it is
+  installed. Same bytes, several times faster for large lists.
+- ``application/vnd.sonreb.columnar+json`` / ``?format=columnar``: every list
+  of objects (a reading list, a report's ``field_grid``, ...) becomes one
+  object of arrays, ``{"id": [1, 2], "upv": [4012.5, 3987.0], ...}``, so key
+  names are sent once instead of once per row.
+- ``application/msgpack`` / ``?format=msgpack``: MessagePack of the columnar
+  layout, when msgpack is installed.
+
+ContentNegotiation skips renderers whose library is missing.
+"""
+import re
+from operator import itemgetter
+
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_fallback = JSONEncoder()
+CONTAINERS = (dict, list, tuple)
+# Dates, times and keys are spelled DRF's way (millisecond precision, "Z" for
+# UTC, coerced keys); everything orjson doesn't know goes through DRF's encoder.
+ORJSON_OPTIONS = (
+    (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    if orjson is not None
+    else 0
+)
+# orjson writes 1e16 / 1e-7 where Python writes 1e+16 / 1e-07.
+_EXPONENT = re.compile(rb"\de-?\d")
+
+
+def columnar(data):
+    """Turn lists of dicts, at any depth, into dicts of lists."""
+    if isinstance(data, dict):
+        return {key: columnar(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        if data and all(isinstance(item, dict) for item in data):
+            return _columns(data)
+        return [columnar(item) for item in data]
+    return data
+
+
+def _columns(rows: list) -> dict:
+    keys = dict.fromkeys(rows[0])
+    if all(row.keys() == keys.keys() for row in rows):
+        # Same keys in every row (serializer output): gather each column in C.
+        return {key: _column(list(map(itemgetter(key), rows))) for key in keys}
+    for row in rows:
+        keys.update(dict.fromkeys(row))
+    return {key: _column([row.get(key) for row in rows]) for key in keys}
+
+
+def _column(values: list) -> list:
+    if any(issubclass(kind, CONTAINERS) for kind in set(map(type, values))):
+        return [columnar(value) for value in values]
+    return values
+
+
+class FastJSONRenderer(JSONRenderer):
+    available = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        content = orjson.dumps(data, default=_fallback.default, option=ORJSON_OPTIONS)
+        if _EXPONENT.search(content):
+            # Rare (very large or small floats, or such text in a string):
+            # let DRF spell the numbers.
+            return super().render(data, accepted_media_type, renderer_context)
+        # Like DRF, keep the output a strict JavaScript subset.
+        return content.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class ColumnarJSONRenderer(FastJSONRenderer):
+    media_type = "application/vnd.sonreb.columnar+json"
+    format = "columnar"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(columnar(data), accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    available = msgpack is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(columnar(data), default=_fallback.default, use_bin_type=True)
+
+
+class ContentNegotiation(DefaultContentNegotiation):
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [renderer for renderer in renderers if getattr(renderer, "available", True)]
+        return super().select_renderer(request, renderers, format_suffix)
@@ -0,0 +1,266 @@
+# backend/core/response_cache.py
+"""
+Cache for computed response payloads.
+
+Callers build the key from everything the payload depends on (see
+``cache_key``), so entries never need invalidating; they only age out:
+
+* LocalBackend: per-process LRU dict.
+* FileBackend: one pickle per entry in RESPONSE_CACHE_DIR, shared by every
+  worker on the host. Reads refresh the file's mtime, which orders the LRU
+  eviction done every ``prune_every`` writes of a process (so the directory
+  is not listed on every write; it may briefly hold a few extra entries).
+
+Both drop entries older than RESPONSE_CACHE_TTL and keep at most
+RESPONSE_CACHE_MAX_ENTRIES. ``get_or_compute`` lets one caller per key
+compute while identical concurrent requests wait for its result: threads of
+a process share the computation, and with the file backend other processes
+wait on a lock file (POSIX only) and then read the stored entry. The holder
+deletes the lock file before releasing it.
+"""
+import hashlib
+import itertools
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from . import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process single-flight only
+    fcntl = None
+
+_MISSING = object()
+
+
+def cache_key(*parts) -> str:
+    return hashlib.blake2b(
+        json.dumps(parts, sort_keys=True, cls=DjangoJSONEncoder).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+class LocalBackend:
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.time():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def lock(self, key):
+        return nullcontext()
+
+
+class FileBackend:
+    suffix = ".pickle"
+
+    def __init__(self, directory, ttl: float, max_entries: int, prune_every: int = 16):
+        self.directory = str(directory)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self._writes = itertools.count(1)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                expires, value = pickle.load(fh)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        if expires < time.time():
+            self._remove(path)
+            return _MISSING
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return value
+
+    def set(self, key, value):
+        # Write to a temp file and rename, so readers never see half an entry.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump((time.time() + self.ttl, value), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        if next(self._writes) % self.prune_every == 0:
+            self._prune()
+
+    def _prune(self):
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if mtime + self.ttl < now:
+                    self._remove(entry.path)
+                else:
+                    entries.append((mtime, entry.path))
+        if len(entries) > self.max_entries:
+            entries.sort()
+            for _, path in entries[: len(entries) - self.max_entries]:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith((self.suffix, ".lock", ".tmp")):
+                    self._remove(entry.path)
+
+    @contextmanager
+    def lock(self, key):
+        if fcntl is None:
+            yield
+            return
+        path = os.path.join(self.directory, key + ".lock")
+        while True:
+            fh = open(path, "a+b")
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                current = os.stat(path).st_ino == os.fstat(fh.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                break
+            # The previous holder deleted the file while we waited: lock the new one.
+            fh.close()
+        try:
+            yield
+        finally:
+            self._remove(path)
+            fh.close()  # releases the flock
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResponseCache:
+    def __init__(self, backend, name="response"):
+        self.backend = backend
+        self.name = name
+        self._calls = {}
+        self._calls_lock = threading.Lock()
+
+    def get_or_compute(self, key, producer):
+        value = self.backend.get(key)
+        if value is not _MISSING:
+            metrics.CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return value
+
+        with self._calls_lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            # Another thread is computing this key; share its result.
+            call.done.wait()
+            metrics.CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._compute(key, producer)
+            return call.value
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._calls_lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _compute(self, key, producer):
+        with self.backend.lock(key):
+            # Another process may have stored it while we waited for the lock.
+            value = self.backend.get(key)
+            if value is not _MISSING:
+                metrics.CACHE_REQUESTS.inc(cache=self.name, result="hit")
+                return value
+            metrics.CACHE_REQUESTS.inc(cache=self.name, result="miss")
+            value = producer()
+            self.backend.set(key, value)
+            return value
+
+    def clear(self):
+        self.backend.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """The configured ResponseCache, or None when RESPONSE_CACHE is off."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                kind = getattr(settings, "RESPONSE_CACHE", "local")
+                ttl = getattr(settings, "RESPONSE_CACHE_TTL", 300)
+                max_entries = getattr(settings, "RESPONSE_CACHE_MAX_ENTRIES", 256)
+                if kind == "file":
+                    backend = FileBackend(settings.RESPONSE_CACHE_DIR, ttl, max_entries)
+                elif kind == "local":
+                    backend = LocalBackend(ttl, max_entries)
+                else:
+                    return None
+                _cache = ResponseCache(backend)
+    return _cache
+
+
+def cached(key, producer):
+    cache = get_cache()
+    return producer() if cache is None else cache.get_or_compute(key, producer)
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 import os
+from datetime import timedelta
 from dotenv import load_dotenv
 
 # BASE_DIR = backend folder (where manage.py lives)
@@ -59,9 +60,16 @@ INSTALLED_APPS = [
     "apps.projects",
     "apps.readings",
     "apps.calibration",
+    "core",
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware (no-op unless SERVER_TIMING).
+    "core.middleware.ServerTimingMiddleware",
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.SlowQueryMiddleware",
+    # Above everything that produces the body, below the timers so they include it.
+    "core.compression.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -73,6 +81,7 @@ MIDDLEWARE = [
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True
+CORS_EXPOSE_HEADERS = ["Server-Timing"]
 
 
 ROOT_URLCONF = 'core.urls'
@@ -98,12 +107,58 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# SQLite is the zero-config default. Set DB_ENGINE=postgres (with DB_NAME,
+# DB_USER, DB_PASSWORD, DB_HOST, DB_PORT) for production deployments.
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite").lower()
+
+if DB_ENGINE in ("postgres", "postgresql"):
+    # Django's built-in psycopg pool replaces persistent connections:
+    # CONN_MAX_AGE is only used when DB_POOL=False.
+    DB_POOL = os.getenv("DB_POOL", "True") == "True"
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv("DB_NAME", "sonreb"),
+            'USER': os.getenv("DB_USER", "postgres"),
+            'PASSWORD': os.getenv("DB_PASSWORD", ""),
+            'HOST': os.getenv("DB_HOST", "localhost"),
+            'PORT': os.getenv("DB_PORT", "5432"),
+            'CONN_MAX_AGE': 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "60")),
+            'CONN_HEALTH_CHECKS': os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                    'max_size': int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    'timeout': int(os.getenv("DB_POOL_TIMEOUT", "10")),
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    # Single-node profile (SQLITE_TUNING=False restores SQLite defaults): WAL
+    # lets exports read while uploads write, and IMMEDIATE transactions take
+    # the write lock up front so writers queue on busy_timeout instead of
+    # failing with "database is locked" halfway through a transaction. That
+    # also applies to read-only atomic() blocks, so keep long reads out of them.
+    SQLITE_TUNING = os.getenv("SQLITE_TUNING", "True") == "True"
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-20000"),  # KiB when negative
+        "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)),
+        "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT", "5000"),  # ms
+        "temp_store": "MEMORY",
+    }
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv("DB_NAME") or BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                'init_command': "".join(f"PRAGMA {key}={value};" for key, value in SQLITE_PRAGMAS.items()),
+                'transaction_mode': "IMMEDIATE",
+            } if SQLITE_TUNING else {},
+        }
     }
-}
 
 
 # Password validation
@@ -144,12 +199,132 @@ STATIC_URL = 'static/'
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # JSON (orjson when installed), columnar JSON and MessagePack; see core.renderers.
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "core.renderers.ColumnarJSONRenderer",
+        "core.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_CONTENT_NEGOTIATION_CLASS": "core.renderers.ContentNegotiation",
+}
+
+# Access tokens are short-lived; clients renew them at /api/auth/refresh/ with
+# the refresh token, which is rotated on every use (apps.accounts.tokens).
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=int(os.getenv("JWT_ACCESS_MINUTES", "5"))),
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=int(os.getenv("JWT_REFRESH_DAYS", "7"))),
 }
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+
+# Seconds a token's user (apps.accounts.authentication) and a user's project
+# ids (apps.projects.access) stay in the default cache. Both are evicted on
+# writes in this process; other processes see changes after at most the TTL.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))
+PROJECT_ACCESS_CACHE_TTL = int(os.getenv("PROJECT_ACCESS_CACHE_TTL", "30"))
+
+# Server processes (core.wsgi / core.asgi) purge used and expired email
+# verification codes and expired revoked refresh tokens every
+# ACCOUNT_PURGE_INTERVAL seconds (0 disables), at most ACCOUNT_PURGE_BATCH_SIZE
+# rows per DELETE (apps.accounts.maintenance).
+ACCOUNT_PURGE_INTERVAL = int(os.getenv("ACCOUNT_PURGE_INTERVAL", "3600"))
+ACCOUNT_PURGE_BATCH_SIZE = int(os.getenv("ACCOUNT_PURGE_BATCH_SIZE", "1000"))
+
+# Token-bucket throttling of login, verification and password-reset requests
+# (core.throttling), per client IP and per email/uid: "local" (per process),
+# "mmap" (THROTTLE_MMAP_PATH, shared by the workers on a host) or "off".
+# Behind a reverse proxy set REST_FRAMEWORK["NUM_PROXIES"] so the client IP
+# is taken from X-Forwarded-For.
+THROTTLE_BACKEND = os.getenv("THROTTLE_BACKEND", "local")
+THROTTLE_MMAP_PATH = os.getenv("THROTTLE_MMAP_PATH", str(BASE_DIR / "throttle.mmap"))
+THROTTLE_MMAP_SLOTS = int(os.getenv("THROTTLE_MMAP_SLOTS", "65536"))
+THROTTLE_RATES = {
+    "login": {"ip": "30/min", "email": "10/min"},
+    "verify-send": {"ip": "10/min", "email": "3/min"},
+    "verify-confirm": {"ip": "30/min", "uid": "5/min"},
+    "forgot": {"ip": "10/min", "email": "3/min"},
+}
+
+# Serve the read-heavy dashboard/summary endpoints with async views
+# (apps/*/async_views.py). Only useful under an ASGI server (core.asgi).
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "False") == "True"
+
+# Per-section export profiling (core.instrumentation), logged as one JSON
+# line per export to "sonreb.instrumentation"; opt-in. Memory tracing uses
+# tracemalloc, which slows exports noticeably, so it is opt-in as well.
+EXPORT_PROFILING = os.getenv("EXPORT_PROFILING", "False") == "True"
+PROFILE_TRACE_MEMORY = os.getenv("PROFILE_TRACE_MEMORY", "False") == "True"
+
+# Server-Timing header and a "sonreb.timing" log line on every request
+# (core.middleware.ServerTimingMiddleware): total, SQL, serializer and render time.
+SERVER_TIMING = os.getenv("SERVER_TIMING", "False") == "True"
+
+# Prometheus metrics at /metrics (core.metrics), opt-in. With several worker
+# processes set METRICS_DIR to a directory that is emptied on every
+# deploy/restart. /metrics is only served when METRICS_TOKEN is set, to
+# scrapers sending it as "Authorization: Bearer <token>".
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False") == "True"
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Opt-in slow-query capture (core.slow_queries): queries slower than
+# SLOW_QUERY_MS (0 disables) are captured with their plan, kept in a
+# per-process ring buffer of SLOW_QUERY_BUFFER entries for
+# /api/admin/slow-queries/ and, if SLOW_QUERY_LOG is set, appended to that
+# JSONL file for "manage.py slow_queries". Parameter values are never kept.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+SLOW_QUERY_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER", "200"))
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# Cache for computed payloads such as the report summary (core.response_cache):
+# "local" (per process), "file" (RESPONSE_CACHE_DIR, shared by the workers on
+# a host) or "off". Entries are keyed by the project's data version.
+RESPONSE_CACHE = os.getenv("RESPONSE_CACHE", "local")
+RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", str(BASE_DIR / "response_cache"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# gzip/brotli response compression (core.compression) for JSON, CSV and other
+# text bodies of at least COMPRESSION_MIN_BYTES; streamed exports included.
+# Against BREACH, gzip bodies are padded with up to COMPRESSION_MAX_RANDOM_BYTES
+# random bytes (as Django's GZipMiddleware does) and requests with credentials
+# only get (unpaddable) brotli when COMPRESSION_BROTLI_WITH_CREDENTIALS=True.
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True") == "True"
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+COMPRESSION_MAX_RANDOM_BYTES = int(os.getenv("COMPRESSION_MAX_RANDOM_BYTES", "100"))
+COMPRESSION_BROTLI_WITH_CREDENTIALS = os.getenv("COMPRESSION_BROTLI_WITH_CREDENTIALS", "False") == "True"
+
+# Chart backend for PDF reports: "vector" (native ReportLab) or "matplotlib".
+# Exports can override it per request with ``chart_backend``.
+REPORT_CHART_BACKEND = os.getenv("REPORT_CHART_BACKEND", "vector")
+
+# ReportEngine (apps.readings.reporting) caches the collect and compute stages
+# in the default cache. Rendered exports are only cached when they are at most
+# REPORT_RENDER_CACHE_MAX_BYTES; 0 keeps PDF/CSV bytes out of the cache.
+REPORT_RENDER_CACHE_MAX_BYTES = int(os.getenv("REPORT_RENDER_CACHE_MAX_BYTES", "0"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(asctime)s %(levelname)s %(name)s %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "plain"},
+    },
+    "loggers": {
+        "sonreb": {
+            "handlers": ["console"],
+            "level": os.getenv("SONREB_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
+}
@@ -0,0 +1,189 @@
+# backend/core/slow_queries.py
+"""
+Slow-query capture.
+
+SlowQueryMiddleware wraps every request's SQL with ``connection.execute_wrapper``.
+Any query that takes at least SLOW_QUERY_MS is recorded with the URL name of
+the view that sent it and the database's plan for it (``EXPLAIN QUERY PLAN``
+on SQLite, ``EXPLAIN`` elsewhere). Parameters can hold password hashes,
+tokens and emails, so a capture keeps only the normalized SQL, the parameter
+types and the plan with its string literals masked. Captures go into a
+per-process ring buffer of SLOW_QUERY_BUFFER entries, served to staff users
+at /api/admin/slow-queries/, and, when SLOW_QUERY_LOG is set, are appended to
+that JSONL file (rotated once at SLOW_QUERY_LOG_MAX_BYTES) for
+``manage.py slow_queries``.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+_buffer = None
+_buffer_lock = threading.Lock()
+_explaining = threading.local()
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\bIN \((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> tuple[str, str]:
+    """(id, normalized SQL): literals become ?, IN lists collapse to IN (...)."""
+    normalized = _STRING.sub("?", sql)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _SPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest(), normalized
+
+
+def get_buffer() -> deque:
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = deque(maxlen=getattr(settings, "SLOW_QUERY_BUFFER", 200))
+    return _buffer
+
+
+def param_types(params) -> list:
+    return [type(value).__name__ for value in params or ()]
+
+
+def explain(sql: str, params) -> list:
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return []
+    prefix = "EXPLAIN QUERY PLAN" if connection.vendor == "sqlite" else "EXPLAIN"
+    # Inside a transaction a failed EXPLAIN must not abort the caller's work
+    # (PostgreSQL), so use a savepoint; outside one, don't open a transaction.
+    guard = transaction.atomic() if connection.in_atomic_block else nullcontext()
+    _explaining.active = True
+    try:
+        with guard, connection.cursor() as cursor:
+            cursor.execute(f"{prefix} {sql}", params)
+            rows = cursor.fetchall()
+    except Exception as exc:  # never fail the request because of the plan
+        return [f"EXPLAIN failed: {exc}"]
+    finally:
+        _explaining.active = False
+    if connection.vendor == "sqlite":
+        lines = [str(row[-1]) for row in rows]
+    else:
+        lines = [" ".join(str(col) for col in row) for row in rows]
+    # PostgreSQL prints bound values in filter conditions ('...'::text).
+    return [_STRING.sub("?", line) for line in lines]
+
+
+def spill(entry: dict):
+    path = getattr(settings, "SLOW_QUERY_LOG", "")
+    if not path:
+        return
+    max_bytes = getattr(settings, "SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024)
+    line = json.dumps(entry, default=str) + "\n"
+    with _buffer_lock:
+        try:
+            if os.path.getsize(path) + len(line) > max_bytes:
+                os.replace(path, f"{path}.1")
+        except FileNotFoundError:
+            pass
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(line)
+
+
+class SlowQueryRecorder:
+    def __init__(self, request, threshold_ms: float):
+        self.request = request
+        self.threshold = threshold_ms / 1000
+
+    def __call__(self, execute, sql, params, many, context):
+        if getattr(_explaining, "active", False):
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration = time.perf_counter() - start
+        if duration >= self.threshold:
+            self.capture(sql, params, many, duration)
+        return result
+
+    def capture(self, sql, params, many, duration):
+        match = self.request.resolver_match
+        fp, normalized = fingerprint(sql)
+        entry = {
+            "at": timezone.now().isoformat(),
+            "duration_ms": round(duration * 1000, 2),
+            "view": match.url_name if match else None,
+            "method": self.request.method,
+            "path": self.request.path,
+            "fingerprint": fp,
+            "normalized": normalized,
+            "param_types": None if many else param_types(params),
+            "vendor": connection.vendor,
+            "pid": os.getpid(),
+            "plan": [] if many else explain(sql, params),
+        }
+        get_buffer().append(entry)
+        spill(entry)
+
+
+def aggregate(entries) -> list:
+    """Group captures by fingerprint, slowest total time first."""
+    groups = {}
+    for entry in entries:
+        group = groups.get(entry["fingerprint"])
+        if group is None:
+            group = groups[entry["fingerprint"]] = {
+                "fingerprint": entry["fingerprint"],
+                "normalized": entry["normalized"],
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "views": {},
+                "plan": entry["plan"],
+            }
+        group["count"] += 1
+        group["total_ms"] += entry["duration_ms"]
+        if entry["duration_ms"] >= group["max_ms"]:
+            group["max_ms"] = entry["duration_ms"]
+            group["plan"] = entry["plan"]
+        view = entry.get("view") or "-"
+        group["views"][view] = group["views"].get(view, 0) + 1
+    result = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)
+    for group in result:
+        group["total_ms"] = round(group["total_ms"], 2)
+        group["avg_ms"] = round(group["total_ms"] / group["count"], 2)
+    return result
+
+
+class SlowQueryListView(APIView):
+    """Recent slow queries of the serving process; ``?aggregate=1`` groups them."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        entries = list(get_buffer())
+        payload = {"threshold_ms": getattr(settings, "SLOW_QUERY_MS", 0), "pid": os.getpid()}
+        if request.query_params.get("aggregate") in ("1", "true"):
+            payload["groups"] = aggregate(entries)
+        else:
+            payload["queries"] = entries[::-1]
+        return Response(payload)
+
+    def delete(self, request):
+        get_buffer().clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,743 @@
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import uuid
+from collections import namedtuple
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, get_resolver, reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from apps.accounts.maintenance import PurgeScheduler, purge_email_verifications, purge_revoked_tokens
+from apps.accounts.authentication import user_cache_key
+from apps.accounts.models import EmailVerification, RevokedRefreshToken
+from apps.accounts.throttles import (
+    ConfirmVerificationThrottle,
+    ForgotPasswordThrottle,
+    LoginThrottle,
+    SendVerificationThrottle,
+)
+from apps.accounts.tokens import issue_tokens
+from apps.accounts.views import create_email_verification, generate_tokens_for_user
+from apps.calibration.models import CalibrationPoint
+from apps.projects.models import Member, Project
+from apps.readings.columnar import pyarrow_available
+from apps.readings.models import Reading, ReadingFolder, Report, ReportPhoto
+from apps.readings.tests import seed_project
+from apps.readings.views import reading_list_queryset
+from core import metrics, slow_queries
+from core.compression import brotli
+from core.instrumentation import NULL_PROFILER, Profiler, start_profiler
+from core.renderers import FastJSONRenderer, msgpack
+from core.throttling import LocalBucketStore, MmapBucketStore, get_store as get_throttle_store, parse_rate
+
+MEDIA_ROOT = tempfile.mkdtemp()
+PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+# Two seed sizes: query counts must be identical for both, i.e. constant in N.
+SIZES = {
+    "small": {"readings": 5, "cores": 5, "photos": 1, "reports": 1},
+    "large": {"readings": 120, "cores": 15, "photos": 12, "reports": 6},
+}
+
+Endpoint = namedtuple("Endpoint", "method name budget kwargs data query", defaults=(None, None, ""))
+
+
+def project_kwargs(ctx):
+    return {"pk": ctx["project"].id}
+
+
+# Query budget per endpoint, measured with an already-authenticated client.
+# Raising a budget should be a deliberate, reviewed change. Writes to project
+# data include one UPDATE of Project.data_version (apps.projects.versioning).
+# Caches start empty, so views checking ownership with apps.projects.access
+# count the project-ids query they skip while it is cached.
+BUDGETS = [
+    # accounts
+    Endpoint("post", "auth-register", 4, data=lambda ctx: {
+        "name": "New", "email": f"new-{ctx['size']}@example.com", "password": "Str0ng-pass!9",
+    }),
+    Endpoint("post", "auth-login", 1, data=lambda ctx: {"email": ctx["user"].email, "password": "secret123"}),
+    Endpoint("post", "auth-refresh", 2, data=lambda ctx: {"refresh": issue_tokens(ctx["user"])["refresh"]}),
+    Endpoint("post", "auth-logout", 1, data=lambda ctx: {"refresh": issue_tokens(ctx["user"])["refresh"]}),
+    Endpoint("get", "auth-me", 1),
+    Endpoint("post", "auth-forgot", 1, data=lambda ctx: {"email": ctx["user"].email}),
+    Endpoint("post", "auth-reset", 2, data=lambda ctx: {
+        "uid": urlsafe_base64_encode(force_bytes(ctx["user"].pk)),
+        "token": PasswordResetTokenGenerator().make_token(ctx["user"]),
+        "new_password": "An0ther-pass!9",
+        "confirm_password": "An0ther-pass!9",
+    }),
+    Endpoint("post", "auth-verify-send", 3, data=lambda ctx: {"email": ctx["user"].email}),
+    Endpoint("post", "auth-verify-confirm", 4, data=lambda ctx: {
+        "uid": urlsafe_base64_encode(force_bytes(ctx["user"].pk)),
+        "code": create_email_verification(ctx["user"]).code,
+    }),
+    # projects
+    Endpoint("get", "project-list-create", 1),
+    Endpoint("post", "project-list-create", 1, data=lambda ctx: {
+        "name": "New", "location": "Site", "structure_age": 3, "latitude": 1.0, "longitude": 2.0,
+    }),
+    Endpoint("get", "project-detail", 1, kwargs=project_kwargs),
+    Endpoint("patch", "project-detail", 3, kwargs=project_kwargs, data={"notes": "updated"}),
+    Endpoint("delete", "project-detail", 14, kwargs=project_kwargs),
+    Endpoint("get", "project-members", 2, kwargs=project_kwargs),
+    Endpoint("post", "project-members", 4, kwargs=project_kwargs, data={"member_id": "B9", "type": "Beam"}),
+    Endpoint("patch", "project-member-detail", 4, kwargs=lambda ctx: {
+        "pk": ctx["project"].id, "member_id": ctx["member"].id,
+    }, data={"level": "L2"}),
+    Endpoint("delete", "project-member-detail", 6, kwargs=lambda ctx: {
+        "pk": ctx["project"].id, "member_id": ctx["member"].id,
+    }),
+    Endpoint("get", "project-summary", 2, kwargs=project_kwargs),
+    Endpoint("get", "project-ratings", 2, kwargs=project_kwargs),
+    Endpoint("get", "project-fc-histogram", 3, kwargs=project_kwargs),
+    Endpoint("get", "project-report-summary", 5, kwargs=project_kwargs),
+    Endpoint("get", "project-bundle", 5, kwargs=project_kwargs),
+    # readings
+    Endpoint("get", "reading-list-create", 2, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "reading-list-create", 7, data=lambda ctx: {
+        "project": ctx["project"].id, "member": ctx["member"].id, "upv": 4000, "rh_index": 35,
+    }),
+    Endpoint("post", "reading-bulk-create", 5, data=lambda ctx: {
+        "project": ctx["project"].id,
+        "readings": [{"member": str(ctx["member"].id), "upv": 3900 + i, "rh_index": 33} for i in range(50)],
+    }),
+    Endpoint("get", "reading-detail", 1, kwargs=lambda ctx: {"pk": ctx["reading"].id}),
+    Endpoint("patch", "reading-detail", 4, kwargs=lambda ctx: {"pk": ctx["reading"].id}, data={"upv": 4100}),
+    Endpoint("delete", "reading-detail", 3, kwargs=lambda ctx: {"pk": ctx["reading"].id}),
+    Endpoint("get", "report-list-create", 2),
+    Endpoint("post", "report-list-create", 6, data=lambda ctx: {"project": ctx["project"].id, "title": "New"}),
+    Endpoint("patch", "report-detail", 4, kwargs=lambda ctx: {"pk": ctx["report"].id}, data={"notes": "x"}),
+    Endpoint("delete", "report-detail", 4, kwargs=lambda ctx: {"pk": ctx["report"].id}),
+    Endpoint("post", "report-export", 7, data=lambda ctx: {"report_id": ctx["report"].id, "format": "csv"}),
+    Endpoint("get", "report-export", 1, query=lambda ctx: f"report_id={ctx['report'].id}"),
+    Endpoint("get", "reading-export-columnar", 2, query=lambda ctx: f"project={ctx['project'].id}&table=readings"),
+    Endpoint("get", "report-folders", 1),
+    Endpoint("get", "reading-folders", 1, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "reading-folders", 4, data=lambda ctx: {"project": ctx["project"].id, "name": "New"}),
+    Endpoint("get", "reading-folders-derived", 1, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "report-upload", 3, data=lambda ctx: {
+        "type": "photo", "report": ctx["report"].id, "file": SimpleUploadedFile("p.png", PNG, "image/png"),
+    }),
+    Endpoint("get", "report-summary", 5, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "report-photo-create", 4, data=lambda ctx: {
+        "report": ctx["report"].id, "image_url": "http://testserver/media/new.png",
+    }),
+    Endpoint("delete", "report-photo-delete", 3, kwargs=lambda ctx: {"pk": ctx["photo"].id}),
+    Endpoint("get", "reading-folder-list", 1),
+    Endpoint("post", "reading-folder-list", 4, data=lambda ctx: {"project": ctx["project"].id, "name": "Other"}),
+    Endpoint("patch", "reading-folder-detail", 3, kwargs=lambda ctx: {"pk": ctx["folder"].id}, data={"notes": "x"}),
+    Endpoint("delete", "reading-folder-detail", 2, kwargs=lambda ctx: {"pk": ctx["folder"].id}),
+    # calibration
+    Endpoint("get", "calibration-points", 2, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "calibration-points", 4, data=lambda ctx: {
+        "project": ctx["project"].id, "upv": 4000, "rh_index": 35, "core_fc": 25,
+    }),
+    Endpoint("patch", "calibration-point-detail", 3, kwargs=lambda ctx: {"pk": ctx["point"].id}, data={"notes": "x"}),
+    Endpoint("delete", "calibration-point-detail", 3, kwargs=lambda ctx: {"pk": ctx["point"].id}),
+    Endpoint("post", "calibration-generate", 7, data=lambda ctx: {"project": ctx["project"].id}),
+    Endpoint("get", "calibration-model", 2, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "calibration-model", 2, data=lambda ctx: {"project": ctx["project"].id}),
+    Endpoint("get", "calibration-active", 2, query=lambda ctx: f"project={ctx['project'].id}"),
+    Endpoint("post", "calibration-active", 2, data=lambda ctx: {"project": ctx["project"].id}),
+    Endpoint("get", "calibration-diagnostics", 3, query=lambda ctx: f"project={ctx['project'].id}"),
+    # core
+    Endpoint("get", "metrics", 0),
+]
+
+APP_URLCONFS = ("apps.accounts.urls", "apps.projects.urls", "apps.readings.urls", "apps.calibration.urls")
+HTTP_METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def _resolve(value, ctx):
+    return value(ctx) if callable(value) else value
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, METRICS_ENABLED=True, METRICS_TOKEN="scrape-token")
+class QueryBudgetTests(TestCase):
+    """
+    Every endpoint in apps/*/urls.py runs against a small and a large seeded
+    project. The query count must fit its budget and be the same at both
+    sizes, so an N+1 fails here instead of in production.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.contexts = {}
+        for size, counts in SIZES.items():
+            user = User.objects.create_user(
+                username=f"{size}@example.com", email=f"{size}@example.com", password="secret123"
+            )
+            project, report = seed_project(
+                user, size, readings=counts["readings"], cores=counts["cores"], photos=counts["photos"]
+            )
+            for i in range(counts["reports"] - 1):
+                Report.objects.create(project=project, title=f"Extra {i}", folder=f"F{i}")
+            cls.contexts[size] = {
+                "size": size,
+                "user": user,
+                "project": project,
+                "report": report,
+                "member": Member.objects.filter(project=project).first(),
+                "reading": Reading.objects.filter(project=project).first(),
+                "photo": ReportPhoto.objects.filter(report=report).first(),
+                "point": CalibrationPoint.objects.filter(project=project).first(),
+                "folder": ReadingFolder.objects.create(project=project, name="Zone A"),
+            }
+            # A previous export for GET report-export to serve.
+            os.makedirs(os.path.join(MEDIA_ROOT, "exports"), exist_ok=True)
+            with open(os.path.join(MEDIA_ROOT, "exports", f"report_{report.id}.pdf"), "wb") as fh:
+                fh.write(b"%PDF-1.4\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def count_queries(self, endpoint, ctx):
+        cache.clear()
+        client = APIClient()
+        client.force_authenticate(ctx["user"])
+        if endpoint.name == "metrics":
+            client.credentials(HTTP_AUTHORIZATION="Bearer scrape-token")
+        url = reverse(endpoint.name, kwargs=_resolve(endpoint.kwargs, ctx))
+        query = _resolve(endpoint.query, ctx)
+        if query:
+            url = f"{url}?{query}"
+        data = _resolve(endpoint.data, ctx)
+        fmt = "multipart" if endpoint.name == "report-upload" else "json"
+        with CaptureQueriesContext(connection) as queries:
+            if endpoint.method == "get":
+                response = client.get(url)
+            else:
+                response = getattr(client, endpoint.method)(url, data, format=fmt)
+        self.assertLess(response.status_code, 400, f"{endpoint.method.upper()} {url} -> {response.status_code}")
+        # Savepoints/transactions are not queries the view chose to send.
+        return len([q for q in queries if not q["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK"))])
+
+    def test_endpoint_budgets(self):
+        for endpoint in BUDGETS:
+            if endpoint.name == "reading-export-columnar" and not pyarrow_available():
+                continue
+            with self.subTest(method=endpoint.method, name=endpoint.name):
+                counts = {}
+                for size, ctx in self.contexts.items():
+                    # Each size starts from the seeded state, even for writes/deletes.
+                    sid = transaction.savepoint()
+                    try:
+                        counts[size] = self.count_queries(endpoint, ctx)
+                    finally:
+                        transaction.savepoint_rollback(sid)
+                self.assertEqual(
+                    counts["small"], counts["large"], f"query count grows with N: {counts}"
+                )
+                self.assertLessEqual(
+                    counts["large"], endpoint.budget, f"over budget ({endpoint.budget}): {counts}"
+                )
+
+    def test_every_endpoint_has_a_budget(self):
+        budgeted = {(endpoint.method, endpoint.name) for endpoint in BUDGETS}
+        missing = []
+        for urlconf in APP_URLCONFS:
+            for pattern in get_resolver(urlconf).url_patterns:
+                if not isinstance(pattern, URLPattern):
+                    continue
+                view_class = getattr(pattern.callback, "view_class", None)
+                for method in HTTP_METHODS:
+                    if view_class and hasattr(view_class, method) and (method, pattern.name) not in budgeted:
+                        missing.append(f"{method.upper()} {pattern.name}")
+        self.assertFalse(missing, "endpoints without a query budget: " + ", ".join(missing))
+
+
+class CachedAccessTests(TestCase):
+    """Token users and owned project ids are resolved from the cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="a@example.com", email="a@example.com", password="secret123")
+        cls.project, _ = seed_project(cls.user, "Mine", readings=10)
+        other = User.objects.create_user(username="b@example.com", email="b@example.com", password="secret123")
+        cls.other_project, _ = seed_project(other, "Theirs", readings=10)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens_for_user(self.user)}")
+
+    def count(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response, len(queries)
+
+    def test_token_user_is_cached_until_saved(self):
+        response, cold = self.count("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["email"], "a@example.com")
+        response, warm = self.count("/api/auth/me/")
+        self.assertEqual((cold, warm), (2, 1))  # the profile itself is always read
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 401)
+
+    def test_cache_keeps_no_password_hash(self):
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+        entry = cache.get(user_cache_key(self.user.pk))
+        self.assertEqual(entry[:2], (self.user.pk, True))
+        self.assertNotIn(self.user.password.split("$")[-1], repr(entry))
+
+    def test_tokens_from_before_a_password_change_are_refused(self):
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+        self.user.set_password("N3w-passphrase!")
+        self.user.save()
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 401)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens_for_user(self.user)}")
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+
+    def test_ownership_checks_reuse_cached_project_ids(self):
+        url = f"/api/calibration/active/?project={self.project.id}"
+        _, cold = self.count(url)
+        response, warm = self.count(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cold - warm, 2)  # user and project ids
+
+        self.assertEqual(self.client.get(f"/api/calibration/active/?project={self.other_project.id}").status_code, 404)
+        new = Project.objects.create(owner=self.user, name="New", location="Site")
+        self.assertEqual(self.client.get(f"/api/calibration/points/?project={new.id}").status_code, 200)
+
+    def test_reading_list_is_scoped_to_the_owner(self):
+        projects = {row["project"] for row in self.client.get("/api/readings/").json()}
+        self.assertEqual(projects, {self.project.id})
+        self.assertEqual(self.client.get(f"/api/readings/?project={self.other_project.id}").json(), [])
+
+
+class RefreshTokenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="t@example.com", email="t@example.com", password="secret123")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post("/api/auth/login/", {"email": "t@example.com", "password": "secret123"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def refresh(self, token):
+        return self.client.post("/api/auth/refresh/", {"refresh": token}, format="json")
+
+    def test_refresh_rotates_and_rejects_reuse(self):
+        first = self.login()["refresh"]
+        response = self.refresh(first)
+        self.assertEqual(response.status_code, 200)
+        second = response.json()
+        self.assertNotEqual(second["refresh"], first)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {second['token']}")
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+
+        self.assertEqual(self.refresh(first).status_code, 401)
+        self.assertEqual(self.refresh(second["refresh"]).status_code, 200)
+
+    def test_logout_revokes_the_refresh_token(self):
+        token = self.login()["refresh"]
+        self.assertEqual(self.client.post("/api/auth/logout/", {"refresh": token}, format="json").status_code, 204)
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_inactive_user_cannot_refresh(self):
+        token = self.login()["refresh"]
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_password_reset_invalidates_refresh_tokens(self):
+        token = self.login()["refresh"]
+        response = self.client.post(
+            "/api/auth/reset/",
+            {
+                "uid": urlsafe_base64_encode(force_bytes(self.user.pk)),
+                "token": PasswordResetTokenGenerator().make_token(self.user),
+                "new_password": "N3w-passphrase!",
+                "confirm_password": "N3w-passphrase!",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.refresh(token).status_code, 401)
+        response = self.client.post(
+            "/api/auth/login/", {"email": "t@example.com", "password": "N3w-passphrase!"}, format="json"
+        )
+        self.assertEqual(self.refresh(response.json()["refresh"]).status_code, 200)
+
+    def test_password_change_elsewhere_invalidates_refresh_tokens(self):
+        pair = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {pair['token']}")
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)  # user now cached
+        # Another process resets the password: no eviction reaches this one.
+        User.objects.filter(pk=self.user.pk).update(password="pbkdf2_sha256$1$x$y")
+        self.assertEqual(self.refresh(pair["refresh"]).status_code, 401)
+
+    def test_access_token_is_not_a_refresh_token(self):
+        self.assertEqual(self.refresh(self.login()["token"]).status_code, 401)
+
+    def test_purge_keeps_unexpired_revocations(self):
+        now = timezone.now()
+        RevokedRefreshToken.objects.bulk_create(
+            RevokedRefreshToken(jti=uuid.uuid4(), expires_at=now + timedelta(days=offset))
+            for offset in (-3, -2, -1, 1, 2)
+        )
+        self.assertEqual(purge_revoked_tokens(batch_size=2), 3)
+        self.assertEqual(RevokedRefreshToken.objects.count(), 2)
+
+
+class AccountPurgeTests(TestCase):
+    def test_used_and_expired_codes_are_purged_in_batches(self):
+        now = timezone.now()
+        users = [
+            User.objects.create_user(username=f"v{i}@example.com", email=f"v{i}@example.com", password="x")
+            for i in range(2)
+        ]
+        for user in users:
+            EmailVerification.objects.bulk_create([
+                EmailVerification(user=user, code="111111", expires_at=now + timedelta(minutes=10)),
+                EmailVerification(user=user, code="222222", expires_at=now + timedelta(minutes=10), used=True),
+                EmailVerification(user=user, code="333333", expires_at=now - timedelta(minutes=1)),
+            ])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(purge_email_verifications(batch_size=3), 4)
+        self.assertEqual(sum(q["sql"].startswith("DELETE") for q in queries), 2)
+        self.assertEqual(set(EmailVerification.objects.values_list("code", flat=True)), {"111111"})
+
+    def test_scheduler_pass_runs_both_purges(self):
+        RevokedRefreshToken.objects.create(jti=uuid.uuid4(), expires_at=timezone.now() - timedelta(days=1))
+        EmailVerification.objects.create(
+            user=User.objects.create_user(username="s@example.com", password="x"),
+            code="123456",
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        with self.assertLogs("sonreb.maintenance", "INFO") as logs:
+            PurgeScheduler(interval=3600, batch_size=10).run_once()
+        self.assertIn("Purged 1 verification codes, 1 revoked tokens.", logs.output[0])
+
+    def test_confirmation_lookup_uses_the_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Index choice is only pinned for SQLite plans")
+        sql, params = EmailVerification.objects.filter(user_id=1, code="123456", used=False).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("emailverif_lookup_idx", plan)
+
+
+LOGIN_RATES = {"login": {"ip": "5/min", "email": "2/min"}}
+
+
+@override_settings(THROTTLE_RATES=LOGIN_RATES)
+class ThrottleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(username="l@example.com", email="l@example.com", password="secret123")
+
+    def setUp(self):
+        get_throttle_store().clear()
+        self.client = APIClient()
+
+    def tearDown(self):
+        get_throttle_store().clear()
+
+    def login(self, email, password="secret123"):
+        return self.client.post("/api/auth/login/", {"email": email, "password": password}, format="json")
+
+    def test_email_bucket_refuses_before_any_query(self):
+        self.assertEqual(self.login("l@example.com", "wrong").status_code, 401)
+        self.assertEqual(self.login("L@example.com ", "wrong").status_code, 401)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.login("l@example.com")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(len(queries), 0)
+
+    def test_ip_bucket_covers_every_email(self):
+        statuses = [self.login(f"user{i}@example.com").status_code for i in range(6)]
+        self.assertEqual(statuses, [401] * 5 + [429])
+
+    def test_refused_email_keeps_the_ip_tokens(self):
+        for _ in range(2):
+            self.login("l@example.com", "wrong")
+        self.assertEqual([self.login("l@example.com").status_code for _ in range(3)], [429] * 3)
+        self.assertEqual([self.login(f"other{i}@example.com").status_code for i in range(4)], [401] * 3 + [429])
+
+    def test_non_object_body_is_throttled_by_ip(self):
+        self.assertEqual(self.client.post("/api/auth/login/", [{"email": "l@example.com"}], format="json").status_code, 400)
+        request = Request(RequestFactory().post("/", "[]", content_type="application/json"), parsers=[JSONParser()])
+        for throttle in (LoginThrottle, SendVerificationThrottle, ConfirmVerificationThrottle, ForgotPasswordThrottle):
+            self.assertEqual(list(throttle().identities(request)), ["ip"])
+
+    def test_tokens_refill_over_time(self):
+        store = LocalBucketStore()
+        capacity, rate = parse_rate("2/min")
+        waits = [store.take([("k", capacity, rate)], now=1000.0) for _ in range(3)]
+        self.assertEqual(waits[:2], [[0.0], [0.0]])
+        self.assertAlmostEqual(waits[2][0], 30.0)
+        self.assertEqual(store.take([("k", capacity, rate)], now=1030.0), [0.0])
+
+    def test_buckets_are_taken_together(self):
+        for store in (LocalBucketStore(), MmapBucketStore(os.path.join(self.directory(), "t.mmap"), 64)):
+            with self.subTest(store=type(store).__name__):
+                one, two = ("ip", *parse_rate("3/min")), ("email", *parse_rate("1/min"))
+                self.assertEqual(store.take([one, two], now=1000.0), [0.0, 0.0])
+                self.assertAlmostEqual(store.take([one, two], now=1000.0)[1], 60.0)
+                self.assertEqual(store.take([one], now=1000.0), [0.0])
+                self.assertEqual(store.take([one], now=1000.0), [0.0])
+                self.assertAlmostEqual(store.take([one], now=1000.0)[0], 20.0)
+
+    def directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        return directory
+
+    def test_mmap_buckets_are_shared_between_stores(self):
+        path = os.path.join(self.directory(), "throttle.mmap")
+        first, second = MmapBucketStore(path, 64), MmapBucketStore(path, 64)
+        bucket = ("k", *parse_rate("2/min"))
+        self.assertEqual(first.take([bucket], now=1000.0), [0.0])
+        self.assertEqual(second.take([bucket], now=1000.0), [0.0])
+        self.assertAlmostEqual(first.take([bucket], now=1000.0)[0], 30.0)
+        # More keys than slots: old buckets are reused instead of failing.
+        for i in range(200):
+            second.take([(f"other-{i}", *parse_rate("2/min"))], now=1001.0 + i)
+
+
+class ProfilerTests(TestCase):
+    def test_off_by_default(self):
+        self.assertIs(start_profiler("export"), NULL_PROFILER)
+
+    def test_overlapping_profilers_share_tracemalloc(self):
+        self.assertFalse(tracemalloc.is_tracing())
+        first, second = Profiler("a", trace_memory=True), Profiler("b", trace_memory=True)
+        first.finish()
+        self.assertTrue(tracemalloc.is_tracing())
+        with second.section("render"):
+            bytearray(1 << 20)
+        self.assertGreater(second.finish()["sections"]["render"]["peak_kb"], 1000)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        Profiler("c", trace_memory=True).finish()
+        self.assertTrue(tracemalloc.is_tracing())
+
+
+class SlowQueryCaptureTests(TestCase):
+    def test_captures_keep_no_parameter_values(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, "slow.jsonl")
+        secret = "hunter2-hash@example.com"
+        slow_queries.get_buffer().clear()
+        with override_settings(SLOW_QUERY_LOG=path):
+            recorder = slow_queries.SlowQueryRecorder(RequestFactory().get("/api/auth/me/"), threshold_ms=0)
+            with connection.execute_wrapper(recorder):
+                User.objects.filter(email=secret, username__startswith="x").first()
+        entry = slow_queries.get_buffer()[-1]
+        self.assertEqual(entry["param_types"], ["str", "str"])
+        self.assertTrue(entry["plan"])
+        with open(path, encoding="utf-8") as fh:
+            logged = fh.read()
+        for text in (json.dumps(entry, default=str), logged):
+            self.assertNotIn("hunter2", text)
+
+        for options in ({}, {"dump": True}):
+            out = io.StringIO()
+            call_command("slow_queries", file=path, stdout=out, **options)
+            self.assertIn(entry["fingerprint"], out.getvalue())
+            self.assertIn("1 captures", out.getvalue())
+            out = io.StringIO()
+            call_command("slow_queries", file=path, json=True, stdout=out, **options)
+            self.assertEqual(json.loads(out.getvalue())[0]["fingerprint"], entry["fingerprint"])
+
+
+class MetricsEndpointTests(TestCase):
+    def get(self, token=None):
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"} if token else {}
+        return self.client.get(reverse("metrics"), **headers)
+
+    def test_not_served_by_default(self):
+        self.assertEqual(self.get().status_code, 404)
+
+    def test_disabled_metrics_record_nothing(self):
+        self.addCleanup(setattr, metrics, "_store", metrics._store)
+        metrics._store = None
+        metrics.CACHE_REQUESTS.inc(cache="test", result="hit")
+        metrics.REQUEST_LATENCY.observe(0.1, view="test", method="GET")
+        with metrics.EXPORT_JOBS.track(kind="test"):
+            pass
+        self.assertIsNone(metrics._store)
+
+    @override_settings(METRICS_ENABLED=True, METRICS_TOKEN="")
+    def test_not_served_without_a_token(self):
+        self.assertEqual(self.get().status_code, 404)
+
+    @override_settings(METRICS_ENABLED=True, METRICS_TOKEN="scrape-token")
+    def test_requires_the_token(self):
+        self.assertEqual(self.get().status_code, 401)
+        self.assertEqual(self.get("wrong").status_code, 401)
+        response = self.get("scrape-token")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"# TYPE", response.content)
+
+
+class RendererTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="r@example.com", email="r@example.com", password="secret123")
+        cls.project, _ = seed_project(cls.user, "Formats", readings=40)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"/api/readings/?project={self.project.id}"
+
+    def test_default_json_matches_drf(self):
+        urls = [self.url, f"/api/calibration/diagnostics/?project={self.project.id}"]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response["Content-Type"], "application/json")
+                self.assertEqual(response.content, JSONRenderer().render(response.data))
+        self.assertIn(b'Z"', response.content)  # raw created_at datetimes
+
+        odd = {
+            "when": timezone.now().replace(microsecond=123456),
+            "day": timezone.now().date(),
+            "big": 1e16,
+            "tiny": 1e-7,
+            1: "int key",
+            "text": "line\u2028separator",
+        }
+        self.assertEqual(FastJSONRenderer().render(odd), JSONRenderer().render(odd))
+
+    def test_columnar_layout(self):
+        rows = self.client.get(self.url).json()
+        response = self.client.get(self.url, HTTP_ACCEPT="application/vnd.sonreb.columnar+json")
+        columns = json.loads(response.content)
+        self.assertEqual(list(columns), list(rows[0]))
+        self.assertEqual(columns["id"], [row["id"] for row in rows])
+        self.assertEqual(self.client.get(f"{self.url}&format=columnar").content, response.content)
+
+        summary = self.client.get(f"/api/readings/reports/summary/?project={self.project.id}&format=columnar").json()
+        self.assertEqual(len(summary["field_grid"]["id"]), 40)
+
+    def test_msgpack(self):
+        if msgpack is None:
+            self.skipTest("msgpack is not installed")
+        columns = self.client.get(f"{self.url}&format=columnar").json()
+        response = self.client.get(self.url, HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), columns)
+
+    def test_columns_match_the_readings(self):
+        readings = list(
+            reading_list_queryset(self.project.id)
+            .values("id", "upv", "rh_index", "carbonation_depth", "estimated_fc", "rating", "location_tag")
+        )
+        decoders = {"columnar": json.loads}
+        if msgpack is not None:
+            decoders["msgpack"] = msgpack.unpackb
+        for fmt, decode in decoders.items():
+            columns = decode(self.client.get(f"{self.url}&format={fmt}").content)
+            self.assertEqual(len(columns["id"]), len(readings))
+            for key in readings[0]:
+                self.assertEqual(columns[key], [reading[key] for reading in readings], (fmt, key))
+            self.assertEqual(columns["project_name"], ["Formats"] * len(readings))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class CompressionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="z@example.com", email="z@example.com", password="secret123")
+        cls.project, cls.report = seed_project(cls.user, "Compressed", readings=200)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"/api/readings/?project={self.project.id}"
+
+    def test_gzip_json(self):
+        plain = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(len(response.content) * 5, len(plain.content))
+
+    def test_brotli_preferred(self):
+        if brotli is None:
+            self.skipTest("brotli is not installed")
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.client.get(self.url).content)
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip;q=1, br;q=0.5")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_gzip_is_padded_against_breach(self):
+        plain = self.client.get(self.url).content
+        bodies = [self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip").content for _ in range(8)]
+        self.assertGreater(len({len(body) for body in bodies}), 1)
+        for body in bodies:
+            self.assertEqual(gzip.decompress(body), plain)
+
+    def test_credentialed_requests_get_gzip(self):
+        if brotli is None:
+            self.skipTest("brotli is not installed")
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens_for_user(self.user)}")
+        response = client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        with self.settings(COMPRESSION_BROTLI_WITH_CREDENTIALS=True):
+            self.assertEqual(client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")["Content-Encoding"], "br")
+
+    def test_small_bodies_are_not_compressed(self):
+        response = self.client.get("/api/auth/me/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_streamed_csv_export(self):
+        data = {"report_id": self.report.id, "format": "csv"}
+        plain = b"".join(self.client.post("/api/readings/reports/export/", data, format="json").streaming_content)
+        response = self.client.post("/api/readings/reports/export/", data, format="json", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), plain)
+
+    def test_pdf_is_left_alone(self):
+        response = self.client.post(
+            "/api/readings/reports/export/", {"report_id": self.report.id}, format="json", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+        b"".join(response.streaming_content)
@@ -0,0 +1,238 @@
+# backend/core/throttling.py
+"""
+Token-bucket throttling for the unauthenticated endpoints that hash
+passwords or write rows (login, verification codes, password reset).
+
+Each scope in settings.THROTTLE_RATES limits the client IP and, optionally,
+one identity field of the request body (an email or uid), e.g.
+``{"login": {"ip": "30/min", "email": "10/min"}}``. A rate "N/period" is a
+bucket of N tokens refilled at N per period, so bursts up to N are allowed.
+The check runs in APIView.initial(), before the handler touches the ORM or a
+password hasher; a denied request gets 429 with Retry-After. A request takes
+a token from each of its buckets only when every one of them has one, so a
+request refused by the email bucket doesn't also drain the IP bucket.
+
+Buckets live in THROTTLE_BACKEND:
+
+* "local": a per-process LRU dict.
+* "mmap": a fixed-size hash table in THROTTLE_MMAP_PATH, shared by every
+  worker on the host and locked with flock (POSIX only). Keys are stored as
+  64-bit hashes; when a key's probe run is full, the least recently used
+  bucket in it is reused.
+* "off": no throttling.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+from . import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: the mmap table is only safe within one process
+    fcntl = None
+
+PERIODS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hour": 3600, "d": 86400, "day": 86400}
+
+
+def parse_rate(rate: str) -> tuple:
+    """"10/min" -> (capacity 10, refill 10/60 tokens per second)."""
+    count, _, period = rate.partition("/")
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period.strip().lower()]
+
+
+def refill(tokens: float, stamp: float, now: float, capacity: int, rate: float) -> float:
+    return min(capacity, tokens + max(0.0, now - stamp) * rate)
+
+
+def waits(current: list, buckets: list) -> list:
+    """Seconds until each bucket has a token; ``current`` holds (tokens, stamp) or None."""
+    result = []
+    for bucket, (_, capacity, rate) in zip(current, buckets):
+        tokens = capacity if bucket is None else bucket[0]
+        result.append(0.0 if tokens >= 1 else (1 - tokens) / rate)
+    return result
+
+
+class LocalBucketStore:
+    def __init__(self, max_entries=100_000):
+        self.max_entries = max_entries
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, buckets: list, now: float) -> list:
+        """
+        Take one token from each (key, capacity, rate) bucket if all have one.
+        Returns each bucket's wait in seconds; all zeros means allowed.
+        """
+        with self._lock:
+            current = []
+            for key, capacity, rate in buckets:
+                bucket = self._buckets.get(key)
+                current.append(None if bucket is None else (refill(*bucket, now, capacity, rate), now))
+            result = waits(current, buckets)
+            if any(result):
+                return result
+            for (key, capacity, _), bucket in zip(buckets, current):
+                self._buckets[key] = ((capacity if bucket is None else bucket[0]) - 1, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class MmapBucketStore:
+    SLOT = struct.Struct("<Qdd")  # key hash (0 = empty), tokens, last update
+    PROBES = 8
+
+    def __init__(self, path, slots: int):
+        self.pid = os.getpid()
+        self.slots = slots
+        size = slots * self.SLOT.size
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            if os.fstat(self._fd).st_size != size:
+                # New file or a different THROTTLE_MMAP_SLOTS: start empty.
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _hash(self, key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+    def _find(self, key_hash: int) -> tuple:
+        """(offset, (tokens, stamp) or None) of the key's slot, or the slot to reuse for it."""
+        start = key_hash % self.slots
+        oldest, oldest_stamp = None, None
+        for probe in range(self.PROBES):
+            offset = ((start + probe) % self.slots) * self.SLOT.size
+            slot_hash, tokens, stamp = self.SLOT.unpack_from(self._map, offset)
+            if slot_hash == key_hash:
+                return offset, (tokens, stamp)
+            if slot_hash == 0:
+                return offset, None
+            if oldest is None or stamp < oldest_stamp:
+                oldest, oldest_stamp = offset, stamp
+        return oldest, None
+
+    def take(self, buckets: list, now: float) -> list:
+        """See LocalBucketStore.take."""
+        hashes = [self._hash(key) for key, _, _ in buckets]
+        with self._locked():
+            current = []
+            for key_hash, (_, capacity, rate) in zip(hashes, buckets):
+                _, bucket = self._find(key_hash)
+                current.append(None if bucket is None else (refill(*bucket, now, capacity, rate), now))
+            result = waits(current, buckets)
+            if any(result):
+                return result
+            for key_hash, bucket, (_, capacity, _) in zip(hashes, current, buckets):
+                # Looked up again: an earlier key of this request may have taken the slot.
+                offset, _ = self._find(key_hash)
+                tokens = capacity if bucket is None else bucket[0]
+                self.SLOT.pack_into(self._map, offset, key_hash, tokens - 1, now)
+            return result
+
+    def clear(self):
+        with self._locked():
+            self._map[:] = bytes(len(self._map))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The configured bucket store, or None when THROTTLE_BACKEND is off."""
+    global _store
+    store = _store
+    if store is None or getattr(store, "pid", os.getpid()) != os.getpid():
+        kind = getattr(settings, "THROTTLE_BACKEND", "local")
+        if kind not in ("local", "mmap"):
+            return None
+        # First use, or first use after a fork: flock needs a descriptor per process.
+        with _store_lock:
+            if _store is None or getattr(_store, "pid", os.getpid()) != os.getpid():
+                if kind == "mmap":
+                    _store = MmapBucketStore(settings.THROTTLE_MMAP_PATH, getattr(settings, "THROTTLE_MMAP_SLOTS", 65536))
+                else:
+                    _store = LocalBucketStore()
+            store = _store
+    return store
+
+
+def _rates(scope) -> dict:
+    return {key: parse_rate(rate) for key, rate in getattr(settings, "THROTTLE_RATES", {}).get(scope, {}).items()}
+
+
+class BucketThrottle(BaseThrottle):
+    """
+    Set ``scope`` and, to also limit per account, ``identity_field``: the
+    request body field whose (lower-cased) value is rate limited alongside
+    the IP under the key "email" or "uid" in THROTTLE_RATES.
+    """
+
+    scope = None
+    identity_field = None
+
+    def __init__(self):
+        self._wait = None
+
+    def identities(self, request) -> dict:
+        identities = {"ip": self.get_ident(request)}
+        # A body that isn't an object (a JSON array, ...) is left to the serializer's 400.
+        if self.identity_field and isinstance(request.data, dict):
+            value = request.data.get(self.identity_field)
+            if isinstance(value, str) and value.strip():
+                identities[self.identity_field] = value.strip().lower()
+        return identities
+
+    def allow_request(self, request, view):
+        store = get_store()
+        if store is None:
+            return True
+        rates = _rates(self.scope)
+        keys, buckets = [], []
+        for key, ident in self.identities(request).items():
+            if key in rates:
+                keys.append(key)
+                buckets.append((f"{self.scope}:{key}:{ident}", *rates[key]))
+        if not buckets:
+            return True
+        result = store.take(buckets, time.time())
+        if not any(result):
+            return True
+        for key, wait in zip(keys, result):
+            if wait:
+                metrics.THROTTLED.inc(scope=self.scope, key=key)
+        self._wait = max(result)
+        return False
+
+    def wait(self):
+        return self._wait
@@ -20,12 +20,17 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from core.metrics import metrics_view
+from core.slow_queries import SlowQueryListView
+
 def api_root(request):
     return JsonResponse({"message": "SONREB API is running"})
 
 urlpatterns = [
     path("", api_root, name="api-root"),  
     path("admin/", admin.site.urls),
+    path("metrics", metrics_view, name="metrics"),
+    path("api/admin/slow-queries/", SlowQueryListView.as_view(), name="slow-queries"),
     path("api/auth/", include("apps.accounts.urls")),
     path("api/projects/", include("apps.projects.urls")),
     path("api/readings/", include("apps.readings.urls")),
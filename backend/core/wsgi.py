@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_wsgi_application()
+
+# Periodic purge of used/expired verification codes and revoked tokens.
+from apps.accounts.maintenance import start_scheduler  # noqa: E402
+
+start_scheduler()
@@ -48,7 +48,7 @@ export default function VerifyEmailScreen() {
     try {
       const resp = await confirmVerification(uid, code);
       if (resp.token && resp.user) {
-        await setUserAndToken(resp.user, resp.token);
+        await setUserAndToken(resp.user, resp.token, resp.refresh);
       }
       Alert.alert("Verified", "Email verified. You can now use the app.", [
         { text: "Continue", onPress: () => router.replace("/(main)") },
@@ -1,15 +1,13 @@
 import React, { useState } from "react";
 import { View, Text, Switch, ScrollView, Alert } from "react-native";
 import Screen from "../../../components/layout/Screen";
-import { useRouter } from "expo-router";
-import { useAuthStore } from "../../../store/authStore";
+import { useAuth } from "../../../hooks/useAuth";
 import { APP_VERSION } from "../../../constants";
 import Button from "../../../components/ui/Button";
 import { useThemeStore, getThemeColors } from "../../../store/themeStore";
 
 export default function SettingsScreen() {
-  const router = useRouter();
-  const { clearAuth } = useAuthStore();
+  const { logout } = useAuth();
   const { mode } = useThemeStore();
   const theme = getThemeColors(mode);
   const [useMpa, setUseMpa] = useState(true);
@@ -24,8 +22,7 @@ export default function SettingsScreen() {
         text: "Yes",
         style: "default",
         onPress: async () => {
-          await clearAuth();
-          router.replace("/(auth)/welcome");
+          await logout();
         },
       },
       { text: "No", style: "cancel" },
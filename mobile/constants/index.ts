@@ -67,6 +67,7 @@ export const RATING_THRESHOLDS = {
 // -----------------------------
 export const STORAGE_KEYS = {
   AUTH_TOKEN: "sonreb_auth_token",
+  REFRESH_TOKEN: "sonreb_refresh_token",
   CURRENT_USER: "sonreb_current_user",
   SETTINGS: "sonreb_settings",
   THEME_MODE: "sonreb_theme_mode",
@@ -33,7 +33,7 @@ export function useAuth() {
           return;
         }
 
-        await setUserAndToken((res as any).user, (res as any).token);
+        await setUserAndToken(res.user, res.token, res.refresh);
 
         router.replace("/(main)");
       } catch (err: any) {
@@ -83,6 +83,14 @@ export function useAuth() {
   );
 
   const logout = useCallback(async () => {
+    const refresh = useAuthStore.getState().refresh;
+    if (refresh) {
+      try {
+        await authService.logout(refresh);
+      } catch {
+        // Already revoked or expired; signing out locally is enough.
+      }
+    }
     await clearAuth();
     router.replace("/(auth)/welcome");
   }, [clearAuth]);
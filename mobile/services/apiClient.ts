@@ -10,13 +10,52 @@ interface RequestOptions {
     params?: Record<string, string | number | boolean>; // Used for GET/query params
     auth?: boolean; // Whether to send Authorization header
     token?: string; // Optional token override
+    retried?: boolean; // Set on the retry after a token refresh
+}
+
+export type TokenPair = {
+    token: string; // access token
+    refresh: string;
+};
+
+let pendingRefresh: Promise<string | null> | null = null;
+
+/**
+ * Trade the stored refresh token for a new access/refresh pair and store it.
+ * Concurrent callers share one request: the server revokes a refresh token
+ * on first use, so a second rotation with the same token would fail.
+ * Resolves to the new access token, or null if there is no session to renew.
+ */
+export function refreshSession(): Promise<string | null> {
+    if (!pendingRefresh) {
+        pendingRefresh = (async () => {
+            const refresh = useAuthStore.getState().refresh;
+            if (!refresh) {
+                return null;
+            }
+            try {
+                const pair = await apiRequest<TokenPair>("/auth/refresh/", {
+                    method: "POST",
+                    body: { refresh },
+                    auth: false,
+                });
+                await useAuthStore.getState().setTokens(pair.token, pair.refresh);
+                return pair.token;
+            } catch (e) {
+                return null;
+            }
+        })().finally(() => {
+            pendingRefresh = null;
+        });
+    }
+    return pendingRefresh;
 }
 
 /**
  * Core function to handle all API requests.
  */
 export async function apiRequest<T>(path: string, options: RequestOptions = {}): Promise<T> {
-    const { method = "GET", body, params, auth = true, token: tokenOverride } = options;
+    const { method = "GET", body, params, auth = true, token: tokenOverride, retried = false } = options;
     const token = tokenOverride ?? useAuthStore.getState().token;
     
     // 1. Build the URL
@@ -68,6 +107,14 @@ export async function apiRequest<T>(path: string, options: RequestOptions = {}):
         }
     }
 
+    // Access tokens are short-lived: renew the session once and retry.
+    if (response.status === 401 && auth && token && !retried) {
+        const fresh = await refreshSession();
+        if (fresh) {
+            return apiRequest<T>(path, { ...options, token: fresh, retried: true });
+        }
+    }
+
     if (!response.ok) {
         // Construct a helpful error message and include response data/status for callers
         const detail =
@@ -21,6 +21,11 @@ export async function login(
   return data;
 }
 
+export async function logout(refresh: string): Promise<void> {
+  // Revokes the refresh token so the session can't be renewed.
+  return apiClient.post<void>("/auth/logout/", { refresh }, false);
+}
+
 export async function register(
   name: string,
   email: string,
@@ -78,6 +83,7 @@ export type VerifyResponse = {
   code?: string;
   user?: any;
   token?: string;
+  refresh?: string;
 };
 
 export async function sendVerification(email: string): Promise<VerifyResponse> {
@@ -1,5 +1,8 @@
 // mobile/services/projectService.ts
 import { apiRequest } from "./apiClient";
+import type { CalibrationModel } from "./calibrationService";
+import type { Reading } from "./readingService";
+import type { Report } from "./reportService";
 
 export type ProjectStatus = "calibrated" | "no_model";
 
@@ -58,6 +61,27 @@ export type HistogramResponse = {
   avg_fc: number | null;
 };
 
+export type BundlePart =
+  | "project"
+  | "members"
+  | "summary"
+  | "ratings"
+  | "histogram"
+  | "calibration_model"
+  | "readings"
+  | "reports";
+
+export type ProjectBundle = {
+  project?: Project;
+  members?: Member[];
+  summary?: ProjectSummary;
+  ratings?: RatingsDistribution;
+  histogram?: HistogramResponse;
+  calibration_model?: CalibrationModel | null;
+  readings?: Reading[];
+  reports?: (Report & { photo_count: number })[];
+};
+
 export type CreateProjectPayload = {
   name: string;
   location: string;
@@ -225,3 +249,21 @@ export async function getProjectHistogram(
     }
   );
 }
+
+export async function getProjectBundle(
+  projectId: string,
+  include?: BundlePart[],
+  binSize: number = 2,
+  token?: string | null
+): Promise<ProjectBundle> {
+  // GET /api/projects/{id}/bundle/?include=&bin_size=
+  const params: Record<string, string | number> = { bin_size: binSize };
+  if (include && include.length) {
+    params.include = include.join(",");
+  }
+  return apiRequest<ProjectBundle>(`/projects/${projectId}/bundle/`, {
+    method: "GET",
+    token: token || undefined,
+    params,
+  });
+}
@@ -7,11 +7,13 @@ import { User } from "../types/auth";
 interface AuthState {
   user: User | null;
   token: string | null;
+  refresh: string | null;
   loading: boolean;
   error: string | null;
   initialized: boolean;
 
-  setUserAndToken: (user: User, token: string) => Promise<void>;
+  setUserAndToken: (user: User, token: string, refresh?: string) => Promise<void>;
+  setTokens: (token: string, refresh: string) => Promise<void>;
   clearAuth: () => Promise<void>;
   setLoading: (value: boolean) => void;
   setError: (value: string | null) => void;
@@ -22,6 +24,7 @@ interface AuthState {
 export const useAuthStore = create<AuthState>((set) => ({
   user: null,
   token: null,
+  refresh: null,
   loading: false,
   error: null,
   initialized: false,
@@ -29,31 +32,46 @@ export const useAuthStore = create<AuthState>((set) => ({
   setLoading: (loading) => set({ loading }),
   setError: (error) => set({ error }),
 
-  async setUserAndToken(user, token) {
+  async setUserAndToken(user, token, refresh) {
     await AsyncStorage.setItem(STORAGE_KEYS.AUTH_TOKEN, token);
     await AsyncStorage.setItem(
       STORAGE_KEYS.CURRENT_USER,
       JSON.stringify(user),
     );
+    if (refresh) {
+      await AsyncStorage.setItem(STORAGE_KEYS.REFRESH_TOKEN, refresh);
+    } else {
+      await AsyncStorage.removeItem(STORAGE_KEYS.REFRESH_TOKEN);
+    }
+
+    set({ user, token, refresh: refresh ?? null, initialized: true });
+  },
+
+  async setTokens(token, refresh) {
+    // Refresh tokens are single-use: always keep the one from the latest rotation.
+    await AsyncStorage.setItem(STORAGE_KEYS.AUTH_TOKEN, token);
+    await AsyncStorage.setItem(STORAGE_KEYS.REFRESH_TOKEN, refresh);
 
-    set({ user, token, initialized: true });
+    set({ token, refresh });
   },
 
   async clearAuth() {
     await AsyncStorage.removeItem(STORAGE_KEYS.AUTH_TOKEN);
+    await AsyncStorage.removeItem(STORAGE_KEYS.REFRESH_TOKEN);
     await AsyncStorage.removeItem(STORAGE_KEYS.CURRENT_USER);
 
-    set({ user: null, token: null, initialized: true });
+    set({ user: null, token: null, refresh: null, initialized: true });
   },
 
   async loadFromStorage() {
     try {
       const token = await AsyncStorage.getItem(STORAGE_KEYS.AUTH_TOKEN);
+      const refresh = await AsyncStorage.getItem(STORAGE_KEYS.REFRESH_TOKEN);
       const userJson = await AsyncStorage.getItem(STORAGE_KEYS.CURRENT_USER);
 
       if (token && userJson) {
         const user = JSON.parse(userJson) as User;
-        set({ user, token, initialized: true });
+        set({ user, token, refresh, initialized: true });
         return;
       }
 